@@ -1,68 +1,805 @@
+import argparse
+import ctypes
+import ctypes.util
+import json
 import os
+import re
+import select
+import struct
+import sys
+import threading
+import time
+from array import array
 
+RUTA_BASE = os.path.dirname(os.path.abspath(__file__))
+# Dentro de __pycache__ (ignorada por git y por el recorrido), así escribir el caché
+# no cambia el mtime de la carpeta raíz
+RUTA_CACHE = os.path.join(RUTA_BASE, '__pycache__', 'dashboard_cache.json')
+RUTA_TOKENS = os.path.join(RUTA_BASE, '__pycache__', 'dashboard_tokens.json')
+TAMAÑO_PAGINA = 40  # Líneas de código por página
+OPCIONES_POR_PAGINA = 30  # Opciones del menú por página
+_BLOQUE_LECTURA = 64 * 1024
+MAXIMO_RESULTADOS = 50  # Coincidencias que se muestran por búsqueda
 
-def mostrar_codigo(ruta_script):
-    """Muestra el contenido de un archivo con manejo de errores mejorado."""
+
+def _es_directorio_visible(nombre):
+    return not nombre.startswith(('.', '__'))
+
+
+class CacheDirectorios:
+    """
+    Contenido de cada carpeta (scripts .py y subcarpetas) guardado en disco junto
+    con la fecha de modificación (mtime) de la carpeta. Crear, borrar o renombrar
+    un archivo cambia el mtime de su carpeta, así que al arrancar basta un stat por
+    carpeta: solo se vuelven a listar las que cambiaron.
+    """
+
+    VERSION = 1
+    # Una carpeta modificada hace menos de esto puede volver a cambiar sin que su
+    # mtime avance (resolución del sistema de archivos); no se confía en ella.
+    MARGEN_MTIME_NS = 2_000_000_000
+
+    def __init__(self, ruta=None):
+        self.ruta = ruta
+        self._directorios = {}
+        self._visitados = set()
+        self.releidos = 0  # Carpetas listadas en este arranque (no venían del caché)
+        self._modificado = False
+        if ruta is not None:
+            self._cargar()
+
+    def _cargar(self):
+        try:
+            with open(self.ruta, encoding='utf-8') as archivo:
+                datos = json.load(archivo)
+        except (OSError, ValueError):
+            return
+        if datos.get("version") == self.VERSION:
+            self._directorios = datos.get("directorios", {})
+
+    def listar(self, ruta_base, relativo):
+        """
+        Scripts y subcarpetas visibles de una carpeta, ya ordenados.
+
+        :return: tupla (nombres de .py, nombres de subcarpetas)
+        :raises FileNotFoundError: si la carpeta ya no existe
+        """
+        self._visitados.add(relativo)
+        directorio = os.path.join(ruta_base, relativo)
+        mtime = os.stat(directorio).st_mtime_ns
+        guardado = self._directorios.get(relativo)
+        if guardado is not None and guardado["mtime"] == mtime:
+            return guardado["archivos"], guardado["subdirectorios"]
+
+        archivos, subdirectorios = [], []
+        with os.scandir(directorio) as entradas:
+            for entrada in entradas:
+                if entrada.name.endswith('.py') and entrada.is_file():
+                    archivos.append(entrada.name)
+                elif _es_directorio_visible(entrada.name) and entrada.is_dir():
+                    subdirectorios.append(entrada.name)
+        archivos.sort(key=str.casefold)
+        subdirectorios.sort()
+        if time.time_ns() - mtime < self.MARGEN_MTIME_NS:
+            mtime = None
+        self._directorios[relativo] = {"mtime": mtime, "archivos": archivos, "subdirectorios": subdirectorios}
+        self.releidos += 1
+        self._modificado = True
+        return archivos, subdirectorios
+
+    def iniciar_recorrido(self):
+        self._visitados = set()
+
+    def directorios(self):
+        """Carpetas (relativas) visitadas en el último recorrido"""
+        return sorted(self._visitados)
+
+    def guardar(self):
+        """Escribe el caché si cambió, sin las carpetas que ya no se visitaron"""
+        olvidados = self._directorios.keys() - self._visitados
+        if self.ruta is None or not (self._modificado or olvidados):
+            return
+        for relativo in olvidados:
+            del self._directorios[relativo]
+        temporal = f"{self.ruta}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+            with open(temporal, 'w', encoding='utf-8') as archivo:
+                # dumps usa el codificador en C; dump() escribiría por partes desde Python
+                archivo.write(json.dumps({"version": self.VERSION, "directorios": self._directorios}))
+            os.replace(temporal, self.ruta)
+        except OSError:
+            pass  # Sin caché en disco el dashboard funciona igual, solo arranca más lento
+        self._modificado = False
+
+
+def descubrir_modulos(ruta_base=RUTA_BASE, cache=None):
+    """
+    Busca los scripts de las carpetas 'PARCIAL */SEMANA *' (y sus subcarpetas).
+    Solo lista directorios: no abre ni consulta la fecha de ningún archivo.
+
+    :param cache: CacheDirectorios opcional; las carpetas sin cambios no se vuelven a listar
+    :return: lista de rutas relativas a ruta_base, ordenada por carpeta y nombre
+    """
+    cache = cache if cache is not None else CacheDirectorios()
+    cache.iniciar_recorrido()
+    modulos = []
+    _archivos, parciales = cache.listar(ruta_base, '')
+    pendientes = []
+    for parcial in reversed(parciales):
+        if parcial.startswith('PARCIAL '):
+            _archivos, semanas = cache.listar(ruta_base, parcial)
+            pendientes.extend(os.path.join(parcial, semana) for semana in reversed(semanas)
+                              if semana.startswith('SEMANA '))
+
+    # Recorrido en profundidad: los listados ya vienen ordenados, así que no hace falta ordenar al final
+    while pendientes:
+        relativo = pendientes.pop()
+        try:
+            archivos, subdirectorios = cache.listar(ruta_base, relativo)
+        except FileNotFoundError:
+            continue  # Borrada mientras se recorría el árbol
+        prefijo = relativo + os.sep
+        modulos.extend(prefijo + nombre for nombre in archivos)
+        pendientes.extend(prefijo + nombre for nombre in reversed(subdirectorios))
+    cache.guardar()
+    return modulos
+
+
+class MenuModulos:
+    """Lista de scripts del menú; se puede reconstruir desde el hilo del vigilante"""
+
+    def __init__(self, ruta_base=RUTA_BASE, ruta_cache=RUTA_CACHE):
+        self.ruta_base = ruta_base
+        self._cache = CacheDirectorios(ruta_cache)
+        self._bloqueo = threading.Lock()
+        self.modulos = []
+        self.actualizar()
+
+    def actualizar(self):
+        """
+        Vuelve a recorrer el árbol (solo se listan las carpetas que cambiaron).
+
+        :return: True si la lista de scripts cambió
+        """
+        with self._bloqueo:
+            modulos = descubrir_modulos(self.ruta_base, self._cache)
+            cambio = modulos != self.modulos
+            self.modulos = modulos  # Se reemplaza la lista entera: quien tenga la anterior no la ve cambiar
+        return cambio
+
+    @property
+    def releidos(self):
+        return self._cache.releidos
+
+    def rutas_vigiladas(self):
+        """Carpetas y scripts (relativos) que el vigilante debe observar"""
+        with self._bloqueo:
+            return self._cache.directorios(), self.modulos
+
+
+# ----- Vigilancia de cambios -----
+
+# Constantes de inotify (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ONLYDIR = 0x1000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_MASCARA_INOTIFY = (_IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+                    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+_EVENTO_INOTIFY = struct.Struct('iIII')  # wd, mask, cookie, len (seguido del nombre)
+
+# Marca dentro de un conjunto de cambios: se perdieron eventos, hay que revisar todo
+CAMBIO_DESCONOCIDO = None
+
+
+def _es_relevante(nombre, es_carpeta):
+    return _es_directorio_visible(nombre) if es_carpeta else nombre.endswith('.py')
+
+
+def _cargar_libc_inotify():
+    """libc con inotify, o None si el sistema no lo tiene"""
+    if not sys.platform.startswith('linux'):
+        return None
     try:
-        ruta_absoluta = os.path.abspath(ruta_script)
-        print(f"\nBuscando archivo en: {ruta_absoluta}")  # Mensaje de diagnóstico
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+    return libc
+
+
+class _FuenteInotify:
+    """Cambios avisados por el núcleo (Linux): no recorre nada mientras no pase nada"""
+
+    modo = "inotify"
+
+    def __init__(self, libc, ruta_base):
+        self._libc = libc
+        self.ruta_base = ruta_base
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falló")
+        self._carpetas = {}  # descriptor de vigilancia -> carpeta relativa
+        self._descriptores = {}  # carpeta relativa -> descriptor
+
+    def sincronizar(self, directorios, archivos):
+        """Vigila las carpetas nuevas y deja de vigilar las que ya no están"""
+        directorios = set(directorios)
+        for relativo in self._descriptores.keys() - directorios:
+            descriptor = self._descriptores.pop(relativo)
+            del self._carpetas[descriptor]
+            self._libc.inotify_rm_watch(self._fd, descriptor)
+        for relativo in directorios - self._descriptores.keys():
+            ruta = os.fsencode(os.path.join(self.ruta_base, relativo))
+            descriptor = self._libc.inotify_add_watch(self._fd, ruta, _MASCARA_INOTIFY)
+            if descriptor >= 0:
+                self._descriptores[relativo] = descriptor
+                self._carpetas[descriptor] = relativo
+
+    def esperar(self, tiempo):
+        """
+        Conjunto de rutas relativas que cambiaron; espera hasta 'tiempo' segundos
+        al primer cambio (los eventos de archivos que no son scripts no cuentan).
+        """
+        limite = time.monotonic() + tiempo
+        cambios = set()
+        while not cambios:
+            restante = limite - time.monotonic()
+            if restante <= 0 or not select.select([self._fd], [], [], restante)[0]:
+                break
+            self._leer_eventos(cambios)
+        return cambios
+
+    def _leer_eventos(self, cambios):
+        try:
+            datos = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        posicion = 0
+        while posicion < len(datos):
+            descriptor, mascara, _cookie, largo = _EVENTO_INOTIFY.unpack_from(datos, posicion)
+            posicion += _EVENTO_INOTIFY.size
+            nombre = os.fsdecode(datos[posicion:posicion + largo].rstrip(b'\0'))
+            posicion += largo
+            if mascara & _IN_Q_OVERFLOW:
+                cambios.add(CAMBIO_DESCONOCIDO)
+            elif mascara & _IN_IGNORED:
+                relativo = self._carpetas.pop(descriptor, None)
+                if self._descriptores.get(relativo) == descriptor:
+                    del self._descriptores[relativo]
+            elif descriptor in self._carpetas:
+                carpeta = self._carpetas[descriptor]
+                if mascara & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                    cambios.add(carpeta)
+                elif _es_relevante(nombre, mascara & _IN_ISDIR):
+                    cambios.add(os.path.join(carpeta, nombre) if carpeta else nombre)
+
+    def cerrar(self):
+        os.close(self._fd)
+
+
+class _FuenteSondeo:
+    """Cambios detectados consultando periódicamente el mtime de carpetas y scripts"""
+
+    modo = "sondeo"
+
+    def __init__(self, ruta_base, detener):
+        self.ruta_base = ruta_base
+        self._detener = detener
+        self._mtimes = {}  # ruta relativa -> mtime (None si no existe)
+
+    def _mtime(self, relativo):
+        try:
+            return os.stat(os.path.join(self.ruta_base, relativo)).st_mtime_ns
+        except OSError:
+            return None
+
+    def sincronizar(self, directorios, archivos):
+        vigiladas = set(directorios)
+        vigiladas.update(archivos)
+        self._mtimes = {relativo: self._mtimes[relativo] if relativo in self._mtimes else self._mtime(relativo)
+                        for relativo in vigiladas}
+
+    def esperar(self, tiempo):
+        if self._detener.wait(tiempo):
+            return set()
+        cambios = set()
+        for relativo, anterior in self._mtimes.items():
+            actual = self._mtime(relativo)
+            if actual != anterior:
+                self._mtimes[relativo] = actual
+                cambios.add(relativo)
+        return cambios
+
+    def cerrar(self):
+        pass
 
-        if not os.path.exists(ruta_absoluta):
-            raise FileNotFoundError(f"El archivo no existe en:\n{ruta_absoluta}")
 
-        with open(ruta_absoluta, 'r', encoding='utf-8') as archivo:
-            print(f"\n--- Código de {os.path.basename(ruta_script)} ---\n")
-            print(archivo.read())
+class VigilanteArchivos(threading.Thread):
+    """
+    Hilo que observa las carpetas del menú y avisa de los cambios en lotes.
 
-    except FileNotFoundError as e:
-        print(f"\nERROR: {e}")
+    Usa inotify si el sistema lo tiene y, si no, consulta los mtime cada
+    'intervalo' segundos. Los cambios se acumulan hasta que pasan 'espera'
+    segundos sin novedades (o 'espera_maxima' desde el primero), así un
+    'git checkout' que toca cientos de archivos produce una sola llamada
+    a al_cambiar(cambios), con el conjunto de rutas relativas que cambiaron.
+    """
+
+    def __init__(self, ruta_base, rutas_vigiladas, al_cambiar, espera=0.3, espera_maxima=5.0,
+                 intervalo=1.0, usar_inotify=True):
+        """
+        :param rutas_vigiladas: función sin argumentos que devuelve (carpetas, scripts) relativos
+        :param al_cambiar: función que recibe el conjunto de cambios; se llama desde este hilo
+        """
+        super().__init__(name="VigilanteArchivos", daemon=True)
+        self.rutas_vigiladas = rutas_vigiladas
+        self.al_cambiar = al_cambiar
+        self.espera = espera
+        self.espera_maxima = espera_maxima
+        self.intervalo = intervalo
+        self.lotes = 0  # Cantidad de veces que se llamó a al_cambiar
+        self._detener = threading.Event()
+        libc = _cargar_libc_inotify() if usar_inotify else None
+        try:
+            self._fuente = _FuenteInotify(libc, ruta_base) if libc is not None else None
+        except OSError:
+            self._fuente = None
+        if self._fuente is None:
+            self._fuente = _FuenteSondeo(ruta_base, self._detener)
+        self._fuente.sincronizar(*self.rutas_vigiladas())
+
+    @property
+    def modo(self):
+        return self._fuente.modo
+
+    def run(self):
+        try:
+            while not self._detener.is_set():
+                cambios = self._fuente.esperar(self.intervalo)
+                if not cambios:
+                    continue
+                limite = time.monotonic() + self.espera_maxima
+                while time.monotonic() < limite and not self._detener.is_set():
+                    nuevos = self._fuente.esperar(self.espera)
+                    if not nuevos:
+                        break
+                    cambios |= nuevos
+                if self._detener.is_set():
+                    break
+                self.lotes += 1
+                self.al_cambiar(cambios)
+                self._fuente.sincronizar(*self.rutas_vigiladas())
+        finally:
+            self._fuente.cerrar()
+
+    def detener(self):
+        self._detener.set()
+        self.join()
+
+
+class _LineasArchivo:
+    """Posiciones de inicio de línea de un archivo, calculadas solo hasta donde se necesitan"""
+
+    def __init__(self, mtime, tamaño):
+        self.mtime = mtime
+        self.tamaño = tamaño
+        self.inicios = array('q', [0])
+        self.leido = 0  # Bytes ya recorridos buscando saltos de línea
+
+    @property
+    def completo(self):
+        return self.leido >= self.tamaño
+
+    def avanzar(self, archivo, hasta_linea):
+        """Recorre el archivo en bloques hasta conocer el inicio de hasta_linea (o el final)"""
+        archivo.seek(self.leido)
+        while len(self.inicios) <= hasta_linea and not self.completo:
+            bloque = archivo.read(_BLOQUE_LECTURA)
+            if not bloque:
+                self.tamaño = self.leido
+                break
+            posicion = bloque.find(b'\n')
+            while posicion != -1:
+                self.inicios.append(self.leido + posicion + 1)
+                posicion = bloque.find(b'\n', posicion + 1)
+            self.leido += len(bloque)
+
+
+class IndiceArchivos:
+    """
+    Caché de índices de líneas por archivo, válido mientras no cambie su fecha
+    de modificación (mtime) ni su tamaño. Permite leer una página de cualquier
+    archivo sin cargarlo entero.
+    """
+
+    def __init__(self):
+        self._archivos = {}
+
+    def _lineas(self, ruta):
+        estado = os.stat(ruta)
+        lineas = self._archivos.get(ruta)
+        if lineas is None or lineas.mtime != estado.st_mtime_ns or lineas.tamaño != estado.st_size:
+            lineas = self._archivos[ruta] = _LineasArchivo(estado.st_mtime_ns, estado.st_size)
+        return lineas
+
+    def pagina(self, ruta, numero_pagina, tamaño_pagina=TAMAÑO_PAGINA):
+        """
+        Líneas de una página del archivo.
+
+        :return: tupla (lista de líneas, hay_mas)
+        :raises OSError: si el archivo no se puede leer
+        """
+        lineas = self._lineas(ruta)
+        desde = numero_pagina * tamaño_pagina
+        hasta = desde + tamaño_pagina
+        with open(ruta, 'rb') as archivo:
+            # Una línea más para saber si queda algo después de la página
+            lineas.avanzar(archivo, hasta + 1)
+            inicios = lineas.inicios
+            if desde >= len(inicios) or inicios[desde] >= lineas.tamaño:
+                return [], False
+            archivo.seek(inicios[desde])
+            fin = inicios[hasta] if hasta < len(inicios) else lineas.tamaño
+            texto = archivo.read(fin - inicios[desde]).decode('utf-8', errors='replace')
+        hay_mas = hasta < len(inicios) and inicios[hasta] < lineas.tamaño
+        return _dividir_lineas(texto), hay_mas
+
+
+def _dividir_lineas(texto):
+    """
+    Divide el texto solo en los saltos de línea que cuenta _LineasArchivo y
+    quita el retorno de carro final de cada línea. str.splitlines() también
+    corta en caracteres como el salto de página o U+2028, y eso desfasaría los
+    números de línea respecto del índice.
+    """
+    if not texto:
+        return []
+    lineas = texto.split('\n')
+    if texto.endswith('\n'):
+        lineas.pop()
+    return [linea[:-1] if linea.endswith('\r') else linea for linea in lineas]
+
+
+# ----- Búsqueda de identificadores -----
+
+_PATRON_TOKEN = re.compile(r'[^\W\d]\w*')  # Identificadores (incluye letras acentuadas)
+
+
+def _tokenizar(texto):
+    """Diccionario token -> array con los números de línea (desde 1) donde aparece"""
+    lineas_por_token = {}
+    for numero, linea in enumerate(_dividir_lineas(texto), 1):
+        for token in set(_PATRON_TOKEN.findall(linea)):
+            lineas = lineas_por_token.get(token)
+            if lineas is None:
+                lineas = lineas_por_token[token] = array('I')
+            lineas.append(numero)
+    return lineas_por_token
+
+
+class IndiceTokens:
+    """
+    Índice invertido de identificadores: para cada token, los scripts y las
+    líneas donde aparece. Cada script guarda su mtime y tamaño, así que solo se
+    vuelven a leer los que cambiaron; el índice se guarda en disco entre sesiones.
+    """
+
+    VERSION = 2  # 2: líneas contadas solo en los saltos de línea, como el paginador
+
+    def __init__(self, ruta_base=RUTA_BASE, ruta=None):
+        self.ruta_base = ruta_base
+        self.ruta = ruta
+        self._archivos = {}  # script -> (mtime, tamaño, {token: líneas})
+        self._apariciones = {}  # token -> {script: líneas}
+        self._variantes = {}  # token en minúsculas -> tokens con esa forma
+        self._pendientes = set()  # Rutas avisadas por el vigilante
+        self._bloqueo = threading.Lock()
+        self._modificado = False
+        self.releidos = 0
+        if ruta is not None:
+            self._cargar()
+
+    def _cargar(self):
+        try:
+            with open(self.ruta, encoding='utf-8') as archivo:
+                datos = json.load(archivo)
+        except (OSError, ValueError):
+            return
+        if datos.get("version") != self.VERSION:
+            return
+        for script, (mtime, tamaño, tokens) in datos.get("archivos", {}).items():
+            self._agregar(script, mtime, tamaño, {token: array('I', lineas) for token, lineas in tokens.items()})
+
+    def guardar(self):
+        if self.ruta is None or not self._modificado:
+            return
+        datos = {"version": self.VERSION,
+                 "archivos": {script: (mtime, tamaño, {token: lineas.tolist() for token, lineas in tokens.items()})
+                              for script, (mtime, tamaño, tokens) in self._archivos.items()}}
+        temporal = f"{self.ruta}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+            with open(temporal, 'w', encoding='utf-8') as archivo:
+                archivo.write(json.dumps(datos, ensure_ascii=False, separators=(',', ':')))
+            os.replace(temporal, self.ruta)
+        except OSError:
+            pass
+        self._modificado = False
+
+    def _agregar(self, script, mtime, tamaño, tokens):
+        self._archivos[script] = (mtime, tamaño, tokens)
+        for token, lineas in tokens.items():
+            por_script = self._apariciones.get(token)
+            if por_script is None:
+                por_script = self._apariciones[token] = {}
+                self._variantes.setdefault(token.casefold(), set()).add(token)
+            por_script[script] = lineas
+
+    def _quitar(self, script):
+        _mtime, _tamaño, tokens = self._archivos.pop(script)
+        for token in tokens:
+            por_script = self._apariciones[token]
+            del por_script[script]
+            if not por_script:
+                del self._apariciones[token]
+                variantes = self._variantes[token.casefold()]
+                variantes.discard(token)
+                if not variantes:
+                    del self._variantes[token.casefold()]
+
+    def _actualizar_script(self, script):
+        """Vuelve a indexar un script si cambió su mtime o su tamaño (o lo quita si ya no existe)"""
+        try:
+            estado = os.stat(os.path.join(self.ruta_base, script))
+        except OSError:
+            estado = None
+        guardado = self._archivos.get(script)
+        if estado is not None and guardado is not None and guardado[:2] == (estado.st_mtime_ns, estado.st_size):
+            return
+        if guardado is not None:
+            self._quitar(script)
+        self._modificado = True
+        if estado is None:
+            return
+        try:
+            # newline='' deja los retornos de carro sin traducir: las líneas se cuentan como en el paginador
+            with open(os.path.join(self.ruta_base, script), encoding='utf-8', errors='replace',
+                      newline='') as archivo:
+                texto = archivo.read()
+        except OSError:
+            return
+        self._agregar(script, estado.st_mtime_ns, estado.st_size, _tokenizar(texto))
+        self.releidos += 1
+
+    def sincronizar(self, modulos):
+        """Deja en el índice exactamente los scripts indicados, releyendo solo los que cambiaron"""
+        with self._bloqueo:
+            self._pendientes.clear()
+        for script in self._archivos.keys() - set(modulos):
+            self._quitar(script)
+            self._modificado = True
+        for script in modulos:
+            self._actualizar_script(script)
+        self.guardar()
+
+    def marcar_cambios(self, cambios):
+        """Anota rutas cambiadas (lo llama el vigilante desde su hilo); se procesan en la próxima búsqueda"""
+        with self._bloqueo:
+            self._pendientes.update(cambios)
+
+    def aplicar_cambios(self, modulos):
+        """
+        Procesa los cambios anotados por marcar_cambios(). Si alguno es una
+        carpeta o se perdieron eventos, se revisan todos los scripts.
+        """
+        with self._bloqueo:
+            pendientes, self._pendientes = self._pendientes, set()
+        if not pendientes:
+            return
+        if CAMBIO_DESCONOCIDO in pendientes or any(not ruta.endswith('.py') for ruta in pendientes):
+            self.sincronizar(modulos)
+            return
+        actuales = set(modulos)
+        for script in pendientes:
+            if script in actuales:
+                self._actualizar_script(script)
+            elif script in self._archivos:
+                self._quitar(script)
+                self._modificado = True
+        self.guardar()
+
+    def _formas(self, termino):
+        """Tokens que corresponden a un término: el mismo si existe, si no sus variantes de mayúsculas"""
+        if termino in self._apariciones:
+            return (termino,)
+        return tuple(self._variantes.get(termino.casefold(), ()))
+
+    def buscar(self, consulta):
+        """
+        Líneas que contienen todos los términos de la consulta.
+
+        :return: lista ordenada de tuplas (script, número de línea)
+        """
+        terminos = _PATRON_TOKEN.findall(consulta)
+        if not terminos:
+            return []
+        coincidencias = None
+        for termino in terminos:
+            lineas_del_termino = {}
+            for token in self._formas(termino):
+                for script, lineas in self._apariciones[token].items():
+                    lineas_del_termino.setdefault(script, set()).update(lineas)
+            if coincidencias is None:
+                coincidencias = lineas_del_termino
+            else:
+                coincidencias = {script: lineas & lineas_del_termino[script]
+                                 for script, lineas in coincidencias.items() if script in lineas_del_termino}
+            if not coincidencias:
+                return []
+        return sorted((script, linea) for script, lineas in coincidencias.items() for linea in lineas)
+
+    def __len__(self):
+        """Cantidad de scripts indexados"""
+        return len(self._archivos)
+
+
+def mostrar_busqueda(consulta, indice_tokens, indice_archivos, maximo=MAXIMO_RESULTADOS):
+    """Muestra las líneas (script:línea) donde aparecen los identificadores buscados."""
+    inicio = time.perf_counter()
+    resultados = indice_tokens.buscar(consulta)
+    duracion = (time.perf_counter() - inicio) * 1000
+    print(f"\n{len(resultados)} coincidencias de '{consulta}' en {duracion:.2f} ms")
+    for script, numero in resultados[:maximo]:
+        try:
+            lineas, _hay_mas = indice_archivos.pagina(os.path.join(indice_tokens.ruta_base, script), numero - 1, 1)
+        except OSError:
+            lineas = []
+        texto = lineas[0].strip() if lineas else ""
+        print(f"{script}:{numero}: {texto}")
+    if len(resultados) > maximo:
+        print(f"... y {len(resultados) - maximo} más")
+
+
+def mostrar_codigo(ruta_script, indice=None, tamaño_pagina=TAMAÑO_PAGINA):
+    """Muestra el contenido de un archivo página por página con manejo de errores mejorado."""
+    indice = indice if indice is not None else IndiceArchivos()
+    ruta_absoluta = os.path.abspath(ruta_script)
+    print(f"\n--- Código de {os.path.basename(ruta_script)} ---\n")
+    numero_pagina = 0
+    try:
+        while True:
+            lineas, hay_mas = indice.pagina(ruta_absoluta, numero_pagina, tamaño_pagina)
+            primera = numero_pagina * tamaño_pagina + 1
+            for numero, linea in enumerate(lineas, primera):
+                print(f"{numero:5} | {linea}")
+            if not hay_mas:
+                break
+            respuesta = input(f"\n-- Líneas {primera}-{primera + len(lineas) - 1}. "
+                              "Enter para seguir, 'q' para volver al menú: ").strip().lower()
+            if respuesta == 'q':
+                break
+            numero_pagina += 1
+
+    except FileNotFoundError:
+        print(f"\nERROR: El archivo ya no existe en:\n{ruta_absoluta}")
         print("Posibles soluciones:")
-        print("1. Verifica que el archivo exista en la ubicación mostrada")
-        print("2. Revisa mayúsculas/minúsculas en el nombre del archivo")
-        print("3. Comprueba que tengas permisos de lectura")
+        print("1. Verifica que el archivo no se haya movido o borrado")
+        print("2. Vuelve a abrir el dashboard para actualizar el menú")
+    except PermissionError:
+        print(f"\nERROR: No tienes permisos de lectura sobre:\n{ruta_absoluta}")
     except Exception as e:
         print(f"\nError inesperado: {e}")
 
 
-def mostrar_menu():
-    """Muestra el menú principal con diagnóstico de rutas."""
-    ruta_base = os.path.dirname(os.path.abspath(__file__))
-    print(f"\nDirectorio base del script: {ruta_base}")  # Diagnóstico
+def mostrar_menu(ruta_base=RUTA_BASE, ruta_cache=RUTA_CACHE, vigilar=False, usar_inotify=True,
+                 ruta_tokens=RUTA_TOKENS):
+    """
+    Muestra el menú principal con todos los scripts de los parciales.
+
+    :param vigilar: si es True, un hilo mantiene la lista al día mientras el menú está abierto
+    """
+    inicio = time.perf_counter()
+    menu = MenuModulos(ruta_base, ruta_cache)
+    print(f"\n{len(menu.modulos)} scripts encontrados en {(time.perf_counter() - inicio) * 1000:.1f} ms "
+          f"({menu.releidos} carpetas releídas)")  # Diagnóstico
+    indice = IndiceArchivos()
+    indice_tokens = None  # Se arma (o se carga del disco) en la primera búsqueda
+    pagina_menu = 0
 
-    opciones = {
-        '1': os.path.join('PARCIAL 01', 'SEMANA 05', 'TipodDedatos.py'),
-    }
+    vigilante = None
+    # El hilo del vigilante no imprime (el hilo principal puede estar esperando en input());
+    # solo marca el cambio y el aviso se muestra al redibujar el menú
+    lista_cambiada = threading.Event()
+    if vigilar:
+        def al_cambiar(cambios):
+            if menu.actualizar():
+                lista_cambiada.set()
+            if indice_tokens is not None:
+                indice_tokens.marcar_cambios(cambios)
 
-    # Verificar existencia de archivos
-    print("\nVerificación de archivos:")
-    for key, ruta in opciones.items():
-        ruta_completa = os.path.join(ruta_base, ruta)
-        existe = "✓ EXISTE" if os.path.exists(ruta_completa) else "✗ NO EXISTE"
-        print(f"Opción {key}: {ruta_completa} {existe}")
+        vigilante = VigilanteArchivos(ruta_base, menu.rutas_vigiladas, al_cambiar, usar_inotify=usar_inotify)
+        vigilante.start()
+        print(f"Vigilando cambios ({vigilante.modo})")
+
+    try:
+        while True:
+            # Se limpia antes de leer la lista: un cambio posterior se avisa en la próxima vuelta
+            hubo_cambios = lista_cambiada.is_set()
+            lista_cambiada.clear()
+            modulos = menu.modulos  # La lista que se muestra es la que se usa para elegir
+            if hubo_cambios:
+                print(f"\n* La lista de scripts cambió ({len(modulos)} scripts).")
+            total_paginas = max(1, -(-len(modulos) // OPCIONES_POR_PAGINA))
+            pagina_menu = min(pagina_menu, total_paginas - 1)
+            desde = pagina_menu * OPCIONES_POR_PAGINA
+            print("\n" + "=" * 60)
+            print("Menu Principal - Dashboard".center(60))
+            print("=" * 60)
+            carpeta_anterior = None
+            for numero, ruta in enumerate(modulos[desde:desde + OPCIONES_POR_PAGINA], desde + 1):
+                carpeta = os.path.dirname(ruta)
+                if carpeta != carpeta_anterior:
+                    print(f"[{carpeta}]")
+                    carpeta_anterior = carpeta
+                print(f"  {numero} - {os.path.basename(ruta)}")
+            if total_paginas > 1:
+                print(f"Página {pagina_menu + 1}/{total_paginas} ('s' siguiente, 'a' anterior)")
+            print("b <identificador> - Buscar en todos los scripts")
+            print("0 - Salir")
+            print("=" * 60)
 
-    while True:
-        print("\n" + "=" * 40)
-        print("Menu Principal - Dashboard".center(40))
-        print("=" * 40)
-        for key in opciones:
-            print(f"{key} - {os.path.basename(opciones[key])}")
-        print("0 - Salir")
-        print("=" * 40)
+            eleccion = input("\nElige una opción (0 para salir): ").strip()
 
-        eleccion = input("\nElige una opción (0 para salir): ").strip()
+            if eleccion.lower() == 'b' or eleccion.lower().startswith('b '):
+                consulta = eleccion[1:].strip() or input("Buscar: ").strip()
+                if indice_tokens is None:
+                    inicio = time.perf_counter()
+                    indice_tokens = IndiceTokens(ruta_base, ruta_tokens)
+                    indice_tokens.sincronizar(modulos)
+                    print(f"Índice de {len(indice_tokens)} scripts listo en "
+                          f"{(time.perf_counter() - inicio) * 1000:.1f} ms ({indice_tokens.releidos} releídos)")
+                elif vigilante is not None:
+                    indice_tokens.aplicar_cambios(menu.modulos)
+                else:
+                    indice_tokens.sincronizar(menu.modulos)
+                mostrar_busqueda(consulta, indice_tokens, indice)
+                input("\nPresiona Enter para continuar...")
+                continue
+            eleccion = eleccion.lower()
 
-        if eleccion == '0':
-            print("Saliendo del programa...")
-            break
+            if eleccion == '0':
+                print("Saliendo del programa...")
+                break
+            if eleccion in ('s', 'a'):
+                pagina_menu = (pagina_menu + (1 if eleccion == 's' else -1)) % total_paginas
+                continue
 
-        if eleccion in opciones:
-            ruta_completa = os.path.join(ruta_base, opciones[eleccion])
-            mostrar_codigo(ruta_completa)
-        else:
-            print("Opción no válida. Intenta nuevamente.")
+            if eleccion.isdigit() and 1 <= int(eleccion) <= len(modulos):
+                mostrar_codigo(os.path.join(ruta_base, modulos[int(eleccion) - 1]), indice)
+            else:
+                print("Opción no válida. Intenta nuevamente.")
 
-        input("\nPresiona Enter para continuar...")
+            input("\nPresiona Enter para continuar...")
+    finally:
+        if vigilante is not None:
+            vigilante.detener()
 
 
 if __name__ == "__main__":
-    mostrar_menu()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Dashboard de los scripts de la asignatura")
+    parser.add_argument("--vigilar", action="store_true", help="actualizar el menú cuando cambian los archivos")
+    parser.add_argument("--sondeo", action="store_true", help="vigilar consultando mtimes en lugar de usar inotify")
+    args = parser.parse_args()
+    mostrar_menu(vigilar=args.vigilar, usar_inotify=not args.sondeo)
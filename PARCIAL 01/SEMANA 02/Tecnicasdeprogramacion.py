@@ -88,13 +88,16 @@ def combate(jugador_1, jugador_2):
         print("\nHa ganado", jugador_2.nombre)
     else:
         print("\nEmpate")
-# Creación de personajes
-personaje_1 = Guerrero("Guts", 20, 10, 4, 100, 4)
-personaje_2 = Mago("Vanessa", 5, 15, 4, 100, 3)
 
-# Mostrar atributos
-personaje_1.atributos()
-personaje_2.atributos()
 
-# Iniciar combate
-combate(personaje_1, personaje_2)
+if __name__ == "__main__":
+    # Creación de personajes
+    personaje_1 = Guerrero("Guts", 20, 10, 4, 100, 4)
+    personaje_2 = Mago("Vanessa", 5, 15, 4, 100, 3)
+
+    # Mostrar atributos
+    personaje_1.atributos()
+    personaje_2.atributos()
+
+    # Iniciar combate
+    combate(personaje_1, personaje_2)
@@ -0,0 +1,236 @@
+"""
+Simulador de combates por lotes para ajustar el balance entre Guerrero y Mago.
+
+A diferencia de combate(), los combates se resuelven sin imprimir nada, y un
+barrido de parámetros reparte miles o millones de enfrentamientos entre varios
+procesos. Con variacion > 0 cada ataque aplica un daño aleatorio alrededor del
+valor base (simulación de Monte Carlo). Sin variación el combate es
+determinista y se resuelve con aritmética, sin recorrer los turnos.
+"""
+
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from Tecnicasdeprogramacion import Guerrero, Mago
+
+# Resultados posibles de un combate
+EMPATE = 0
+GANA_JUGADOR_1 = 1
+GANA_JUGADOR_2 = 2
+
+# Límite de turnos para combates que nunca terminan (daño nulo o negativo)
+MAX_TURNOS = 10_000
+
+
+def _turnos_para_matar(vida, daño):
+    """Turnos que tarda un daño fijo en dejar la vida en 0 o menos (None si nunca)"""
+    if vida <= 0:
+        return 0
+    if daño <= 0:
+        return None
+    return int(-(-vida // daño))  # División entera redondeando hacia arriba
+
+
+def resolver_cerrado(jugador_1, jugador_2, max_turnos=MAX_TURNOS):
+    """
+    Resuelve en O(1) un combate sin elementos aleatorios.
+
+    Como el daño de cada personaje es constante, el jugador 1 derriba al 2 en
+    t1 = ceil(vida_2 / daño_1) turnos y el 2 al 1 en t2 = ceil(vida_1 / daño_2).
+    El combate dura min(t1, t2) turnos y, como el jugador 2 ataca aunque caiga en
+    ese turno, si t1 == t2 mueren ambos.
+    """
+    return resolver_valores(jugador_1.vida, jugador_1.daño(jugador_2),
+                            jugador_2.vida, jugador_2.daño(jugador_1), max_turnos)
+
+
+def resolver_valores(vida_1, daño_1, vida_2, daño_2, max_turnos=MAX_TURNOS):
+    """Igual que resolver_cerrado(), pero a partir de la vida y el daño de cada jugador"""
+    if vida_1 <= 0 or vida_2 <= 0:
+        # El combate no llega a empezar
+        if vida_1 > 0:
+            return GANA_JUGADOR_1, 0
+        if vida_2 > 0:
+            return GANA_JUGADOR_2, 0
+        return EMPATE, 0
+
+    t1 = _turnos_para_matar(vida_2, daño_1)
+    t2 = _turnos_para_matar(vida_1, daño_2)
+    duracion = min(t for t in (t1, t2, max_turnos + 1) if t is not None)
+
+    if duracion > max_turnos:
+        return EMPATE, max_turnos
+    if t1 == t2:
+        return EMPATE, duracion
+    if t1 == duracion:
+        return GANA_JUGADOR_1, duracion
+    return GANA_JUGADOR_2, duracion
+
+
+def simular_combate(jugador_1, jugador_2, variacion=0.0, rng=None, max_turnos=MAX_TURNOS):
+    """
+    Resuelve un combate con las mismas reglas que combate(), pero sin imprimir
+    ni modificar a los personajes. Sin variación se usa resolver_cerrado().
+
+    :param variacion: fracción de variación aleatoria del daño (0.1 = ±10 %)
+    :param rng: generador random.Random para reproducir los resultados
+    :return: tupla (resultado, turnos); si se alcanza max_turnos se considera empate
+    """
+    if not variacion:
+        return resolver_cerrado(jugador_1, jugador_2, max_turnos)
+
+    vida_1, vida_2 = jugador_1.vida, jugador_2.vida
+    # El daño solo depende de los atributos, así que se calcula una sola vez
+    daño_1 = jugador_1.daño(jugador_2)
+    daño_2 = jugador_2.daño(jugador_1)
+    aleatorio = (rng or random).uniform
+
+    turno = 0
+    while vida_1 > 0 and vida_2 > 0:
+        if turno >= max_turnos:
+            return EMPATE, turno
+        vida_2 -= daño_1 * aleatorio(1 - variacion, 1 + variacion)
+        vida_1 -= daño_2 * aleatorio(1 - variacion, 1 + variacion)
+        turno += 1
+
+    # Igual que en combate(), el jugador 2 ataca aunque haya caído en ese turno
+    if vida_1 > 0:
+        return GANA_JUGADOR_1, turno
+    if vida_2 > 0:
+        return GANA_JUGADOR_2, turno
+    return EMPATE, turno
+
+
+class EstadisticasCombate:
+    """Acumula victorias, empates y turnos de una serie de combates"""
+
+    def __init__(self):
+        self.combates = 0
+        self.victorias_1 = 0
+        self.victorias_2 = 0
+        self.empates = 0
+        self.turnos_total = 0
+        self.turnos_min = None
+        self.turnos_max = None
+
+    def registrar(self, resultado, turnos):
+        self.combates += 1
+        if resultado == GANA_JUGADOR_1:
+            self.victorias_1 += 1
+        elif resultado == GANA_JUGADOR_2:
+            self.victorias_2 += 1
+        else:
+            self.empates += 1
+        self.turnos_total += turnos
+        self.turnos_min = turnos if self.turnos_min is None else min(self.turnos_min, turnos)
+        self.turnos_max = turnos if self.turnos_max is None else max(self.turnos_max, turnos)
+
+    def combinar(self, otra):
+        """Suma las estadísticas de otra serie (por ejemplo, de otro proceso)"""
+        self.combates += otra.combates
+        self.victorias_1 += otra.victorias_1
+        self.victorias_2 += otra.victorias_2
+        self.empates += otra.empates
+        self.turnos_total += otra.turnos_total
+        for turnos in (otra.turnos_min, otra.turnos_max):
+            if turnos is not None:
+                self.turnos_min = turnos if self.turnos_min is None else min(self.turnos_min, turnos)
+                self.turnos_max = turnos if self.turnos_max is None else max(self.turnos_max, turnos)
+
+    @property
+    def tasa_victoria_1(self):
+        return self.victorias_1 / self.combates if self.combates else 0.0
+
+    @property
+    def tasa_victoria_2(self):
+        return self.victorias_2 / self.combates if self.combates else 0.0
+
+    @property
+    def turnos_medios(self):
+        return self.turnos_total / self.combates if self.combates else 0.0
+
+    def __str__(self):
+        return (f"Combates: {self.combates}, Guerrero: {self.tasa_victoria_1:.1%}, "
+                f"Mago: {self.tasa_victoria_2:.1%}, Empates: {self.empates}, "
+                f"Turnos: media {self.turnos_medios:.2f} (mín {self.turnos_min}, máx {self.turnos_max})")
+
+
+def _simular_configuraciones(configuraciones, vida, repeticiones, variacion, semilla):
+    """Trabajo de un proceso: simula cada configuración del lote"""
+    rng = random.Random(semilla)
+    resultados = []
+    for configuracion in configuraciones:
+        fuerza, espada, defensa_guerrero, inteligencia, libro, defensa_mago = configuracion
+        guerrero = Guerrero("Guerrero", fuerza, 0, defensa_guerrero, vida, espada)
+        mago = Mago("Mago", 0, inteligencia, defensa_mago, vida, libro)
+
+        estadisticas = EstadisticasCombate()
+        if variacion:
+            for _ in range(repeticiones):
+                estadisticas.registrar(*simular_combate(guerrero, mago, variacion, rng))
+        else:
+            # Sin azar todas las repeticiones dan el mismo resultado
+            resultado, turnos = resolver_cerrado(guerrero, mago)
+            for _ in range(repeticiones):
+                estadisticas.registrar(resultado, turnos)
+        resultados.append((configuracion, estadisticas))
+    return resultados
+
+
+def barrido(fuerza, espada, inteligencia, libro, defensa, vida=100, repeticiones=1,
+            variacion=0.0, procesos=None, tamaño_lote=2_000, semilla=0):
+    """
+    Enfrenta a un Guerrero con un Mago para cada combinación de parámetros.
+
+    Cada argumento de atributo es una lista de valores; defensa se combina de forma
+    independiente para el guerrero y para el mago. Las configuraciones se reparten
+    en lotes entre un grupo de procesos.
+
+    :return: tupla (estadísticas globales, diccionario configuración -> estadísticas),
+             donde cada configuración es
+             (fuerza, espada, defensa_guerrero, inteligencia, libro, defensa_mago)
+    """
+    configuraciones = list(itertools.product(fuerza, espada, defensa, inteligencia, libro, defensa))
+    lotes = [configuraciones[i:i + tamaño_lote] for i in range(0, len(configuraciones), tamaño_lote)]
+
+    total = EstadisticasCombate()
+    por_configuracion = {}
+    with ProcessPoolExecutor(max_workers=procesos or os.cpu_count()) as ejecutor:
+        futuros = [
+            ejecutor.submit(_simular_configuraciones, lote, vida, repeticiones, variacion, semilla + i)
+            for i, lote in enumerate(lotes)
+        ]
+        for futuro in futuros:
+            for configuracion, estadisticas in futuro.result():
+                por_configuracion[configuracion] = estadisticas
+                total.combinar(estadisticas)
+    return total, por_configuracion
+
+
+if __name__ == "__main__":
+    import time
+
+    inicio = time.perf_counter()
+    total, por_configuracion = barrido(
+        fuerza=range(5, 25, 2),
+        espada=(4, 8, 10),
+        inteligencia=range(5, 25, 2),
+        libro=(3, 5, 7),
+        defensa=range(0, 10, 2),
+        repeticiones=20,
+        variacion=0.2,
+    )
+    duracion = time.perf_counter() - inicio
+
+    print("=== BARRIDO GUERRERO vs MAGO ===")
+    print(total)
+    print(f"{total.combates} combates en {duracion:.2f} s ({total.combates / duracion:,.0f} combates/s)")
+
+    # Configuraciones más equilibradas (victorias de ambos lados lo más parecidas posible)
+    equilibradas = sorted(por_configuracion.items(),
+                          key=lambda x: (abs(x[1].tasa_victoria_1 - x[1].tasa_victoria_2), x[1].empates))
+    print("\nConfiguraciones más equilibradas (fuerza, espada, def. G, inteligencia, libro, def. M):")
+    for configuracion, estadisticas in equilibradas[:5]:
+        print(f"{configuracion}: {estadisticas}")
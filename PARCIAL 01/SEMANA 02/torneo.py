@@ -0,0 +1,230 @@
+"""
+Torneos de todos contra todos y de eliminación directa entre personajes.
+
+Cada personaje se reduce a un registro compacto (vida, ataque, defensa) que se
+envía una sola vez a cada proceso del grupo. Las partidas de cada ronda se
+reparten en fragmentos de pares de índices, los resultados se van sumando a la
+clasificación a medida que llegan y se informa el rendimiento de cada ronda.
+"""
+
+import heapq
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from simulacion import EMPATE, GANA_JUGADOR_1, GANA_JUGADOR_2, MAX_TURNOS, resolver_valores
+
+# Puntos por resultado en la clasificación
+PUNTOS_VICTORIA = 3
+PUNTOS_EMPATE = 1
+
+
+class _SinDefensa:
+    """Rival ficticio con defensa 0, para medir el ataque base de un personaje"""
+    defensa = 0
+
+
+def registro_compacto(personaje):
+    """
+    Reduce un personaje a la tupla (vida, ataque, defensa).
+
+    Supone, como Personaje, Guerrero y Mago, que el daño es el ataque base
+    menos la defensa del enemigo.
+    """
+    return personaje.vida, personaje.daño(_SinDefensa), personaje.defensa
+
+
+# Registros del torneo en cada proceso del grupo (se envían una sola vez)
+_registros = None
+
+
+def _inicializar_proceso(registros):
+    global _registros
+    _registros = registros
+
+
+def _jugar_partidas(pares, max_turnos):
+    """Trabajo de un proceso: resuelve un fragmento de partidas (i, j)"""
+    resultados = []
+    for i, j in pares:
+        vida_1, ataque_1, defensa_1 = _registros[i]
+        vida_2, ataque_2, defensa_2 = _registros[j]
+        resultado, turnos = resolver_valores(vida_1, ataque_1 - defensa_2,
+                                             vida_2, ataque_2 - defensa_1, max_turnos)
+        resultados.append((i, j, resultado, turnos))
+    return resultados
+
+
+class Clasificacion:
+    """Tabla de puntos, victorias, empates y derrotas de cada participante"""
+
+    def __init__(self, participantes):
+        self.participantes = participantes
+        n = len(participantes)
+        self.puntos = [0] * n
+        self.victorias = [0] * n
+        self.empates = [0] * n
+        self.derrotas = [0] * n
+
+    def registrar(self, i, j, resultado):
+        if resultado == GANA_JUGADOR_1:
+            ganador, perdedor = i, j
+        elif resultado == GANA_JUGADOR_2:
+            ganador, perdedor = j, i
+        else:
+            self.empates[i] += 1
+            self.empates[j] += 1
+            self.puntos[i] += PUNTOS_EMPATE
+            self.puntos[j] += PUNTOS_EMPATE
+            return
+        self.victorias[ganador] += 1
+        self.derrotas[perdedor] += 1
+        self.puntos[ganador] += PUNTOS_VICTORIA
+
+    def mejores(self, cantidad=10):
+        """Devuelve los índices de los participantes con más puntos"""
+        return heapq.nlargest(cantidad, range(len(self.puntos)),
+                              key=lambda i: (self.puntos[i], self.victorias[i]))
+
+    def mostrar(self, cantidad=10):
+        print(f"{'#':>3}  {'Nombre':<20} {'Pts':>6} {'G':>5} {'E':>5} {'P':>5}")
+        for posicion, i in enumerate(self.mejores(cantidad), start=1):
+            print(f"{posicion:>3}  {self.participantes[i].nombre:<20} {self.puntos[i]:>6} "
+                  f"{self.victorias[i]:>5} {self.empates[i]:>5} {self.derrotas[i]:>5}")
+
+
+class EstadisticasRonda:
+    """Partidas jugadas y tiempo empleado en una ronda"""
+
+    def __init__(self, numero, partidas, segundos):
+        self.numero = numero
+        self.partidas = partidas
+        self.segundos = segundos
+
+    @property
+    def partidas_por_segundo(self):
+        return self.partidas / self.segundos if self.segundos else 0.0
+
+    def __str__(self):
+        return (f"Ronda {self.numero}: {self.partidas} partidas en {self.segundos:.3f} s "
+                f"({self.partidas_por_segundo:,.0f} partidas/s)")
+
+
+class Torneo:
+    """Organiza torneos entre personajes repartiendo las partidas entre procesos"""
+
+    def __init__(self, personajes, procesos=None, tamaño_fragmento=5_000, max_turnos=MAX_TURNOS):
+        self.personajes = list(personajes)
+        self.registros = [registro_compacto(p) for p in self.personajes]
+        self.procesos = procesos or os.cpu_count()
+        self.tamaño_fragmento = tamaño_fragmento
+        self.max_turnos = max_turnos
+        self.rondas = []
+
+    def _ejecutor(self):
+        return ProcessPoolExecutor(max_workers=self.procesos, initializer=_inicializar_proceso,
+                                   initargs=(self.registros,))
+
+    def _jugar_ronda(self, ejecutor, numero, pares, clasificacion, al_terminar_ronda):
+        """Reparte una ronda en fragmentos y suma los resultados según van llegando"""
+        inicio = time.perf_counter()
+        # Al menos un fragmento por proceso; tamaño_fragmento solo pone el límite superior
+        tamaño = max(1, min(self.tamaño_fragmento, math.ceil(len(pares) / self.procesos)))
+        fragmentos = [pares[k:k + tamaño] for k in range(0, len(pares), tamaño)]
+        futuros = [ejecutor.submit(_jugar_partidas, fragmento, self.max_turnos) for fragmento in fragmentos]
+
+        resultados = []
+        for futuro in as_completed(futuros):
+            for i, j, resultado, turnos in futuro.result():
+                clasificacion.registrar(i, j, resultado)
+                resultados.append((i, j, resultado))
+
+        estadisticas = EstadisticasRonda(numero, len(pares), time.perf_counter() - inicio)
+        self.rondas.append(estadisticas)
+        if al_terminar_ronda:
+            al_terminar_ronda(estadisticas)
+        return resultados
+
+    def todos_contra_todos(self, al_terminar_ronda=None):
+        """
+        Cada personaje se enfrenta una vez a todos los demás. Las rondas se generan
+        con el método del círculo, así que nadie juega dos veces en la misma ronda.
+        """
+        clasificacion = Clasificacion(self.personajes)
+        indices = list(range(len(self.personajes)))
+        if len(indices) % 2:
+            indices.append(None)  # Descanso
+        n = len(indices)
+
+        with self._ejecutor() as ejecutor:
+            for numero in range(1, n):
+                pares = [(indices[k], indices[n - 1 - k]) for k in range(n // 2)
+                         if indices[k] is not None and indices[n - 1 - k] is not None]
+                self._jugar_ronda(ejecutor, numero, pares, clasificacion, al_terminar_ronda)
+                # El primero queda fijo y el resto rota una posición
+                indices.insert(1, indices.pop())
+        return clasificacion
+
+    def eliminacion(self, al_terminar_ronda=None):
+        """
+        Eliminación directa por orden de inscripción. Si hay número impar, el último
+        pasa sin jugar; en caso de empate avanza el mejor sembrado (el de menor índice).
+
+        :return: tupla (campeón, clasificación)
+        """
+        clasificacion = Clasificacion(self.personajes)
+        vivos = list(range(len(self.personajes)))
+
+        with self._ejecutor() as ejecutor:
+            numero = 1
+            while len(vivos) > 1:
+                pares = [(vivos[k], vivos[k + 1]) for k in range(0, len(vivos) - 1, 2)]
+                resultados = self._jugar_ronda(ejecutor, numero, pares, clasificacion, al_terminar_ronda)
+
+                ganadores = {}
+                for i, j, resultado in resultados:
+                    if resultado == EMPATE:
+                        ganadores[i] = min(i, j)
+                    else:
+                        ganadores[i] = i if resultado == GANA_JUGADOR_1 else j
+                siguiente = [ganadores[i] for i, _ in pares]
+                if len(vivos) % 2:
+                    siguiente.append(vivos[-1])
+                vivos = siguiente
+                numero += 1
+
+        campeon = self.personajes[vivos[0]] if vivos else None
+        return campeon, clasificacion
+
+
+if __name__ == "__main__":
+    import random
+
+    from Tecnicasdeprogramacion import Guerrero, Mago
+
+    def crear_plantel(cantidad, semilla=0):
+        rng = random.Random(semilla)
+        plantel = []
+        for i in range(cantidad):
+            if rng.random() < 0.5:
+                plantel.append(Guerrero(f"Guerrero-{i}", rng.randint(5, 25), rng.randint(1, 10),
+                                        rng.randint(0, 10), 100, rng.randint(2, 10)))
+            else:
+                plantel.append(Mago(f"Mago-{i}", rng.randint(1, 10), rng.randint(5, 25),
+                                    rng.randint(0, 10), 100, rng.randint(2, 8)))
+        return plantel
+
+    print("=== TODOS CONTRA TODOS (1000 personajes) ===")
+    torneo = Torneo(crear_plantel(1000))
+    clasificacion = torneo.todos_contra_todos(
+        al_terminar_ronda=lambda r: print(r) if r.numero % 250 == 0 else None)
+    partidas = sum(r.partidas for r in torneo.rondas)
+    segundos = sum(r.segundos for r in torneo.rondas)
+    print(f"Total: {partidas} partidas en {segundos:.2f} s ({partidas / segundos:,.0f} partidas/s)\n")
+    clasificacion.mostrar()
+
+    print("\n=== ELIMINACIÓN DIRECTA (100000 personajes) ===")
+    campeon, _ = Torneo(crear_plantel(100_000, semilla=1)).eliminacion(al_terminar_ronda=print)
+    print(f"\nCampeón: {campeon.nombre}")
+    campeon.atributos()
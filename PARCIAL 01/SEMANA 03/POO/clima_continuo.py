@@ -0,0 +1,265 @@
+"""
+Estadísticas de temperatura en flujo continuo
+
+SemanaClima promedia siete temperaturas ingresadas a mano. Aquí las lecturas
+llegan de sensores sin parar, así que cada día guarda solo un acumulador con la
+media, la varianza (actualización de Welford), el mínimo y el máximo: la memoria
+no crece con la cantidad de lecturas.
+
+Los acumuladores diarios se combinan para obtener las estadísticas de cada
+semana y de cada mes, y los registros CSV grandes se procesan con una cadena de
+generadores que lee, interpreta y filtra las lecturas de una en una.
+"""
+
+import csv
+import datetime
+import math
+
+from POO import DiaClima, SemanaClima
+
+NOMBRES_DIAS = ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo")
+
+
+class EstadisticasTemperatura:
+    """Media, varianza, mínimo y máximo de una serie de lecturas, sin guardarlas"""
+
+    def __init__(self):
+        self.cantidad = 0
+        self.media = 0.0
+        self._m2 = 0.0  # Suma de cuadrados de las diferencias con la media
+        self.minimo = None
+        self.maximo = None
+
+    def agregar(self, valor):
+        """Incorpora una lectura (actualización de Welford)"""
+        self.cantidad += 1
+        delta = valor - self.media
+        self.media += delta / self.cantidad
+        self._m2 += delta * (valor - self.media)
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+
+    def combinar(self, otra):
+        """Suma las lecturas de otro acumulador, como si se hubieran agregado aquí"""
+        if not otra.cantidad:
+            return self
+        if not self.cantidad:
+            self.cantidad, self.media, self._m2 = otra.cantidad, otra.media, otra._m2
+            self.minimo, self.maximo = otra.minimo, otra.maximo
+            return self
+
+        total = self.cantidad + otra.cantidad
+        delta = otra.media - self.media
+        self.media += delta * otra.cantidad / total
+        self._m2 += otra._m2 + delta * delta * self.cantidad * otra.cantidad / total
+        self.cantidad = total
+        self.minimo = min(self.minimo, otra.minimo)
+        self.maximo = max(self.maximo, otra.maximo)
+        return self
+
+    @property
+    def varianza(self):
+        """Varianza poblacional de las lecturas"""
+        return self._m2 / self.cantidad if self.cantidad else 0.0
+
+    @property
+    def varianza_muestral(self):
+        return self._m2 / (self.cantidad - 1) if self.cantidad > 1 else 0.0
+
+    @property
+    def desviacion(self):
+        return math.sqrt(self.varianza)
+
+    def __str__(self):
+        if not self.cantidad:
+            return "Sin lecturas"
+        return (f"{self.cantidad} lecturas, media {self.media:.2f}°C, "
+                f"mín {self.minimo:.2f}°C, máx {self.maximo:.2f}°C, desv. {self.desviacion:.2f}°C")
+
+
+class DiaClimaContinuo(DiaClima):
+    """Día que recibe muchas lecturas; su temperatura es la media de todas ellas"""
+
+    def __init__(self, nombre, estadisticas=None):
+        super().__init__(nombre)
+        self.estadisticas = estadisticas or EstadisticasTemperatura()
+        self._actualizar_temperatura()
+
+    def registrar_lectura(self, valor):
+        """Agrega una lectura del sensor a este día"""
+        self.estadisticas.agregar(valor)
+        self.temperatura = self.estadisticas.media
+
+    def _actualizar_temperatura(self):
+        self.temperatura = self.estadisticas.media if self.estadisticas.cantidad else None
+
+
+class SemanaClimaContinua(SemanaClima):
+    """Semana armada con días de lecturas continuas; conserva el resumen de SemanaClima"""
+
+    def __init__(self, dias=None):
+        """
+        :param dias: diccionario día de la semana (0 = lunes) -> EstadisticasTemperatura
+        """
+        dias = dias or {}
+        self.dias = [DiaClimaContinuo(nombre, dias.get(i)) for i, nombre in enumerate(NOMBRES_DIAS)]
+
+    def registrar_lectura(self, fecha_hora, valor):
+        """Agrega una lectura al día de la semana que le corresponde"""
+        self.dias[fecha_hora.weekday()].registrar_lectura(valor)
+
+    def calcular_promedio(self):
+        """Promedio de las medias diarias, como en SemanaClima (0 si no hay lecturas)"""
+        if all(dia.temperatura is None for dia in self.dias):
+            return 0.0
+        return super().calcular_promedio()
+
+    def estadisticas(self):
+        """Estadísticas de todas las lecturas de la semana, ponderadas por cantidad"""
+        total = EstadisticasTemperatura()
+        for dia in self.dias:
+            total.combinar(dia.estadisticas)
+        return total
+
+
+class AgregadorClima:
+    """
+    Acumula lecturas por día y las agrupa por semana (ISO) y por mes al consultar.
+
+    Cada lectura actualiza un solo acumulador (el de su día); las semanas y los
+    meses se obtienen combinando los días, que son pocos comparados con las lecturas.
+    """
+
+    def __init__(self):
+        self.dias = {}  # fecha -> EstadisticasTemperatura
+        self._fecha_actual = None
+        self._dia_actual = None
+
+    def agregar(self, fecha_hora, valor):
+        fecha = fecha_hora.date() if isinstance(fecha_hora, datetime.datetime) else fecha_hora
+        # Las lecturas suelen llegar en orden: se evita buscar el día en el diccionario
+        if fecha != self._fecha_actual:
+            self._dia_actual = self.dias.get(fecha)
+            if self._dia_actual is None:
+                self._dia_actual = self.dias[fecha] = EstadisticasTemperatura()
+            self._fecha_actual = fecha
+        self._dia_actual.agregar(valor)
+
+    def consumir(self, lecturas):
+        """Agrega todas las lecturas (fecha_hora, valor) de un iterable y devuelve el agregador"""
+        for fecha_hora, valor in lecturas:
+            self.agregar(fecha_hora, valor)
+        return self
+
+    def _agrupar(self, clave):
+        grupos = {}
+        for fecha in sorted(self.dias):
+            grupos.setdefault(clave(fecha), EstadisticasTemperatura()).combinar(self.dias[fecha])
+        return grupos
+
+    def por_dia(self):
+        return dict(sorted(self.dias.items()))
+
+    def por_semana(self):
+        """Diccionario (año ISO, semana ISO) -> estadísticas"""
+        return self._agrupar(lambda fecha: tuple(fecha.isocalendar())[:2])
+
+    def por_mes(self):
+        """Diccionario (año, mes) -> estadísticas"""
+        return self._agrupar(lambda fecha: (fecha.year, fecha.month))
+
+    def total(self):
+        total = EstadisticasTemperatura()
+        for estadisticas in self.dias.values():
+            total.combinar(estadisticas)
+        return total
+
+    def semana_clima(self, anio, semana):
+        """Devuelve una SemanaClimaContinua con una copia de los días de la semana ISO indicada"""
+        dias = {}
+        for dia in range(7):
+            fecha = datetime.date.fromisocalendar(anio, semana, dia + 1)
+            if fecha in self.dias:
+                dias[dia] = EstadisticasTemperatura().combinar(self.dias[fecha])
+        return SemanaClimaContinua(dias)
+
+
+# ----- Cadena de generadores para registros CSV -----
+
+def leer_filas(ruta):
+    """Genera las filas de un CSV con encabezado como diccionarios"""
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        yield from csv.DictReader(archivo)
+
+
+def interpretar_lecturas(filas, columna_fecha="fecha_hora", columna_temperatura="temperatura", errores=None):
+    """
+    Convierte filas en tuplas (datetime, temperatura). Las filas mal formadas se
+    saltan y, si se pasa una lista en errores, se anotan ahí.
+    """
+    for numero, fila in enumerate(filas, start=2):  # La fila 1 es el encabezado
+        try:
+            yield datetime.datetime.fromisoformat(fila[columna_fecha]), float(fila[columna_temperatura])
+        except (KeyError, TypeError, ValueError):
+            if errores is not None:
+                errores.append(numero)
+
+
+def filtrar_rango(lecturas, minimo=-90.0, maximo=60.0):
+    """Descarta lecturas fuera del rango físicamente posible (fallas del sensor)"""
+    for fecha_hora, valor in lecturas:
+        if minimo <= valor <= maximo:
+            yield fecha_hora, valor
+
+
+def procesar_registro(ruta, columna_fecha="fecha_hora", columna_temperatura="temperatura", errores=None):
+    """Lee un registro CSV completo y devuelve un AgregadorClima con sus lecturas"""
+    lecturas = filtrar_rango(interpretar_lecturas(leer_filas(ruta), columna_fecha,
+                                                  columna_temperatura, errores))
+    return AgregadorClima().consumir(lecturas)
+
+
+def main():
+    """Genera un registro de un sensor cada minuto durante 90 días y lo resume"""
+    import os
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(0)
+    inicio_registro = datetime.datetime(2025, 1, 1)
+    with tempfile.TemporaryDirectory() as temporal:
+        ruta = os.path.join(temporal, "sensor.csv")
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["fecha_hora", "temperatura"])
+            for minuto in range(90 * 24 * 60):
+                instante = inicio_registro + datetime.timedelta(minutes=minuto)
+                base = 18 + 6 * math.sin((instante.hour - 9) / 24 * 2 * math.pi)
+                escritor.writerow([instante.isoformat(), f"{base + rng.gauss(0, 1.5):.2f}"])
+
+        inicio = time.perf_counter()
+        errores = []
+        agregador = procesar_registro(ruta, errores=errores)
+        duracion = time.perf_counter() - inicio
+
+    print("=== CLIMA CONTINUO ===")
+    print(f"Total: {agregador.total()}")
+    print(f"Procesado en {duracion:.2f} s ({len(errores)} filas con errores)")
+
+    print("\nPor mes:")
+    for (anio, mes), estadisticas in agregador.por_mes().items():
+        print(f"{anio}-{mes:02d}: {estadisticas}")
+
+    print("\nPrimeras semanas:")
+    for (anio, semana), estadisticas in list(agregador.por_semana().items())[:3]:
+        print(f"{anio}-S{semana:02d}: {estadisticas}")
+
+    semana = agregador.semana_clima(2025, 2)
+    semana.mostrar_resumen()
+
+
+if __name__ == "__main__":
+    main()
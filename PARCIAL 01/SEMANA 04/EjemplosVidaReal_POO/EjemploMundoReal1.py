@@ -6,6 +6,8 @@ Sistema de gestión para una clínica veterinaria que demuestra los principios d
 - Polimorfismo
 """
 
+from historial import RegistroVacunas
+
 class Mascota:
     """Clase base que representa una mascota en la veterinaria"""
     
@@ -14,7 +16,7 @@ class Mascota:
         self._especie = especie
         self._edad = edad
         self._peso = peso
-        self._vacunas = []
+        self._vacunas = RegistroVacunas()  # Códigos y fechas en arreglos compactos
     
     @property
     def nombre(self):
@@ -27,9 +29,9 @@ class Mascota:
         else:
             self._nombre = nuevo_nombre
     
-    def agregar_vacuna(self, vacuna):
-        """Método para agregar una vacuna al historial de la mascota"""
-        self._vacunas.append(vacuna)
+    def agregar_vacuna(self, vacuna, fecha=None):
+        """Método para agregar una vacuna (aplicada hoy o en la fecha indicada) al historial"""
+        self._vacunas.agregar(vacuna, fecha)
         print(f"Vacuna {vacuna} registrada para {self._nombre}")
     
     def mostrar_info(self):
@@ -39,7 +41,7 @@ class Mascota:
         Especie: {self._especie}
         Edad: {self._edad} años
         Peso: {self._peso} kg
-        Vacunas: {', '.join(self._vacunas) if self._vacunas else 'Ninguna'}
+        Vacunas: {self._vacunas.texto() if self._vacunas else 'Ninguna'}
         """
         print(info)
 
@@ -0,0 +1,264 @@
+"""
+Agenda de citas por veterinario.
+
+CitaMedica guarda la fecha como texto libre y nada impide dar dos citas a la
+misma hora. AgendaVeterinaria interpreta las fechas y guarda, por cada
+veterinario, los inicios y fines de sus citas en arreglos ordenados (en minutos),
+sin solapamientos entre sí. Con búsqueda binaria (bisect):
+- comprobar si un horario choca con otra cita cuesta O(log n);
+- el próximo hueco libre se encuentra en O(log n) más las citas pegadas una
+  detrás de otra que haya que saltar;
+- las citas de un rango de fechas se obtienen sin recorrer toda la agenda.
+
+Uso (benchmark con un año de citas sintéticas):
+    python agenda_citas.py
+"""
+
+import bisect
+import datetime
+from array import array
+
+from EjemploMundoReal1 import CitaMedica
+
+FORMATOS_FECHA = ("%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y %H:%M")
+
+MINUTOS_POR_DIA = 24 * 60
+
+
+def interpretar_fecha(fecha):
+    """Convierte el texto de una cita ('2023-05-15 10:00') en datetime"""
+    if isinstance(fecha, datetime.datetime):
+        return fecha
+    for formato in FORMATOS_FECHA:
+        try:
+            return datetime.datetime.strptime(fecha.strip(), formato)
+        except ValueError:
+            pass
+    raise ValueError(f"Fecha no reconocida: {fecha!r}")
+
+
+def _a_minutos(fecha):
+    return fecha.toordinal() * MINUTOS_POR_DIA + fecha.hour * 60 + fecha.minute
+
+
+def _desde_minutos(minutos):
+    dia, minuto = divmod(minutos, MINUTOS_POR_DIA)
+    return datetime.datetime.fromordinal(dia) + datetime.timedelta(minutes=minuto)
+
+
+class ConflictoHorario(ValueError):
+    """El horario pedido se superpone con otra cita del mismo veterinario"""
+
+    def __init__(self, cita):
+        super().__init__(f"El horario choca con la cita de {cita.mascota.nombre} ({cita.fecha})")
+        self.cita = cita
+
+
+class _AgendaDeVeterinario:
+    """Citas de un veterinario ordenadas por inicio, sin solapamientos"""
+
+    def __init__(self):
+        self.inicios = array('q')
+        self.fines = array('q')
+        self.citas = []
+
+    def choques(self, inicio, fin):
+        """Índices de las citas que se superponen con [inicio, fin)"""
+        # Como las citas no se solapan, los fines también están ordenados
+        i = bisect.bisect_right(self.fines, inicio)
+        j = bisect.bisect_left(self.inicios, fin)
+        return range(i, j)
+
+    def insertar(self, inicio, fin, cita):
+        i = bisect.bisect_left(self.inicios, inicio)
+        self.inicios.insert(i, inicio)
+        self.fines.insert(i, fin)
+        self.citas.insert(i, cita)
+
+    def quitar(self, cita):
+        """
+        Quita una cita de la agenda.
+
+        :raises ValueError: si la cita no está agendada con este veterinario
+        """
+        inicio = getattr(cita, 'inicio_minutos', None)
+        i = len(self.citas) if inicio is None else bisect.bisect_left(self.inicios, inicio)
+        # Solo se revisan las citas que empiezan a la misma hora
+        while i < len(self.citas) and self.inicios[i] == inicio and self.citas[i] is not cita:
+            i += 1
+        if i == len(self.citas) or self.citas[i] is not cita:
+            raise ValueError("La cita no está agendada")
+        del self.inicios[i]
+        del self.fines[i]
+        del self.citas[i]
+
+
+# Agenda usada en las consultas sobre veterinarios sin citas; nunca se modifica
+_AGENDA_VACIA = _AgendaDeVeterinario()
+
+
+class AgendaVeterinaria:
+    """Agenda de citas de todos los veterinarios de la clínica"""
+
+    def __init__(self, hora_apertura=9, hora_cierre=18, clinica=None):
+        """
+        :param hora_apertura: hora a partir de la que se dan citas
+        :param hora_cierre: hora a la que debe terminar la última cita
+        :param clinica: Clinica opcional; si se indica, las citas también quedan en su registro
+        """
+        self.apertura = hora_apertura * 60
+        self.cierre = hora_cierre * 60
+        self.clinica = clinica
+        self._agendas = {}
+
+    def _agenda(self, veterinario):
+        """Agenda del veterinario para consultar (vacía y sin registrarlo si no tiene citas)"""
+        return self._agendas.get(veterinario, _AGENDA_VACIA)
+
+    def _rango(self, fecha, duracion_minutos):
+        inicio = _a_minutos(interpretar_fecha(fecha))
+        fin = inicio + duracion_minutos
+        minuto_del_dia = inicio % MINUTOS_POR_DIA
+        if minuto_del_dia < self.apertura or minuto_del_dia + duracion_minutos > self.cierre:
+            raise ValueError("La cita queda fuera del horario de atención")
+        return inicio, fin
+
+    def conflictos(self, veterinario, fecha, duracion_minutos=30):
+        """Lista de citas del veterinario que se superponen con el horario indicado"""
+        inicio = _a_minutos(interpretar_fecha(fecha))
+        agenda = self._agenda(veterinario)
+        return [agenda.citas[i] for i in agenda.choques(inicio, inicio + duracion_minutos)]
+
+    def agendar(self, veterinario, mascota, dueño, fecha, motivo, duracion_minutos=30):
+        """
+        Crea una CitaMedica si el veterinario está libre.
+
+        :raises ConflictoHorario: si el horario choca con otra cita
+        :raises ValueError: si la fecha no se reconoce, queda fuera del horario o
+            la duración no es positiva
+        """
+        if duracion_minutos <= 0:
+            raise ValueError("La duración de la cita debe ser mayor que cero")
+        inicio, fin = self._rango(fecha, duracion_minutos)
+        agenda = self._agendas.get(veterinario)
+        if agenda is None:
+            agenda = self._agendas[veterinario] = _AgendaDeVeterinario()
+        choques = agenda.choques(inicio, fin)
+        if choques:
+            raise ConflictoHorario(agenda.citas[choques[0]])
+
+        texto_fecha = _desde_minutos(inicio).strftime(FORMATOS_FECHA[0])
+        if self.clinica is not None:
+            cita = self.clinica.agendar_cita(mascota, texto_fecha, motivo)
+        else:
+            cita = CitaMedica(mascota, dueño, texto_fecha, motivo)
+        cita.veterinario = veterinario
+        cita.inicio_minutos = inicio
+        cita.duracion_minutos = duracion_minutos
+        agenda.insertar(inicio, fin, cita)
+        return cita
+
+    def cancelar(self, cita):
+        """
+        Libera el horario de una cita y, si hay clínica, la quita de su registro.
+
+        :raises ValueError: si la cita no está agendada (por ejemplo, si ya se canceló)
+        """
+        agenda = self._agendas.get(getattr(cita, 'veterinario', None))
+        if agenda is None:
+            raise ValueError("La cita no está agendada")
+        agenda.quitar(cita)
+        if self.clinica is not None:
+            self.clinica.cancelar_cita(cita)
+
+    def proximo_hueco(self, veterinario, desde, duracion_minutos=30, dias_maximos=365):
+        """
+        Primer horario libre de al menos duracion_minutos a partir de 'desde',
+        respetando el horario de atención.
+
+        :return: datetime del inicio del hueco, o None si no hay en dias_maximos días
+        """
+        if duracion_minutos > self.cierre - self.apertura:
+            return None
+        agenda = self._agenda(veterinario)
+        inicios, fines = agenda.inicios, agenda.fines
+        momento = _a_minutos(interpretar_fecha(desde))
+        limite = momento + dias_maximos * MINUTOS_POR_DIA
+
+        # Primera cita que termina después del momento pedido
+        i = bisect.bisect_right(fines, momento)
+        while momento < limite:
+            dia, minuto = divmod(momento, MINUTOS_POR_DIA)
+            if minuto < self.apertura:
+                momento = dia * MINUTOS_POR_DIA + self.apertura
+            elif minuto + duracion_minutos > self.cierre:
+                momento = (dia + 1) * MINUTOS_POR_DIA + self.apertura
+            elif i < len(inicios) and inicios[i] < momento + duracion_minutos:
+                # Choca con la cita i: se prueba justo después de ella
+                momento = max(momento, fines[i])
+                i += 1
+            else:
+                return _desde_minutos(momento)
+        return None
+
+    def citas_entre(self, veterinario, desde, hasta):
+        """Citas del veterinario que empiezan en [desde, hasta)"""
+        agenda = self._agenda(veterinario)
+        i = bisect.bisect_left(agenda.inicios, _a_minutos(interpretar_fecha(desde)))
+        j = bisect.bisect_left(agenda.inicios, _a_minutos(interpretar_fecha(hasta)))
+        return agenda.citas[i:j]
+
+    def __len__(self):
+        return sum(len(agenda.citas) for agenda in self._agendas.values())
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from EjemploMundoReal1 import Dueño, Perro
+
+    rng = random.Random(0)
+    dueño = Dueño("María López", "555-1234", "maria@email.com")
+    mascota = Perro("Max", 3, 12.5, "Labrador")
+    veterinarios = [f"Dr. {i}" for i in range(20)]
+    agenda = AgendaVeterinaria()
+    inicio_año = datetime.datetime(2025, 1, 1)
+
+    # Un año de pedidos al azar en franjas de 15 minutos; los que chocan se rechazan
+    pedidos = []
+    for _ in range(200_000):
+        dia = inicio_año + datetime.timedelta(days=rng.randrange(365))
+        hora = dia.replace(hour=9) + datetime.timedelta(minutes=15 * rng.randrange(34))
+        pedidos.append((rng.choice(veterinarios), hora, rng.choice((15, 30, 45, 60))))
+
+    inicio = time.perf_counter()
+    rechazados = 0
+    for veterinario, fecha, duracion in pedidos:
+        try:
+            agenda.agendar(veterinario, mascota, dueño, fecha, "Consulta", duracion)
+        except ValueError:
+            rechazados += 1
+    duracion_agendar = time.perf_counter() - inicio
+
+    consultas = [(rng.choice(veterinarios), inicio_año + datetime.timedelta(minutes=rng.randrange(525_600)))
+                 for _ in range(100_000)]
+    inicio = time.perf_counter()
+    for veterinario, fecha in consultas:
+        agenda.proximo_hueco(veterinario, fecha, 30)
+    duracion_huecos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for veterinario, fecha in consultas:
+        agenda.conflictos(veterinario, fecha, 30)
+    duracion_conflictos = time.perf_counter() - inicio
+
+    print("=== AGENDA DE UN AÑO ===")
+    print(f"{len(pedidos)} pedidos: {len(agenda)} citas agendadas, {rechazados} rechazados "
+          f"en {duracion_agendar:.2f} s ({len(pedidos) / duracion_agendar:,.0f} pedidos/s)")
+    print(f"{len(consultas)} búsquedas de próximo hueco en {duracion_huecos:.2f} s "
+          f"({len(consultas) / duracion_huecos:,.0f}/s)")
+    print(f"{len(consultas)} comprobaciones de conflicto en {duracion_conflictos:.2f} s "
+          f"({len(consultas) / duracion_conflictos:,.0f}/s)")
+    print(f"Próximo hueco de 60 min para Dr. 0 desde el 1 de marzo: "
+          f"{agenda.proximo_hueco('Dr. 0', '2025-03-01 09:00', 60)}")
@@ -0,0 +1,272 @@
+"""
+Registro central de la clínica veterinaria.
+
+En EjemploMundoReal1.py cada Dueño guarda sus mascotas en una lista y no hay un
+lugar donde estén todas: encontrar una mascota por nombre o a un dueño por
+teléfono obliga a recorrer a todos los dueños. Clinica mantiene índices
+(diccionarios) que se actualizan al registrar, así que cada búsqueda cuesta O(1):
+- dueños por teléfono (solo los dígitos) y por email (sin distinguir mayúsculas);
+- mascotas por nombre (puede haber varias con el mismo nombre) y por especie;
+- dueño de cada mascota y citas de cada mascota.
+
+El registro completo se puede guardar y cargar desde un archivo JSON.
+"""
+
+import datetime
+import json
+
+from EjemploMundoReal1 import CitaMedica, Dueño, Gato, Perro
+
+
+def normalizar_telefono(telefono):
+    """Deja solo los dígitos: '555-1234' y '555 1234' son el mismo teléfono"""
+    return "".join(caracter for caracter in telefono if caracter.isdigit())
+
+
+def normalizar_email(email):
+    return email.strip().lower()
+
+
+def normalizar_nombre(nombre):
+    return nombre.strip().casefold()
+
+
+class Clinica:
+    """Registro de dueños, mascotas y citas con búsquedas indexadas"""
+
+    def __init__(self, nombre="Clínica Veterinaria"):
+        self.nombre = nombre
+        self.dueños = []
+        self.citas = {}  # Diccionario usado como conjunto ordenado: se quitan citas en O(1)
+
+        # Índices
+        self._dueños_por_telefono = {}
+        self._dueños_por_email = {}
+        self._mascotas_por_nombre = {}
+        self._mascotas_por_especie = {}
+        self._dueño_de_mascota = {}
+        self._citas_por_mascota = {}  # mascota -> {cita: None}
+
+    # ----- Registro -----
+
+    def registrar_dueño(self, dueño):
+        """
+        Agrega un dueño (y las mascotas que ya tenga) al registro.
+        El teléfono debe tener algún dígito, y ni el teléfono ni el email pueden
+        estar repetidos.
+        """
+        telefono = normalizar_telefono(dueño.telefono)
+        email = normalizar_email(dueño.email)
+        if not telefono:
+            raise ValueError(f"El teléfono de {dueño.nombre} no tiene dígitos: {dueño.telefono!r}")
+        if telefono in self._dueños_por_telefono:
+            raise ValueError(f"Ya hay un dueño registrado con el teléfono {dueño.telefono}")
+        if email in self._dueños_por_email:
+            raise ValueError(f"Ya hay un dueño registrado con el email {dueño.email}")
+
+        self.dueños.append(dueño)
+        self._dueños_por_telefono[telefono] = dueño
+        self._dueños_por_email[email] = dueño
+        for mascota in dueño.mascotas:
+            self._indexar_mascota(dueño, mascota)
+        return dueño
+
+    def registrar_mascota(self, dueño, mascota):
+        """Asigna una mascota a un dueño ya registrado y la indexa"""
+        if self._dueños_por_telefono.get(normalizar_telefono(dueño.telefono)) is not dueño:
+            raise ValueError(f"{dueño.nombre} no está registrado en la clínica")
+        if mascota in self._dueño_de_mascota:
+            raise ValueError(f"{mascota.nombre} ya está registrado/a en la clínica")
+        dueño.mascotas.append(mascota)
+        self._indexar_mascota(dueño, mascota)
+        return mascota
+
+    def _indexar_mascota(self, dueño, mascota):
+        self._dueño_de_mascota[mascota] = dueño
+        self._mascotas_por_nombre.setdefault(normalizar_nombre(mascota.nombre), []).append(mascota)
+        self._mascotas_por_especie.setdefault(mascota._especie, []).append(mascota)
+
+    def renombrar_mascota(self, mascota, nuevo_nombre):
+        """Cambia el nombre de una mascota manteniendo el índice por nombre al día"""
+        anterior = mascota.nombre
+        mascota.nombre = nuevo_nombre  # El setter valida el nombre
+        if mascota.nombre != anterior:
+            self._mascotas_por_nombre[normalizar_nombre(anterior)].remove(mascota)
+            self._mascotas_por_nombre.setdefault(normalizar_nombre(mascota.nombre), []).append(mascota)
+
+    def agendar_cita(self, mascota, fecha, motivo):
+        """Crea una cita para una mascota registrada"""
+        dueño = self._dueño_de_mascota.get(mascota)
+        if dueño is None:
+            raise ValueError(f"{mascota.nombre} no está registrado/a en la clínica")
+        cita = CitaMedica(mascota, dueño, fecha, motivo)
+        self.citas[cita] = None
+        self._citas_por_mascota.setdefault(mascota, {})[cita] = None
+        return cita
+
+    def cancelar_cita(self, cita):
+        """Quita una cita del registro de la clínica y del índice de su mascota"""
+        del self.citas[cita]
+        citas_mascota = self._citas_por_mascota[cita.mascota]
+        del citas_mascota[cita]
+        if not citas_mascota:
+            del self._citas_por_mascota[cita.mascota]
+
+    # ----- Búsquedas -----
+
+    def buscar_dueño_por_telefono(self, telefono):
+        """Devuelve el dueño con ese teléfono, o None"""
+        return self._dueños_por_telefono.get(normalizar_telefono(telefono))
+
+    def buscar_dueño_por_email(self, email):
+        return self._dueños_por_email.get(normalizar_email(email))
+
+    def buscar_mascotas(self, nombre):
+        """Lista de mascotas con ese nombre (sin distinguir mayúsculas)"""
+        return list(self._mascotas_por_nombre.get(normalizar_nombre(nombre), ()))
+
+    def mascotas_de_especie(self, especie):
+        """Lista de mascotas de una especie ('Perro', 'Gato', ...)"""
+        return list(self._mascotas_por_especie.get(especie, ()))
+
+    def dueño_de(self, mascota):
+        return self._dueño_de_mascota.get(mascota)
+
+    def citas_de(self, mascota):
+        return list(self._citas_por_mascota.get(mascota, ()))
+
+    def __len__(self):
+        """Cantidad de mascotas registradas"""
+        return len(self._dueño_de_mascota)
+
+    # ----- Archivo -----
+
+    def guardar(self, ruta):
+        """Guarda dueños, mascotas y citas en un archivo JSON"""
+        # Posición de cada mascota en la lista de su dueño, calculada una sola vez
+        posiciones = {mascota: i for dueño in self.dueños for i, mascota in enumerate(dueño.mascotas)}
+        datos = {
+            "nombre": self.nombre,
+            "dueños": [
+                {
+                    "nombre": dueño.nombre,
+                    "telefono": dueño.telefono,
+                    "email": dueño.email,
+                    "mascotas": [_mascota_a_dict(mascota) for mascota in dueño.mascotas],
+                }
+                for dueño in self.dueños
+            ],
+            "citas": [
+                {
+                    "telefono": cita.dueño.telefono,
+                    "mascota": posiciones[cita.mascota],
+                    "fecha": cita.fecha,
+                    "motivo": cita.motivo,
+                    "diagnostico": cita.diagnostico,
+                    "tratamiento": cita.tratamiento,
+                }
+                for cita in self.citas
+            ],
+        }
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo, ensure_ascii=False)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Crea una clínica a partir de un archivo JSON con el formato de guardar().
+        Las citas identifican a la mascota por el teléfono del dueño y la posición
+        de la mascota en su lista.
+        """
+        with open(ruta, encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+
+        clinica = cls(datos.get("nombre", "Clínica Veterinaria"))
+        for datos_dueño in datos.get("dueños", []):
+            dueño = Dueño(datos_dueño["nombre"], datos_dueño["telefono"], datos_dueño["email"])
+            dueño.mascotas.extend(_mascota_desde_dict(d) for d in datos_dueño.get("mascotas", []))
+            clinica.registrar_dueño(dueño)
+
+        for datos_cita in datos.get("citas", []):
+            dueño = clinica.buscar_dueño_por_telefono(datos_cita["telefono"])
+            if dueño is None:
+                raise ValueError(f"Cita con un teléfono no registrado: {datos_cita['telefono']}")
+            cita = clinica.agendar_cita(dueño.mascotas[datos_cita["mascota"]],
+                                        datos_cita["fecha"], datos_cita["motivo"])
+            cita.diagnostico = datos_cita.get("diagnostico")
+            cita.tratamiento = datos_cita.get("tratamiento")
+        return clinica
+
+
+def _mascota_a_dict(mascota):
+    datos = {
+        "especie": mascota._especie,
+        "nombre": mascota.nombre,
+        "edad": mascota._edad,
+        "peso": mascota._peso,
+        "vacunas": [[nombre, fecha.isoformat()] for nombre, fecha in mascota._vacunas.con_fechas()],
+    }
+    if isinstance(mascota, Perro):
+        datos.update(raza=mascota._raza, entrenado=mascota._entrenado)
+    elif isinstance(mascota, Gato):
+        datos.update(color=mascota._color, caza_ratones=mascota._caza_ratones)
+    return datos
+
+
+def _mascota_desde_dict(datos):
+    """Crea un Perro o un Gato sin imprimir los mensajes de registro"""
+    if datos["especie"] == "Perro":
+        mascota = Perro(datos["nombre"], datos["edad"], datos["peso"], datos.get("raza", ""))
+        mascota._entrenado = datos.get("entrenado", False)
+    elif datos["especie"] == "Gato":
+        mascota = Gato(datos["nombre"], datos["edad"], datos["peso"], datos.get("color", ""))
+        mascota._caza_ratones = datos.get("caza_ratones", False)
+    else:
+        raise ValueError(f"Especie no soportada: {datos['especie']}")
+    for nombre, fecha in datos.get("vacunas", []):
+        mascota._vacunas.agregar(nombre, datetime.date.fromisoformat(fecha))
+    return mascota
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(0)
+    nombres = ("Max", "Luna", "Bobby", "Rocky", "Nala", "Simba", "Coco", "Toby", "Kira", "Milo")
+    clinica = Clinica()
+    for i in range(100_000):
+        dueño = clinica.registrar_dueño(Dueño(f"Dueño {i}", f"555-{i:07d}", f"dueño{i}@email.com"))
+        for _ in range(rng.randint(1, 3)):
+            nombre = f"{rng.choice(nombres)} {rng.randint(1, 999)}"
+            if rng.random() < 0.5:
+                mascota = Perro(nombre, rng.randint(1, 15), rng.randint(2, 40), "Mestizo")
+            else:
+                mascota = Gato(nombre, rng.randint(1, 15), rng.randint(2, 8), "Gris")
+            clinica.registrar_mascota(dueño, mascota)
+
+    consultas = [f"555-{rng.randrange(100_000):07d}" for _ in range(1_000)]
+
+    inicio = time.perf_counter()
+    for telefono in consultas:
+        clinica.buscar_dueño_por_telefono(telefono)
+    indexado = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for telefono in consultas[:100]:
+        next(d for d in clinica.dueños if d.telefono == telefono)
+    recorrido = (time.perf_counter() - inicio) * 10  # Escalado a 1000 consultas
+
+    print(f"{len(clinica.dueños)} dueños, {len(clinica)} mascotas")
+    print(f"1000 búsquedas por teléfono: índice {indexado * 1000:.2f} ms, recorrido ~{recorrido * 1000:.0f} ms")
+    print(f"Mascotas llamadas 'Luna 7': {len(clinica.buscar_mascotas('luna 7'))}")
+    print(f"Perros: {len(clinica.mascotas_de_especie('Perro'))}, Gatos: {len(clinica.mascotas_de_especie('Gato'))}")
+
+    with tempfile.TemporaryDirectory() as temporal:
+        ruta = os.path.join(temporal, "clinica.json")
+        clinica.guardar(ruta)
+        inicio = time.perf_counter()
+        copia = Clinica.cargar(ruta)
+        print(f"Registro guardado y cargado en {time.perf_counter() - inicio:.2f} s ({len(copia)} mascotas)")
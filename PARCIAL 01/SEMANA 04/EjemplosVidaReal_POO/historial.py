@@ -0,0 +1,317 @@
+"""
+Historial médico compacto para la clínica veterinaria.
+
+- Catalogo asigna un código entero a cada texto repetido (nombres de vacunas,
+  motivos, diagnósticos, tratamientos), así cada texto se guarda una sola vez.
+- RegistroVacunas guarda las vacunas de una mascota como dos arreglos: código
+  de vacuna (2 bytes) y fecha como ordinal (8 bytes).
+- AlmacenHistorial es un almacén de solo agregado con las citas de todas las
+  mascotas: cada cita es un registro binario de tamaño fijo y cada mascota
+  tiene un índice con la posición de sus registros, así que el historial se lee
+  por páginas sin cargar el de toda la cadena de clínicas.
+"""
+
+import datetime
+import json
+import os
+import struct
+from array import array
+from collections import namedtuple
+
+
+class Catalogo:
+    """Asigna un código entero estable a cada texto distinto"""
+
+    def __init__(self, textos=()):
+        self._codigos = {}
+        self._textos = []
+        for texto in textos:
+            self.codigo(texto)
+
+    def codigo(self, texto):
+        """Código del texto; si es nuevo, se le asigna el siguiente"""
+        codigo = self._codigos.get(texto)
+        if codigo is None:
+            codigo = self._codigos[texto] = len(self._textos)
+            self._textos.append(texto)
+        return codigo
+
+    def texto(self, codigo):
+        return self._textos[codigo]
+
+    def __len__(self):
+        return len(self._textos)
+
+
+# Catálogo común de vacunas de todas las mascotas
+CATALOGO_VACUNAS = Catalogo()
+
+
+class RegistroVacunas:
+    """Vacunas de una mascota como códigos y fechas en arreglos compactos"""
+
+    def __init__(self, catalogo=CATALOGO_VACUNAS):
+        self.catalogo = catalogo
+        self._codigos = array('H')
+        self._fechas = array('l')  # Fecha como ordinal
+        self._texto = None  # Texto de la última visualización
+
+    def agregar(self, nombre, fecha=None):
+        self._codigos.append(self.catalogo.codigo(nombre))
+        self._fechas.append((fecha or datetime.date.today()).toordinal())
+        self._texto = None
+
+    def __len__(self):
+        return len(self._codigos)
+
+    def __iter__(self):
+        """Nombres de las vacunas en el orden en que se aplicaron"""
+        return (self.catalogo.texto(codigo) for codigo in self._codigos)
+
+    def con_fechas(self):
+        """Genera las tuplas (nombre, fecha) en el orden en que se aplicaron"""
+        for codigo, ordinal in zip(self._codigos, self._fechas):
+            yield self.catalogo.texto(codigo), datetime.date.fromordinal(ordinal)
+
+    def texto(self, maximo=10):
+        """
+        Texto para mostrar: las últimas 'maximo' vacunas y cuántas hay antes.
+        Solo se arma cuando se pide y se reutiliza hasta la próxima vacuna.
+        """
+        if self._texto is None or self._texto[0] != maximo:
+            recientes = self._codigos[-maximo:] if maximo else self._codigos
+            texto = ', '.join(self.catalogo.texto(codigo) for codigo in recientes)
+            anteriores = len(self._codigos) - len(recientes)
+            if anteriores:
+                texto = f"{texto} (+{anteriores} anteriores)"
+            self._texto = (maximo, texto)
+        return self._texto[1]
+
+
+EntradaHistorial = namedtuple("EntradaHistorial", "fecha motivo diagnostico tratamiento")
+
+# Registro de una cita: mascota, fecha (minutos desde el ordinal 0), motivo,
+# diagnóstico y tratamiento (códigos del catálogo; 0 = sin dato)
+_REGISTRO = struct.Struct('<QqIII')
+_SIN_DATO = 0
+
+
+class AlmacenHistorial:
+    """
+    Historial de citas de todas las mascotas, de solo agregado y paginado.
+
+    Con un directorio, los registros van a 'historial.bin' y los textos nuevos a
+    'textos.jsonl' (ambos solo crecen); al abrirlo se reconstruye el índice por
+    mascota con una lectura secuencial. Los archivos quedan abiertos para agregar
+    hasta cerrar() o el final del bloque with. Sin directorio, todo queda en memoria.
+    """
+
+    def __init__(self, directorio=None):
+        self.directorio = directorio
+        self._textos = Catalogo([""])  # El código 0 es "sin dato"
+        self._indice = {}  # id de mascota -> array('q') con los números de registro
+        self._registros = 0
+        self._memoria = bytearray() if directorio is None else None
+        self._archivo_registros = None
+        self._archivo_textos = None
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+            self._ruta_registros = os.path.join(directorio, "historial.bin")
+            self._ruta_textos = os.path.join(directorio, "textos.jsonl")
+            self._abrir()
+
+    def _abrir(self):
+        """
+        Carga el catálogo y reconstruye el índice. Si el proceso se cortó a mitad
+        de una escritura, descarta la línea de texto incompleta, el registro
+        truncado del final y los registros que usan códigos fuera del catálogo,
+        y recorta los archivos para que los agregados sigan alineados.
+        """
+        if os.path.exists(self._ruta_textos):
+            validos = 0
+            with open(self._ruta_textos, 'rb') as archivo:
+                for linea in archivo:
+                    try:
+                        if not linea.endswith(b"\n"):
+                            raise ValueError("línea incompleta")
+                        texto = json.loads(linea.decode('utf-8'))
+                    except ValueError:
+                        break
+                    self._textos.codigo(texto)
+                    validos += len(linea)
+            self._recortar(self._ruta_textos, validos)
+        if os.path.exists(self._ruta_registros):
+            cantidad = len(self._textos)
+            valido = True
+            with open(self._ruta_registros, 'rb') as archivo:
+                while valido:
+                    bloque = archivo.read(_REGISTRO.size * 4096)
+                    # Solo el último bloque puede ser corto: el resto de un registro truncado se descarta
+                    completos = len(bloque) - len(bloque) % _REGISTRO.size
+                    if not completos:
+                        break
+                    for id_mascota, _minutos, *codigos in _REGISTRO.iter_unpack(bloque[:completos]):
+                        if max(codigos) >= cantidad:
+                            valido = False
+                            break
+                        self._indexar(id_mascota)
+            self._recortar(self._ruta_registros, self._registros * _REGISTRO.size)
+
+    @staticmethod
+    def _recortar(ruta, tamaño):
+        """Descarta lo que sigue a los primeros 'tamaño' bytes válidos del archivo"""
+        if os.path.getsize(ruta) > tamaño:
+            with open(ruta, 'r+b') as archivo:
+                archivo.truncate(tamaño)
+
+    def _indexar(self, id_mascota):
+        posiciones = self._indice.get(id_mascota)
+        if posiciones is None:
+            posiciones = self._indice[id_mascota] = array('q')
+        posiciones.append(self._registros)
+        self._registros += 1
+
+    def _codigo(self, texto):
+        if not texto:
+            return _SIN_DATO
+        cantidad = len(self._textos)
+        codigo = self._textos.codigo(texto)
+        if codigo == cantidad and self.directorio is not None:
+            if self._archivo_textos is None:
+                self._archivo_textos = open(self._ruta_textos, 'a', encoding='utf-8')
+            self._archivo_textos.write(json.dumps(texto, ensure_ascii=False) + "\n")
+        return codigo
+
+    def registrar(self, id_mascota, fecha, motivo, diagnostico=None, tratamiento=None):
+        """Agrega una cita al historial de una mascota (id entero)"""
+        minutos = fecha.toordinal() * 1440 + getattr(fecha, 'hour', 0) * 60 + getattr(fecha, 'minute', 0)
+        cantidad = len(self._textos)
+        datos = _REGISTRO.pack(id_mascota, minutos, self._codigo(motivo),
+                               self._codigo(diagnostico), self._codigo(tratamiento))
+        if len(self._textos) > cantidad and self._archivo_textos is not None:
+            # Los textos nuevos llegan al disco antes que el registro que los usa
+            self._archivo_textos.flush()
+        if self._memoria is not None:
+            self._memoria += datos
+        else:
+            if self._archivo_registros is None:
+                self._archivo_registros = open(self._ruta_registros, 'ab')
+            self._archivo_registros.write(datos)
+        self._indexar(id_mascota)
+
+    def registrar_cita(self, id_mascota, cita):
+        """Agrega una CitaMedica al historial de una mascota"""
+        # Importación local: agenda_citas importa EjemploMundoReal1, que importa este módulo
+        from agenda_citas import interpretar_fecha
+
+        self.registrar(id_mascota, interpretar_fecha(cita.fecha), cita.motivo,
+                       cita.diagnostico, cita.tratamiento)
+
+    def cantidad(self, id_mascota):
+        return len(self._indice.get(id_mascota, ()))
+
+    def vaciar(self):
+        """Escribe en disco lo que quedó en los búferes de los archivos"""
+        for archivo in (self._archivo_registros, self._archivo_textos):
+            if archivo is not None:
+                archivo.flush()
+
+    def cerrar(self):
+        self.vaciar()
+        for archivo in (self._archivo_registros, self._archivo_textos):
+            if archivo is not None:
+                archivo.close()
+        self._archivo_registros = self._archivo_textos = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+        return False
+
+    def _leer(self, numeros):
+        if self._memoria is not None:
+            return [_REGISTRO.unpack_from(self._memoria, n * _REGISTRO.size) for n in numeros]
+        self.vaciar()
+        registros = []
+        with open(self._ruta_registros, 'rb') as archivo:
+            for numero in numeros:
+                archivo.seek(numero * _REGISTRO.size)
+                registros.append(_REGISTRO.unpack(archivo.read(_REGISTRO.size)))
+        return registros
+
+    def pagina(self, id_mascota, numero_pagina=0, tamaño_pagina=20, recientes_primero=True):
+        """Lista de EntradaHistorial de una página del historial de la mascota"""
+        posiciones = self._indice.get(id_mascota, array('q'))
+        total = len(posiciones)
+        desde = numero_pagina * tamaño_pagina
+        if recientes_primero:
+            numeros = posiciones[max(0, total - desde - tamaño_pagina):max(0, total - desde)][::-1]
+        else:
+            numeros = posiciones[desde:desde + tamaño_pagina]
+
+        entradas = []
+        for _id, minutos, motivo, diagnostico, tratamiento in self._leer(numeros):
+            dia, minuto = divmod(minutos, 1440)
+            fecha = datetime.datetime.fromordinal(dia) + datetime.timedelta(minutes=minuto)
+            entradas.append(EntradaHistorial(fecha, self._textos.texto(motivo),
+                                             self._textos.texto(diagnostico) or None,
+                                             self._textos.texto(tratamiento) or None))
+        return entradas
+
+    def mostrar(self, id_mascota, tamaño_pagina=20):
+        """Genera las líneas del historial página por página, solo a medida que se recorren"""
+        numero_pagina = 0
+        while True:
+            entradas = self.pagina(id_mascota, numero_pagina, tamaño_pagina)
+            if not entradas:
+                return
+            for entrada in entradas:
+                linea = f"{entrada.fecha:%Y-%m-%d %H:%M} {entrada.motivo}"
+                if entrada.diagnostico:
+                    linea += f" | Diagnóstico: {entrada.diagnostico}"
+                if entrada.tratamiento:
+                    linea += f" | Tratamiento: {entrada.tratamiento}"
+                yield linea
+            numero_pagina += 1
+
+
+if __name__ == "__main__":
+    import itertools
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(0)
+    motivos = ("Revisión anual", "Vacunación", "Control de peso", "Cojera", "Problemas digestivos")
+    diagnosticos = ("Saludable", "Sobrepeso", "Otitis", "Gastroenteritis", "Esguince")
+    tratamientos = ("Ninguno", "Dieta", "Antibiótico", "Antiinflamatorio", "Reposo")
+
+    with tempfile.TemporaryDirectory() as temporal:
+        inicio = time.perf_counter()
+        with AlmacenHistorial(temporal) as almacen:
+            for n in range(500_000):
+                fecha = datetime.datetime(2000, 1, 1) + datetime.timedelta(minutes=n * 37)
+                almacen.registrar(rng.randrange(5_000), fecha, rng.choice(motivos),
+                                  rng.choice(diagnosticos), rng.choice(tratamientos))
+        duracion = time.perf_counter() - inicio
+        print(f"500000 citas registradas en {duracion:.2f} s, "
+              f"{os.path.getsize(almacen._ruta_registros) / 1e6:.1f} MB en disco")
+
+        inicio = time.perf_counter()
+        reabierto = AlmacenHistorial(temporal)
+        print(f"Índice reconstruido en {time.perf_counter() - inicio:.2f} s")
+
+        inicio = time.perf_counter()
+        lineas = list(itertools.islice(reabierto.mostrar(42), 5))
+        print(f"Primeras 5 líneas del historial de la mascota 42 "
+              f"({reabierto.cantidad(42)} citas) en {(time.perf_counter() - inicio) * 1000:.2f} ms:")
+        for linea in lineas:
+            print(f"  {linea}")
+
+    vacunas = RegistroVacunas()
+    for año in range(2000, 2025):
+        vacunas.agregar("Rabia", datetime.date(año, 3, 1))
+        vacunas.agregar("Moquillo", datetime.date(año, 9, 1))
+    print(f"\n{len(vacunas)} vacunas: {vacunas.texto(maximo=4)}")
@@ -0,0 +1,258 @@
+"""
+Calculadora de IMC por lotes
+
+calcular_imc() y clasificar_imc() atienden a una persona a la vez. Este módulo
+procesa conjuntos de datos de población con millones de filas:
+
+- Lee el archivo CSV por bloques de columnas (peso y altura), así que la
+  memoria usada no depende del tamaño del archivo.
+- Calcula el IMC de todo el bloque de una vez (vectorizado con NumPy si está
+  instalado; si no, con bucles sobre arreglos array).
+- Clasifica cada IMC buscando su posición entre los umbrales de la OMS
+  (searchsorted en NumPy, bisect sin NumPy) en lugar de encadenar if/elif.
+"""
+
+import csv
+import math
+from array import array
+from bisect import bisect_right
+from typing import Callable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+# Umbrales de la OMS: la clasificación es la cantidad de umbrales <= IMC
+UMBRALES_OMS = (18.5, 25.0, 30.0)
+CLASIFICACIONES = ("Bajo peso", "Peso normal", "Sobrepeso", "Obesidad")
+
+TAMAÑO_BLOQUE = 100_000
+MAXIMO_FILAS_DESCARTADAS = 1_000  # Filas inválidas que el resumen guarda como ejemplo
+
+
+def _columna(valores):
+    """Vista de una columna array('d') como arreglo NumPy (sin copiar) si está disponible"""
+    return np.frombuffer(valores, dtype=np.float64) if np is not None else valores
+
+
+def _es_positivo(valor: float) -> bool:
+    """Finito y mayor que cero (NaN no pasa: cualquier comparación con NaN es falsa)"""
+    return 0 < valor < math.inf
+
+
+def calcular_imc_lote(pesos_kg, alturas_m, primera_fila: int = 0):
+    """
+    Calcula el IMC de una columna de pesos y otra de alturas
+
+    Args:
+        pesos_kg: pesos en kilogramos (array('d'), lista o arreglo NumPy)
+        alturas_m: alturas en metros, en el mismo orden
+        primera_fila: número de fila del primer valor, para los mensajes de error
+
+    Returns:
+        Columna de IMC redondeados a 2 decimales, como calcular_imc()
+    """
+    if len(pesos_kg) != len(alturas_m):
+        raise ValueError("Las columnas de peso y altura deben tener la misma longitud.")
+
+    if np is not None:
+        pesos = np.asarray(pesos_kg, dtype=np.float64)
+        alturas = np.asarray(alturas_m, dtype=np.float64)
+        validos = (pesos > 0) & (pesos < np.inf) & (alturas > 0) & (alturas < np.inf)
+        invalidos = np.flatnonzero(~validos)
+        if invalidos.size:
+            raise ValueError("El peso y la altura deben ser valores positivos y finitos "
+                             f"(fila {primera_fila + int(invalidos[0])}).")
+        return np.round(pesos / (alturas * alturas), 2)
+
+    imcs = array('d', bytes(8 * len(pesos_kg)))
+    for i, (peso, altura) in enumerate(zip(pesos_kg, alturas_m)):
+        if not (_es_positivo(peso) and _es_positivo(altura)):
+            raise ValueError(f"El peso y la altura deben ser valores positivos y finitos (fila {primera_fila + i}).")
+        imcs[i] = round(peso / (altura * altura), 2)
+    return imcs
+
+
+def clasificar_imc_lote(imcs):
+    """
+    Clasifica una columna de IMC según los estándares de la OMS
+
+    Args:
+        imcs: columna de valores de IMC
+
+    Returns:
+        Columna de códigos (índices de CLASIFICACIONES), uno por IMC
+    """
+    if np is not None:
+        return np.searchsorted(UMBRALES_OMS, np.asarray(imcs, dtype=np.float64), side='right').astype(np.uint8)
+    return array('B', [bisect_right(UMBRALES_OMS, imc) for imc in imcs])
+
+
+def leer_csv_por_bloques(ruta: str, columna_peso: str = "peso_kg", columna_altura: str = "altura_m",
+                         tamaño_bloque: int = TAMAÑO_BLOQUE,
+                         al_descartar: Optional[Callable[[int, List[str]], None]] = None
+                         ) -> Iterator[Tuple[array, array]]:
+    """
+    Lee un CSV con encabezado y devuelve sus columnas de peso y altura por bloques
+
+    Las filas con un peso o una altura vacíos, no numéricos, no finitos (nan, inf)
+    o no positivos se descartan sin detener la lectura.
+
+    Args:
+        ruta: archivo CSV
+        columna_peso: nombre de la columna con el peso en kilogramos
+        columna_altura: nombre de la columna con la altura en metros
+        tamaño_bloque: filas por bloque
+        al_descartar: función opcional que recibe (número de línea en el archivo, fila)
+            por cada fila descartada
+
+    Returns:
+        Generador de tuplas (pesos, alturas), cada una un array('d') de hasta tamaño_bloque filas
+    """
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        lector = csv.reader(archivo)
+        encabezado = next(lector, None)
+        if encabezado is None:
+            return
+        try:
+            i_peso = encabezado.index(columna_peso)
+            i_altura = encabezado.index(columna_altura)
+        except ValueError:
+            raise ValueError(f"El archivo debe tener las columnas '{columna_peso}' y '{columna_altura}'.")
+
+        pesos, alturas = array('d'), array('d')
+        for fila in lector:
+            try:
+                peso = float(fila[i_peso])
+                altura = float(fila[i_altura])
+            except (IndexError, ValueError):
+                peso = altura = math.nan
+            if not (_es_positivo(peso) and _es_positivo(altura)):
+                if al_descartar is not None:
+                    al_descartar(lector.line_num, fila)
+                continue
+            pesos.append(peso)
+            alturas.append(altura)
+            if len(pesos) == tamaño_bloque:
+                yield pesos, alturas
+                pesos, alturas = array('d'), array('d')
+        if pesos:
+            yield pesos, alturas
+
+
+class ResumenIMC:
+    """Totales acumulados de un procesamiento por lotes"""
+
+    def __init__(self):
+        self.personas = 0
+        self.suma_imc = 0.0
+        self.por_clasificacion = [0] * len(CLASIFICACIONES)
+        self.descartadas = 0
+        self.ejemplos_descartados = []  # (número de línea, fila), hasta MAXIMO_FILAS_DESCARTADAS
+
+    def descartar(self, numero_linea: int, fila: List[str]) -> None:
+        """Cuenta una fila inválida y guarda las primeras como ejemplo"""
+        self.descartadas += 1
+        if len(self.ejemplos_descartados) < MAXIMO_FILAS_DESCARTADAS:
+            self.ejemplos_descartados.append((numero_linea, fila))
+
+    def registrar(self, imcs, codigos) -> None:
+        self.personas += len(imcs)
+        if np is not None:
+            self.suma_imc += float(np.sum(imcs))
+            for codigo, cantidad in enumerate(np.bincount(codigos, minlength=len(CLASIFICACIONES))):
+                self.por_clasificacion[codigo] += int(cantidad)
+        else:
+            self.suma_imc += sum(imcs)
+            for codigo in codigos:
+                self.por_clasificacion[codigo] += 1
+
+    @property
+    def imc_medio(self) -> float:
+        return self.suma_imc / self.personas if self.personas else 0.0
+
+    @property
+    def peso_saludable(self) -> int:
+        """Personas con 18.5 <= IMC < 25"""
+        return self.por_clasificacion[CLASIFICACIONES.index("Peso normal")]
+
+    def __str__(self) -> str:
+        lineas = [f"Personas: {self.personas}", f"IMC medio: {self.imc_medio:.2f}"]
+        for nombre, cantidad in zip(CLASIFICACIONES, self.por_clasificacion):
+            porcentaje = cantidad / self.personas if self.personas else 0.0
+            lineas.append(f"{nombre}: {cantidad} ({porcentaje:.1%})")
+        if self.descartadas:
+            primeras = ", ".join(str(numero) for numero, _fila in self.ejemplos_descartados[:10])
+            lineas.append(f"Filas descartadas: {self.descartadas} (líneas {primeras}"
+                          f"{', ...' if self.descartadas > 10 else ''})")
+        return "\n".join(lineas)
+
+
+def procesar_csv(ruta: str, salida: Optional[str] = None, columna_peso: str = "peso_kg",
+                 columna_altura: str = "altura_m", tamaño_bloque: int = TAMAÑO_BLOQUE) -> ResumenIMC:
+    """
+    Calcula y clasifica el IMC de todas las filas de un CSV, bloque a bloque
+
+    Args:
+        ruta: archivo CSV de entrada
+        salida: si se indica, CSV donde se escribe peso, altura, IMC y clasificación de cada fila
+        columna_peso: nombre de la columna con el peso en kilogramos
+        columna_altura: nombre de la columna con la altura en metros
+        tamaño_bloque: filas por bloque
+
+    Returns:
+        Resumen con la cantidad de personas por clasificación, el IMC medio y las
+        filas descartadas (con su número de línea en el archivo)
+    """
+    resumen = ResumenIMC()
+    archivo_salida = open(salida, 'w', newline='', encoding='utf-8') if salida else None
+    try:
+        if archivo_salida:
+            escritor = csv.writer(archivo_salida)
+            escritor.writerow([columna_peso, columna_altura, "imc", "clasificacion"])
+
+        for pesos, alturas in leer_csv_por_bloques(ruta, columna_peso, columna_altura, tamaño_bloque,
+                                                   resumen.descartar):
+            imcs = calcular_imc_lote(_columna(pesos), _columna(alturas))
+            codigos = clasificar_imc_lote(imcs)
+            resumen.registrar(imcs, codigos)
+            if archivo_salida:
+                escritor.writerows(
+                    (f"{peso:g}", f"{altura:g}", f"{imc:.2f}", CLASIFICACIONES[codigo])
+                    for peso, altura, imc, codigo in zip(pesos, alturas, imcs.tolist(), codigos.tolist())
+                )
+    finally:
+        if archivo_salida:
+            archivo_salida.close()
+    return resumen
+
+
+def main():
+    import os
+    import random
+    import tempfile
+    import time
+
+    filas = 1_000_000
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as temporal:
+        ruta = os.path.join(temporal, "poblacion.csv")
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["id", "peso_kg", "altura_m"])
+            for i in range(filas):
+                escritor.writerow([i, max(round(rng.gauss(72, 14), 1), 30.0), max(round(rng.gauss(1.68, 0.09), 2), 1.2)])
+
+        inicio = time.perf_counter()
+        resumen = procesar_csv(ruta)
+        duracion = time.perf_counter() - inicio
+
+    print("Calculadora de IMC por lotes")
+    print(resumen)
+    print(f"\n{resumen.personas} personas procesadas en {duracion:.2f} s "
+          f"({'NumPy' if np is not None else 'array'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ class Empleado(ABC):
         self._apellido = apellido
         self.__id_empleado = id_empleado  # Atributo privado
         self._fecha_contratacion = datetime.date.today()
+        self._antiguedad_cache = None  # (fecha de corte, años) del último cálculo
     
     # Propiedades (getters) para atributos encapsulados
     @property
@@ -20,7 +21,14 @@ class Empleado(ABC):
     
     @property
     def antiguedad(self):
-        return (datetime.date.today() - self._fecha_contratacion).days // 365
+        return self.antiguedad_al(datetime.date.today())
+    
+    # Antigüedad respecto a una fecha de corte fija (se calcula una vez por fecha)
+    def antiguedad_al(self, fecha_corte):
+        if self._antiguedad_cache is None or self._antiguedad_cache[0] != fecha_corte:
+            anios = (fecha_corte - self._fecha_contratacion).days // 365
+            self._antiguedad_cache = (fecha_corte, anios)
+        return self._antiguedad_cache[1]
     
     # Método abstracto (obliga a las subclases a implementarlo)
     @abstractmethod
@@ -28,13 +36,17 @@ class Empleado(ABC):
         pass
     
     # Método polimórfico que puede ser sobrescrito
-    def mostrar_info(self):
+    def mostrar_info(self, fecha_corte=None):
+        antiguedad = self.antiguedad if fecha_corte is None else self.antiguedad_al(fecha_corte)
         return (f"ID: {self.__id_empleado}, Nombre: {self.nombre_completo}, "
-                f"Antigüedad: {self.antiguedad} años")
+                f"Antigüedad: {antiguedad} años")
     
     # Método estático (no depende de la instancia)
+    # Con un CalendarioLaboral también se descuentan los feriados
     @staticmethod
-    def es_dia_laboral(dia):
+    def es_dia_laboral(dia, calendario=None):
+        if calendario is not None:
+            return calendario.es_laborable(dia)
         if dia.weekday() >= 5:  # 5 y 6 son sábado y domingo
             return False
         return True
@@ -45,13 +57,17 @@ class EmpleadoTiempoCompleto(Empleado):
         super().__init__(nombre, apellido, id_empleado)
         self.__salario_anual = salario_anual
     
+    @property
+    def salario_anual(self):
+        return self.__salario_anual
+    
     # Implementación del método abstracto
     def calcular_salario(self):
         return self.__salario_anual / 12
     
     # Sobrescritura del método mostrar_info
-    def mostrar_info(self):
-        info_base = super().mostrar_info()
+    def mostrar_info(self, fecha_corte=None):
+        info_base = super().mostrar_info(fecha_corte)
         return f"{info_base}, Tipo: Tiempo Completo, Salario mensual: ${self.calcular_salario():.2f}"
     
     # Método específico de esta clase
@@ -65,13 +81,21 @@ class EmpleadoPorHora(Empleado):
         self.__horas_trabajadas = horas_trabajadas
         self.__tarifa_hora = tarifa_hora
     
+    @property
+    def horas_trabajadas(self):
+        return self.__horas_trabajadas
+    
+    @property
+    def tarifa_hora(self):
+        return self.__tarifa_hora
+    
     # Implementación del método abstracto
     def calcular_salario(self):
         return self.__horas_trabajadas * self.__tarifa_hora
     
     # Sobrescritura del método mostrar_info
-    def mostrar_info(self):
-        info_base = super().mostrar_info()
+    def mostrar_info(self, fecha_corte=None):
+        info_base = super().mostrar_info(fecha_corte)
         return (f"{info_base}, Tipo: Por Hora, "
                 f"Horas: {self.__horas_trabajadas}, Tarifa: ${self.__tarifa_hora}/h, "
                 f"Salario: ${self.calcular_salario():.2f}")
@@ -81,11 +105,13 @@ class EmpleadoPorHora(Empleado):
         self.__horas_trabajadas = nuevas_horas
 
 # Función para demostrar polimorfismo
-def procesar_empleados(empleados):
+# La fecha de corte se fija una vez para toda la corrida de nómina
+def procesar_empleados(empleados, fecha_corte=None):
+    fecha_corte = fecha_corte or datetime.date.today()
     total_nomina = 0
     print("\n--- Informe de Empleados ---")
     for emp in empleados:
-        print(emp.mostrar_info())
+        print(emp.mostrar_info(fecha_corte))
         total_nomina += emp.calcular_salario()
     print(f"\nTotal nómina mensual: ${total_nomina:.2f}")
     print("-" * 50)
@@ -0,0 +1,61 @@
+"""
+Calendario laboral precalculado.
+
+Empleado.es_dia_laboral() solo mira el día de la semana. CalendarioLaboral
+marca además los feriados y guarda sumas acumuladas de días laborables, así que
+saber si un día es laborable o contar los días laborables entre dos fechas son
+consultas O(1), sin recorrer las fechas una por una.
+"""
+
+import calendar
+import datetime
+from array import array
+
+
+class CalendarioLaboral:
+    """Días laborables (lunes a viernes que no son feriados) entre dos años"""
+
+    def __init__(self, anio_inicio, anio_fin, feriados=()):
+        self.inicio = datetime.date(anio_inicio, 1, 1)
+        self.fin = datetime.date(anio_fin, 12, 31)
+        self.feriados = frozenset(feriados)
+
+        # acumulados[k] = días laborables en [inicio, inicio + k)
+        total_dias = (self.fin - self.inicio).days + 1
+        self._acumulados = array('l', [0]) * (total_dias + 1)
+        base = self.inicio.toordinal()
+        cuenta = 0
+        for k in range(total_dias):
+            fecha = datetime.date.fromordinal(base + k)
+            if fecha.weekday() < 5 and fecha not in self.feriados:
+                cuenta += 1
+            self._acumulados[k + 1] = cuenta
+
+    def _posicion(self, fecha):
+        if not self.inicio <= fecha <= self.fin:
+            raise ValueError(f"La fecha {fecha} está fuera del calendario ({self.inicio} a {self.fin})")
+        return fecha.toordinal() - self.inicio.toordinal()
+
+    def es_laborable(self, fecha):
+        k = self._posicion(fecha)
+        return self._acumulados[k + 1] > self._acumulados[k]
+
+    def dias_laborables_entre(self, desde, hasta):
+        """Cantidad de días laborables entre dos fechas (ambas incluidas)"""
+        if hasta < desde:
+            return 0
+        return self._acumulados[self._posicion(hasta) + 1] - self._acumulados[self._posicion(desde)]
+
+    def dias_laborables_mes(self, anio, mes):
+        ultimo = calendar.monthrange(anio, mes)[1]
+        return self.dias_laborables_entre(datetime.date(anio, mes, 1), datetime.date(anio, mes, ultimo))
+
+
+if __name__ == "__main__":
+    feriados_2025 = [datetime.date(2025, 1, 1), datetime.date(2025, 5, 1), datetime.date(2025, 12, 25)]
+    calendario_2025 = CalendarioLaboral(2025, 2025, feriados_2025)
+
+    print(f"¿Es laborable el 1 de mayo? {calendario_2025.es_laborable(datetime.date(2025, 5, 1))}")
+    print(f"Días laborables en mayo: {calendario_2025.dias_laborables_mes(2025, 5)}")
+    print(f"Días laborables en el año: "
+          f"{calendario_2025.dias_laborables_entre(calendario_2025.inicio, calendario_2025.fin)}")
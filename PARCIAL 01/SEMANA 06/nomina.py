@@ -0,0 +1,191 @@
+"""
+Nómina por lotes para jerarquías de Empleado.
+
+procesar_empleados() recorre los empleados uno a uno, formatea el texto de
+mostrar_info() y llama a calcular_salario() por despacho virtual. Para nóminas
+de cientos de miles de empleados, NominaPorLotes agrupa a los empleados por tipo
+en columnas (salario_anual, horas, tarifa) y calcula salarios, bonos y totales
+columna a columna. Si NumPy está instalado las operaciones se vectorizan; si no,
+se usan bucles simples sobre arreglos array. Los textos del informe solo se
+generan cuando se piden.
+"""
+
+import datetime
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from POO_Conceptos2 import EmpleadoPorHora, EmpleadoTiempoCompleto
+
+
+def _columna(valores):
+    """Vista de una columna array('d') como arreglo NumPy (sin copiar) si está disponible"""
+    return np.frombuffer(valores, dtype=np.float64) if np is not None else valores
+
+
+def _sumar(valores):
+    return float(valores.sum()) if np is not None else sum(valores)
+
+
+class NominaPorLotes:
+    """Empleados agrupados por tipo en columnas para calcular la nómina en bloque"""
+
+    def __init__(self, empleados=()):
+        # Empleados a tiempo completo
+        self._ids_tc = []
+        self._nombres_tc = []
+        self._contratacion_tc = array('l')  # Fecha de contratación como ordinal
+        self._salario_anual = array('d')
+
+        # Empleados por hora
+        self._ids_ph = []
+        self._nombres_ph = []
+        self._contratacion_ph = array('l')
+        self._horas = array('d')
+        self._tarifa = array('d')
+
+        # Antigüedades calculadas para una fecha de corte: (fecha, columna)
+        self._antiguedades = None
+
+        for empleado in empleados:
+            self.agregar(empleado)
+
+    def __len__(self):
+        return len(self._ids_tc) + len(self._ids_ph)
+
+    def agregar(self, empleado):
+        """Copia los datos de un empleado a la columna de su tipo"""
+        fecha = empleado._fecha_contratacion
+        if isinstance(empleado, EmpleadoTiempoCompleto):
+            self.agregar_tiempo_completo(empleado.id_empleado, empleado.nombre_completo,
+                                         empleado.salario_anual, fecha)
+        elif isinstance(empleado, EmpleadoPorHora):
+            self.agregar_por_hora(empleado.id_empleado, empleado.nombre_completo,
+                                  empleado.horas_trabajadas, empleado.tarifa_hora, fecha)
+        else:
+            raise TypeError(f"Tipo de empleado no soportado: {type(empleado).__name__}")
+
+    def agregar_tiempo_completo(self, id_empleado, nombre_completo, salario_anual, fecha_contratacion=None):
+        """Agrega un empleado a tiempo completo sin crear el objeto"""
+        self._ids_tc.append(id_empleado)
+        self._nombres_tc.append(nombre_completo)
+        self._contratacion_tc.append((fecha_contratacion or datetime.date.today()).toordinal())
+        self._salario_anual.append(salario_anual)
+        self._antiguedades = None
+
+    def agregar_por_hora(self, id_empleado, nombre_completo, horas_trabajadas, tarifa_hora,
+                         fecha_contratacion=None):
+        """Agrega un empleado por hora sin crear el objeto"""
+        self._ids_ph.append(id_empleado)
+        self._nombres_ph.append(nombre_completo)
+        self._contratacion_ph.append((fecha_contratacion or datetime.date.today()).toordinal())
+        self._horas.append(horas_trabajadas)
+        self._tarifa.append(tarifa_hora)
+        self._antiguedades = None
+
+    # ----- Cálculos por columna -----
+
+    def salarios_tiempo_completo(self):
+        """Salario mensual de cada empleado a tiempo completo (salario_anual / 12)"""
+        if np is not None:
+            return _columna(self._salario_anual) / 12
+        return [salario / 12 for salario in self._salario_anual]
+
+    def salarios_por_hora(self):
+        """Salario de cada empleado por hora (horas * tarifa)"""
+        if np is not None:
+            return _columna(self._horas) * _columna(self._tarifa)
+        return [horas * tarifa for horas, tarifa in zip(self._horas, self._tarifa)]
+
+    def bonos(self, porcentaje):
+        """Bono de cada empleado a tiempo completo, como calcular_bono(porcentaje)"""
+        if np is not None:
+            return _columna(self._salario_anual) * (porcentaje / 100)
+        return [salario * porcentaje / 100 for salario in self._salario_anual]
+
+    def total_bonos(self, porcentaje):
+        """Suma de los bonos de todos los empleados a tiempo completo"""
+        return _sumar(_columna(self._salario_anual)) * porcentaje / 100
+
+    def total_nomina(self):
+        """Total de la nómina mensual, igual al que calcula procesar_empleados()"""
+        return _sumar(self.salarios_tiempo_completo()) + _sumar(self.salarios_por_hora())
+
+    # ----- Informe bajo demanda -----
+
+    def antiguedades(self, fecha_corte=None):
+        """
+        Antigüedad en años de cada empleado (primero los de tiempo completo) respecto
+        a una fecha de corte. Se calcula una sola vez por fecha para toda la corrida.
+        """
+        fecha_corte = fecha_corte or datetime.date.today()
+        if self._antiguedades is None or self._antiguedades[0] != fecha_corte:
+            corte = fecha_corte.toordinal()
+            contrataciones = self._contratacion_tc + self._contratacion_ph
+            if np is not None:
+                columna = (corte - np.frombuffer(contrataciones, dtype=contrataciones.typecode)) // 365
+            else:
+                columna = array('l', [(corte - ordinal) // 365 for ordinal in contrataciones])
+            self._antiguedades = (fecha_corte, columna)
+        return self._antiguedades[1]
+
+    def informe(self, inicio=0, cantidad=None, fecha_corte=None):
+        """
+        Genera las líneas del informe con el mismo formato que mostrar_info(), pero solo
+        para el tramo pedido: los textos no se construyen hasta que se recorren.
+        """
+        antiguedades = self.antiguedades(fecha_corte)
+        fin = len(self) if cantidad is None else min(len(self), inicio + cantidad)
+        n_tc = len(self._ids_tc)
+
+        for k in range(inicio, fin):
+            if k < n_tc:
+                salario = self._salario_anual[k] / 12
+                yield (f"ID: {self._ids_tc[k]}, Nombre: {self._nombres_tc[k]}, "
+                       f"Antigüedad: {antiguedades[k]} años, "
+                       f"Tipo: Tiempo Completo, Salario mensual: ${salario:.2f}")
+            else:
+                antiguedad = antiguedades[k]
+                k -= n_tc
+                horas, tarifa = self._horas[k], self._tarifa[k]
+                yield (f"ID: {self._ids_ph[k]}, Nombre: {self._nombres_ph[k]}, "
+                       f"Antigüedad: {antiguedad} años, "
+                       f"Tipo: Por Hora, Horas: {horas:g}, Tarifa: ${tarifa:g}/h, "
+                       f"Salario: ${horas * tarifa:.2f}")
+
+
+def procesar_empleados_por_lotes(nomina, lineas_informe=0, fecha_corte=None):
+    """Versión por lotes de procesar_empleados(): imprime solo las líneas pedidas y el total"""
+    print("\n--- Informe de Empleados ---")
+    for linea in nomina.informe(cantidad=lineas_informe, fecha_corte=fecha_corte):
+        print(linea)
+    if lineas_informe and lineas_informe < len(nomina):
+        print(f"... ({len(nomina) - lineas_informe} empleados más)")
+    print(f"\nTotal nómina mensual: ${nomina.total_nomina():.2f}")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(0)
+    nomina = NominaPorLotes()
+    for i in range(500_000):
+        if rng.random() < 0.6:
+            nomina.agregar_tiempo_completo(f"EMP-{i:06d}", f"Empleado {i}", rng.randint(30_000, 120_000))
+        else:
+            nomina.agregar_por_hora(f"EMP-{i:06d}", f"Empleado {i}", rng.randint(40, 200), rng.randint(10, 40))
+
+    inicio = time.perf_counter()
+    nomina.total_nomina()
+    bonos = nomina.total_bonos(10)
+    duracion = time.perf_counter() - inicio
+
+    procesar_empleados_por_lotes(nomina, lineas_informe=5)
+    print(f"Total bonos (10%): ${bonos:.2f}")
+    print(f"{len(nomina)} empleados calculados en {duracion * 1000:.1f} ms "
+          f"({'NumPy' if np is not None else 'array'})")
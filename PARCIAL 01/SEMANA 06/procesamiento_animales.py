@@ -0,0 +1,179 @@
+"""
+Procesamiento por lotes de flujos mixtos de animales.
+
+describir_animal() resuelve hacer_sonido(), moverse() y __str__ en cada objeto
+(despacho dinámico) y llama a print() cuatro veces por animal. Para millones de
+animales de tipos mezclados, describir_por_lotes():
+- busca los métodos una sola vez por clase concreta;
+- si hacer_sonido() y moverse() de una clase no usan el animal (devuelven
+  siempre lo mismo), arma una sola vez por clase la parte final del texto
+  (sonido, movimiento y separador) y solo llama a __str__ por animal;
+- escribe todo el lote con una sola llamada a write().
+
+El módulo también incluye un benchmark que compara distintas formas de despacho.
+
+Uso:
+    python procesamiento_animales.py --animales 1000000
+"""
+
+import dis
+import inspect
+import io
+import sys
+from contextlib import redirect_stdout
+
+from POO_Conceptos1 import Animal, Pajaro, Perro, describir_animal
+
+SEPARADOR = "-" * 30
+
+
+def descripcion(animal):
+    """Texto que describir_animal() imprime para un animal"""
+    return f"{animal}\n{animal.hacer_sonido()}\n{animal.moverse()}\n{SEPARADOR}\n"
+
+
+def _no_usa_instancia(metodo):
+    """
+    Indica si el método es una función de Python que nunca lee su único
+    parámetro (self), de modo que su resultado es el mismo para todos los animales.
+    """
+    codigo = getattr(metodo, '__code__', None)
+    if (codigo is None or codigo.co_argcount != 1 or codigo.co_kwonlyargcount
+            or codigo.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+            or codigo.co_freevars or codigo.co_cellvars):
+        return False
+    parametro = codigo.co_varnames[0]
+    for instruccion in dis.get_instructions(codigo):
+        valor = instruccion.argval
+        if instruccion.opname.startswith('LOAD_') and (
+                valor == parametro or isinstance(valor, tuple) and parametro in valor):
+            return False
+    return True
+
+
+def _metodos_de_clase(tipo):
+    """(__str__, cola fija del texto o None, hacer_sonido, moverse) de una clase concreta"""
+    a_texto, hacer_sonido, moverse = tipo.__str__, tipo.hacer_sonido, tipo.moverse
+    cola = None
+    if _no_usa_instancia(hacer_sonido) and _no_usa_instancia(moverse):
+        cola = f"\n{hacer_sonido(None)}\n{moverse(None)}\n{SEPARADOR}\n"
+    return a_texto, cola, hacer_sonido, moverse
+
+
+def describir_por_lotes(animales, salida=None, conservar_orden=True):
+    """
+    Escribe la descripción de todos los animales, con el mismo texto que
+    describir_animal(), resolviendo los métodos una vez por clase concreta.
+
+    :param animales: iterable de Animal (o subclases)
+    :param salida: archivo de texto donde escribir (por defecto, la salida estándar)
+    :param conservar_orden: si es False, las descripciones salen agrupadas por clase
+    """
+    textos = []
+    # clase -> (__str__, cola, hacer_sonido, moverse, lista donde van sus textos)
+    por_clase = {}
+
+    for animal in animales:
+        tipo = type(animal)
+        datos = por_clase.get(tipo)
+        if datos is None:
+            datos = por_clase[tipo] = _metodos_de_clase(tipo) + (textos if conservar_orden else [],)
+        a_texto, cola, hacer_sonido, moverse, destino = datos
+        if cola is not None:
+            destino.append(a_texto(animal) + cola)
+        else:
+            destino.append(f"{a_texto(animal)}\n{hacer_sonido(animal)}\n{moverse(animal)}\n{SEPARADOR}\n")
+
+    if not conservar_orden:
+        textos = [texto for *_metodos, grupo in por_clase.values() for texto in grupo]
+    (salida or sys.stdout).write("".join(textos))
+
+
+# ----- Benchmark de despacho -----
+
+def crear_animales(cantidad, semilla=0):
+    import random
+
+    rng = random.Random(semilla)
+    fabricas = (
+        lambda i: Animal(f"Animal {i}", rng.randint(1, 20)),
+        lambda i: Perro(f"Perro {i}", rng.randint(1, 15), rng.choice(("Labrador", "Beagle", "Mestizo"))),
+        lambda i: Pajaro(f"Pájaro {i}", rng.randint(1, 10), rng.choice(("Canario", "Loro", "Gorrión"))),
+    )
+    return [rng.choice(fabricas)(i) for i in range(cantidad)]
+
+
+def _con_describir_animal(animales, salida):
+    with redirect_stdout(salida):
+        for animal in animales:
+            describir_animal(animal)
+
+
+def _con_metodos_virtuales(animales, salida):
+    salida.write("".join(descripcion(animal) for animal in animales))
+
+
+def _con_isinstance(animales, salida):
+    """Despacho manual con una cadena de isinstance (de la clase más específica a la más general)"""
+    textos = []
+    for animal in animales:
+        if isinstance(animal, Perro):
+            sonido, movimiento = Perro.hacer_sonido(animal), Perro.moverse(animal)
+        elif isinstance(animal, Pajaro):
+            sonido, movimiento = Pajaro.hacer_sonido(animal), Pajaro.moverse(animal)
+        else:
+            sonido, movimiento = Animal.hacer_sonido(animal), Animal.moverse(animal)
+        textos.append(f"{animal}\n{sonido}\n{movimiento}\n{SEPARADOR}\n")
+    salida.write("".join(textos))
+
+
+def _con_tabla_de_despacho(animales, salida):
+    """Despacho con un diccionario clase -> funciones, consultado por cada animal"""
+    tabla = {}
+    textos = []
+    for animal in animales:
+        tipo = type(animal)
+        metodos = tabla.get(tipo)
+        if metodos is None:
+            metodos = tabla[tipo] = (tipo.__str__, tipo.hacer_sonido, tipo.moverse)
+        a_texto, hacer_sonido, moverse = metodos
+        textos.append(f"{a_texto(animal)}\n{hacer_sonido(animal)}\n{moverse(animal)}\n{SEPARADOR}\n")
+    salida.write("".join(textos))
+
+
+ESTRATEGIAS = (
+    ("describir_animal (print)", _con_describir_animal),
+    ("métodos virtuales", _con_metodos_virtuales),
+    ("cadena de isinstance", _con_isinstance),
+    ("tabla de despacho", _con_tabla_de_despacho),
+    ("por lotes (orden original)", describir_por_lotes),
+    ("por lotes (agrupado)", lambda animales, salida: describir_por_lotes(animales, salida, False)),
+)
+
+
+def benchmark(cantidad, repeticiones=3):
+    import time
+
+    animales = crear_animales(cantidad)
+    referencia = None
+    print(f"{cantidad} animales mezclados (mejor de {repeticiones} corridas)")
+    for nombre, estrategia in ESTRATEGIAS:
+        mejor = None
+        for _ in range(repeticiones):
+            salida = io.StringIO()
+            inicio = time.perf_counter()
+            estrategia(animales, salida)
+            duracion = time.perf_counter() - inicio
+            mejor = duracion if mejor is None else min(mejor, duracion)
+        referencia = referencia or mejor
+        print(f"  {nombre:<28} {mejor:7.3f} s  {cantidad / mejor:>12,.0f} animales/s  x{referencia / mejor:.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark de despacho sobre animales mezclados")
+    parser.add_argument("--animales", type=int, default=1_000_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+    benchmark(args.animales, args.repeticiones)
@@ -3,61 +3,126 @@ Programa que demuestra constructores y destructores en Python
 usando solo funcionalidades básicas del lenguaje.
 """
 
+import itertools
+import weakref
+
+from registro_eventos import (EVENTO_APAGADO, EVENTO_CONECTADO, EVENTO_DESCONECTADO,
+                              EVENTO_ENCENDIDO, EVENTO_LECTURA, RegistroCircular)
+
+
+class _ReferenciaCuenta(weakref.ref):
+    """Referencia débil a una cuenta que recuerda su número"""
+    __slots__ = ('numero',)
+
+
 class CuentaBancaria:
     """
     Clase que representa una cuenta bancaria simple
-    con constructor y destructor.
+    con constructor y cierre explícito.
+
+    La cuenta se cierra con cerrar() o al salir de un bloque with. Si nunca se
+    cierra, el registro de cuentas la da de baja cuando el objeto se recolecta
+    (mediante una referencia débil), sin usar __del__.
     """
 
     total_cuentas = 0  # Variable de clase para llevar el conteo
-
-    def __init__(self, titular, saldo_inicial=0):
+    # Registro de cuentas abiertas: número -> referencia débil. Solo se usan
+    # operaciones atómicas del diccionario, sin candados: la baja automática
+    # puede ocurrir en medio de cualquier asignación de memoria y un candado
+    # tomado en ese momento se bloquearía a sí mismo.
+    _activas = {}
+    _numeros = itertools.count(1)
+
+    def __init__(self, titular, saldo_inicial=0, mostrar_mensajes=True):
         """
         Constructor de la clase CuentaBancaria.
 
         :param titular: Nombre del titular de la cuenta
         :param saldo_inicial: Saldo inicial de la cuenta (opcional)
+        :param mostrar_mensajes: Si se imprimen las operaciones (False para cargas grandes)
         """
         self.titular = titular
         self.saldo = saldo_inicial
         self.activa = True
-        CuentaBancaria.total_cuentas += 1
-
-        print(f"\nNueva cuenta creada para {self.titular}")
-        print(f"Saldo inicial: ${self.saldo:.2f}")
-        print(f"Total de cuentas activas: {CuentaBancaria.total_cuentas}")
+        self.mostrar_mensajes = mostrar_mensajes
+
+        self.numero = next(CuentaBancaria._numeros)
+        referencia = _ReferenciaCuenta(self, CuentaBancaria._al_recolectar)
+        referencia.numero = self.numero
+        CuentaBancaria._activas[self.numero] = referencia
+        CuentaBancaria.total_cuentas = len(CuentaBancaria._activas)
+
+        if mostrar_mensajes:
+            print(f"\nNueva cuenta creada para {self.titular}")
+            print(f"Saldo inicial: ${self.saldo:.2f}")
+            print(f"Total de cuentas activas: {CuentaBancaria.total_cuentas}")
+
+    @staticmethod
+    def _al_recolectar(referencia):
+        """Red de seguridad: da de baja una cuenta que se liberó sin cerrarla"""
+        CuentaBancaria._activas.pop(referencia.numero, None)
+        CuentaBancaria.total_cuentas = len(CuentaBancaria._activas)
+
+    @classmethod
+    def cuentas_activas(cls):
+        """Cantidad de cuentas abiertas en este momento"""
+        return len(cls._activas)
+
+    @classmethod
+    def abiertas(cls):
+        """Lista de las cuentas abiertas que siguen en memoria"""
+        cuentas = (referencia() for referencia in list(cls._activas.values()))
+        return [cuenta for cuenta in cuentas if cuenta is not None]
 
     def depositar(self, cantidad):
-        """Realiza un depósito en la cuenta"""
+        """Realiza un depósito en la cuenta; devuelve True si se aplicó"""
         if self.activa:
             self.saldo += cantidad
-            print(f"Depositados ${cantidad:.2f} en cuenta de {self.titular}")
-        else:
+            if self.mostrar_mensajes:
+                print(f"Depositados ${cantidad:.2f} en cuenta de {self.titular}")
+            return True
+        if self.mostrar_mensajes:
             print("Error: La cuenta está cerrada")
+        return False
 
     def retirar(self, cantidad):
-        """Realiza un retiro de la cuenta"""
-        if self.activa:
-            if self.saldo >= cantidad:
-                self.saldo -= cantidad
-                print(f"Retirados ${cantidad:.2f} de cuenta de {self.titular}")
-            else:
+        """Realiza un retiro de la cuenta; devuelve True si se aplicó"""
+        if not self.activa:
+            if self.mostrar_mensajes:
+                print("Error: La cuenta está cerrada")
+            return False
+        if self.saldo < cantidad:
+            if self.mostrar_mensajes:
                 print("Fondos insuficientes")
-        else:
-            print("Error: La cuenta está cerrada")
+            return False
+        self.saldo -= cantidad
+        if self.mostrar_mensajes:
+            print(f"Retirados ${cantidad:.2f} de cuenta de {self.titular}")
+        return True
 
-    def __del__(self):
+    def cerrar(self):
         """
-        Destructor de la clase CuentaBancaria.
         Realiza el cierre formal de la cuenta.
+        Se puede llamar varias veces; solo la primera tiene efecto.
         """
-        if hasattr(self, 'activa') and self.activa:
-            self.activa = False
-            CuentaBancaria.total_cuentas -= 1
-            print(f"\nCuenta de {self.titular} está siendo eliminada")
+        if not self.activa:
+            return
+        self.activa = False
+        # Al quitar la referencia del registro ya no habrá baja automática
+        CuentaBancaria._activas.pop(self.numero, None)
+        CuentaBancaria.total_cuentas = len(CuentaBancaria._activas)
+        if self.mostrar_mensajes:
+            print(f"\nCuenta de {self.titular} cerrada")
             print(f"Saldo final: ${self.saldo:.2f}")
             print(f"Total de cuentas activas restantes: {CuentaBancaria.total_cuentas}")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_excepcion, excepcion, traza):
+        self.cerrar()
+        return False
+
 
 class DispositivoIoT:
     """
@@ -65,73 +130,102 @@ class DispositivoIoT:
     con constructor y destructor.
     """
 
-    def __init__(self, id_dispositivo, tipo):
+    def __init__(self, id_dispositivo, tipo, capacidad_registro=64, archivo_registro=None,
+                 mostrar_mensajes=True):
         """
         Constructor de la clase DispositivoIoT.
 
         :param id_dispositivo: Identificador único del dispositivo
         :param tipo: Tipo de dispositivo (sensor, actuador, etc.)
+        :param capacidad_registro: Eventos que se guardan en memoria
+        :param archivo_registro: Archivo donde se guardan los eventos más antiguos (opcional)
+        :param mostrar_mensajes: Si se imprimen los cambios de estado (False para flotas grandes)
         """
         self.id = id_dispositivo
         self.tipo = tipo
         self.conectado = False
         self.encendido = False
-        self.registro_eventos = []
+        self.registro_eventos = RegistroCircular(capacidad_registro, archivo_registro)
+        self.mostrar_mensajes = mostrar_mensajes
+
+        self._mensaje(f"\nDispositivo {self.id} ({self.tipo}) inicializado")
 
-        print(f"\nDispositivo {self.id} ({self.tipo}) inicializado")
+    def _mensaje(self, texto):
+        if self.mostrar_mensajes:
+            print(texto)
 
     def conectar(self):
         """Simula la conexión del dispositivo"""
         if not self.conectado:
             self.conectado = True
-            self.registro_eventos.append("Dispositivo conectado")
-            print(f"Dispositivo {self.id} conectado")
+            self.registro_eventos.registrar(EVENTO_CONECTADO)
+            self._mensaje(f"Dispositivo {self.id} conectado")
 
     def encender(self):
         """Simula encender el dispositivo"""
         if self.conectado and not self.encendido:
             self.encendido = True
-            self.registro_eventos.append("Dispositivo encendido")
-            print(f"Dispositivo {self.id} encendido")
+            self.registro_eventos.registrar(EVENTO_ENCENDIDO)
+            self._mensaje(f"Dispositivo {self.id} encendido")
 
-    def __del__(self):
-        """
-        Destructor de la clase DispositivoIoT.
-        Realiza el apagado seguro del dispositivo.
-        """
-        if hasattr(self, 'encendido') and self.encendido:
+    def apagar(self):
+        """Simula apagar el dispositivo"""
+        if self.encendido:
             self.encendido = False
-            self.registro_eventos.append("Dispositivo apagado")
-            print(f"\nApagando dispositivo {self.id} de manera segura")
+            self.registro_eventos.registrar(EVENTO_APAGADO)
+            self._mensaje(f"\nApagando dispositivo {self.id} de manera segura")
 
-        if hasattr(self, 'conectado') and self.conectado:
+    def desconectar(self):
+        """Simula la desconexión del dispositivo"""
+        if self.conectado:
             self.conectado = False
-            self.registro_eventos.append("Dispositivo desconectado")
-            print(f"Desconectando dispositivo {self.id}")
-
+            self.registro_eventos.registrar(EVENTO_DESCONECTADO)
+            self._mensaje(f"Desconectando dispositivo {self.id}")
+
+    def registrar_lectura(self, instante=None):
+        """Anota en el registro el envío de una lectura (solo si está encendido)"""
+        if self.encendido:
+            self.registro_eventos.registrar(EVENTO_LECTURA, instante)
+            return True
+        return False
+
+    def mostrar_registro(self, incluir_desborde=False):
+        """Muestra el registro de eventos del dispositivo"""
         print(f"Registro de eventos de {self.id}:")
-        for evento in self.registro_eventos:
+        for evento in self.registro_eventos.descripciones(incluir_desborde=incluir_desborde):
             print(f"- {evento}")
 
+    def __del__(self):
+        """
+        Destructor de la clase DispositivoIoT.
+        Realiza el apagado seguro del dispositivo y guarda en disco
+        los eventos pendientes; el registro se consulta con mostrar_registro().
+        """
+        if not hasattr(self, 'registro_eventos'):
+            return
+        self.apagar()
+        self.desconectar()
+        self.registro_eventos.vaciar()
+
 
 def demostracion():
     """Función para demostrar el uso de las clases"""
     print("\n=== DEMOSTRACIÓN CUENTA BANCARIA ===")
-    cuenta1 = CuentaBancaria("Karen Infante", 7000)
-    cuenta1.depositar(5000)
-    cuenta1.retirar(3000)
+    # La cuenta se cierra al salir del bloque with, aunque ocurra un error
+    with CuentaBancaria("Karen Infante", 7000) as cuenta1:
+        cuenta1.depositar(5000)
+        cuenta1.retirar(3000)
 
     cuenta2 = CuentaBancaria("Brayan Jimenez")
     cuenta2.depositar(3000)
-
-    # Los destructores se llamarán al eliminar los objetos
-    del cuenta1
-    del cuenta2
+    cuenta2.cerrar()
 
     print("\n=== DEMOSTRACIÓN DISPOSITIVO IOT ===")
     sensor = DispositivoIoT("SENS-001", "Sensor de temperatura")
     sensor.conectar()
     sensor.encender()
+    sensor.apagar()
+    sensor.mostrar_registro()
 
     # El destructor se llamará al salir de este ámbito
     del sensor
@@ -0,0 +1,129 @@
+"""
+Benchmark del ciclo de vida de CuentaBancaria.
+
+Crea y destruye millones de cuentas manteniendo una ventana de cuentas vivas,
+algunas en ciclos de referencias (como pasa cuando una cuenta guarda objetos que
+la apuntan). Compara la versión anterior, que se daba de baja en __del__, con el
+cierre explícito de CuentaBancaria y con su baja automática, y mide:
+- las pausas del recolector de basura (con gc.callbacks);
+- el desfase máximo entre las cuentas que el registro da por activas y las que
+  realmente siguen abiertas (con __del__, las cuentas en ciclos siguen
+  contándose hasta que pasa el recolector).
+
+Uso:
+    python benchmark_cuentas.py --cuentas 1000000
+"""
+
+import argparse
+import gc
+import time
+from collections import deque
+
+from ConstructoresyDestructor import CuentaBancaria
+
+
+class CuentaConDestructor:
+    """Réplica silenciosa de la CuentaBancaria anterior, que se daba de baja en __del__"""
+
+    total_cuentas = 0
+
+    def __init__(self, titular, saldo_inicial=0):
+        self.titular = titular
+        self.saldo = saldo_inicial
+        self.activa = True
+        CuentaConDestructor.total_cuentas += 1
+
+    def __del__(self):
+        if hasattr(self, 'activa') and self.activa:
+            self.activa = False
+            CuentaConDestructor.total_cuentas -= 1
+
+
+class PausasGC:
+    """Registra la duración de cada pasada del recolector mientras está activo"""
+
+    def __init__(self):
+        self.pausas = []
+        self._inicio = None
+
+    def _callback(self, fase, info):
+        if fase == "start":
+            self._inicio = time.perf_counter()
+        elif self._inicio is not None:
+            self.pausas.append((time.perf_counter() - self._inicio) * 1000)
+            self._inicio = None
+
+    def __enter__(self):
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *args):
+        gc.callbacks.remove(self._callback)
+        return False
+
+
+def churn(crear, cerrar, contar_activas, cuentas, vivas, fraccion_ciclos):
+    """
+    Crea cuentas manteniendo 'vivas' a la vez; cada cuenta nueva desplaza a la más vieja.
+    Devuelve el desfase máximo observado entre el registro y las cuentas abiertas.
+    """
+    ventana = deque()
+    desfase = 0
+    cada_ciclo = int(1 / fraccion_ciclos) if fraccion_ciclos else 0
+    for i in range(cuentas):
+        cuenta = crear(i)
+        if cada_ciclo and i % cada_ciclo == 0:
+            cuenta.historial = [cuenta]  # Ciclo: solo el recolector puede liberarla
+        ventana.append(cuenta)
+        if len(ventana) > vivas:
+            cerrar(ventana.popleft())
+        if i % 1000 == 0:
+            desfase = max(desfase, abs(contar_activas() - len(ventana)))
+    while ventana:
+        cerrar(ventana.popleft())
+    gc.collect()
+    return desfase
+
+
+def medir(nombre, crear, cerrar, contar_activas, cuentas, vivas, fraccion_ciclos):
+    gc.collect()
+    with PausasGC() as pausas:
+        inicio = time.perf_counter()
+        desfase = churn(crear, cerrar, contar_activas, cuentas, vivas, fraccion_ciclos)
+        duracion = time.perf_counter() - inicio
+
+    ordenadas = sorted(pausas.pausas) or [0.0]
+    print(f"  {nombre:<30} {duracion:7.2f} s  {cuentas / duracion:>10,.0f} cuentas/s  "
+          f"GC: {len(pausas.pausas):>5} pasadas, total {sum(ordenadas):8.1f} ms, "
+          f"p99 {ordenadas[int(0.99 * (len(ordenadas) - 1))]:6.2f} ms, máx {ordenadas[-1]:6.2f} ms  "
+          f"desfase máx {desfase:>5}, activas al final: {contar_activas()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del ciclo de vida de CuentaBancaria")
+    parser.add_argument("--cuentas", type=int, default=1_000_000)
+    parser.add_argument("--vivas", type=int, default=10_000, help="Cuentas abiertas a la vez")
+    parser.add_argument("--ciclos", type=float, default=0.1,
+                        help="Fracción de cuentas que quedan en un ciclo de referencias")
+    args = parser.parse_args()
+
+    print(f"{args.cuentas} cuentas, {args.vivas} vivas a la vez, {args.ciclos:.0%} en ciclos")
+    medir("__del__ (anterior)",
+          lambda i: CuentaConDestructor(f"Titular {i}", 100),
+          lambda cuenta: None,  # Se dan de baja cuando el objeto se libera
+          lambda: CuentaConDestructor.total_cuentas,
+          args.cuentas, args.vivas, args.ciclos)
+    medir("cerrar() explícito",
+          lambda i: CuentaBancaria(f"Titular {i}", 100, mostrar_mensajes=False),
+          CuentaBancaria.cerrar,
+          CuentaBancaria.cuentas_activas,
+          args.cuentas, args.vivas, args.ciclos)
+    medir("baja automática (sin cerrar)",
+          lambda i: CuentaBancaria(f"Titular {i}", 100, mostrar_mensajes=False),
+          lambda cuenta: None,
+          CuentaBancaria.cuentas_activas,
+          args.cuentas, args.vivas, args.ciclos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Simulador de flotas de DispositivoIoT con asyncio.
+
+Cada dispositivo es una corrutina que recorre su ciclo de vida completo contra
+una puerta de enlace (gateway) TCP: se conecta, se enciende, envía lecturas a
+un ritmo configurable y se desconecta. Decenas de miles de dispositivos pueden
+simularse en un solo proceso porque mientras uno espera la red los demás siguen
+avanzando.
+
+GatewayLocal es un gateway mínimo que corre en el mismo proceso y sirve para
+probar el simulador sin un servidor real. Al terminar se informa el rendimiento
+de conexiones y mensajes y la latencia (p50, p95, p99 y máxima) de cada uno.
+
+Protocolo (una línea por mensaje):
+    dispositivo -> gateway: "HOLA <id>"             gateway -> dispositivo: "OK"
+    dispositivo -> gateway: "LECTURA <n> <valor>"   gateway -> dispositivo: "ACK <n>"
+    dispositivo -> gateway: "ADIOS"
+Un mensaje mal formado recibe "ERROR <motivo>" y la conexión sigue abierta.
+Cada operación de red del dispositivo tiene un tiempo máximo; si se agota,
+el dispositivo abandona y cuenta como error.
+
+Uso:
+    python flota.py --dispositivos 10000 --lecturas 10 --intervalo 0.5 --rampa 5
+    python flota.py --host gateway.local --puerto 9000 --dispositivos 20000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from array import array
+
+from ConstructoresyDestructor import DispositivoIoT
+
+
+class GatewayLocal:
+    """Gateway TCP mínimo que confirma cada conexión y cada lectura"""
+
+    def __init__(self):
+        self.conexiones = 0
+        self.mensajes = 0
+        self.rechazados = 0  # Mensajes mal formados
+        self._servidor = None
+
+    async def iniciar(self, host="127.0.0.1", puerto=0):
+        """Empieza a escuchar y devuelve el puerto (0 elige uno libre)"""
+        self._servidor = await asyncio.start_server(self._atender, host, puerto, backlog=4096)
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def cerrar(self):
+        self._servidor.close()
+        await self._servidor.wait_closed()
+
+    @staticmethod
+    def _es_lectura_valida(partes):
+        """'LECTURA <n> <valor>' con n entero no negativo y valor numérico"""
+        if len(partes) != 3 or not partes[1].isdigit():
+            return False
+        try:
+            float(partes[2])
+        except ValueError:
+            return False
+        return True
+
+    async def _atender(self, lector, escritor):
+        try:
+            while True:
+                linea = await lector.readline()
+                partes = linea.split()
+                if not linea or partes == [b"ADIOS"]:
+                    break
+                comando = partes[0] if partes else b""
+                if comando == b"LECTURA" and self._es_lectura_valida(partes):
+                    self.mensajes += 1
+                    escritor.write(b"ACK " + partes[1] + b"\n")
+                elif comando == b"HOLA" and len(partes) == 2:
+                    self.conexiones += 1
+                    escritor.write(b"OK\n")
+                else:
+                    self.rechazados += 1
+                    escritor.write(b"ERROR mensaje mal formado\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+
+def percentil(valores_ordenados, fraccion):
+    """Percentil por el método del rango más cercano sobre una lista ya ordenada"""
+    if not valores_ordenados:
+        return 0.0
+    indice = min(len(valores_ordenados) - 1, max(0, round(fraccion * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+
+class MetricasFlota:
+    """Latencias (en ms) y contadores de una simulación"""
+
+    def __init__(self):
+        self.latencias_conexion = array('d')
+        self.latencias_mensaje = array('d')
+        self.errores = 0
+        self.tiempos_agotados = 0  # Errores por falta de respuesta del gateway
+        self.inicio = None
+        self.fin = None
+
+    @property
+    def duracion(self):
+        return (self.fin or time.perf_counter()) - self.inicio
+
+    @staticmethod
+    def _resumen(nombre, latencias, duracion):
+        ordenadas = sorted(latencias)
+        por_segundo = len(ordenadas) / duracion if duracion else 0.0
+        return (f"{nombre:<11} {len(ordenadas):>9}  {por_segundo:>10,.0f}/s  "
+                f"p50 {percentil(ordenadas, 0.50):7.2f} ms  p95 {percentil(ordenadas, 0.95):7.2f} ms  "
+                f"p99 {percentil(ordenadas, 0.99):7.2f} ms  máx {max(ordenadas, default=0.0):7.2f} ms")
+
+    def __str__(self):
+        return "\n".join([
+            f"Duración: {self.duracion:.2f} s, errores: {self.errores} "
+            f"({self.tiempos_agotados} por tiempo agotado)",
+            self._resumen("Conexiones", self.latencias_conexion, self.duracion),
+            self._resumen("Mensajes", self.latencias_mensaje, self.duracion),
+        ])
+
+
+class Flota:
+    """Simula muchos DispositivoIoT conectados a la vez a un gateway"""
+
+    def __init__(self, host, puerto, dispositivos=1000, lecturas=10, intervalo=1.0, rampa=1.0,
+                 max_conexiones=5000, semilla=0, tiempo_maximo=10.0):
+        """
+        :param dispositivos: cantidad de dispositivos simulados
+        :param lecturas: lecturas que envía cada dispositivo
+        :param intervalo: segundos medios entre lecturas de un mismo dispositivo
+        :param rampa: segundos durante los que se reparten los arranques
+                      (ritmo de conexión = dispositivos / rampa)
+        :param max_conexiones: conexiones abiertas a la vez como máximo (límite de descriptores)
+        :param tiempo_maximo: segundos que se espera cada operación de red (conexión,
+                              envío o respuesta) antes de abandonar el dispositivo
+        """
+        self.host = host
+        self.puerto = puerto
+        self.cantidad = dispositivos
+        self.lecturas = lecturas
+        self.intervalo = intervalo
+        self.rampa = rampa
+        self.max_conexiones = max_conexiones
+        self.rng = random.Random(semilla)
+        self.tiempo_maximo = tiempo_maximo
+        self.metricas = MetricasFlota()
+
+    def _con_limite(self, operacion):
+        """Envuelve una operación de red para que no espere más de tiempo_maximo"""
+        return asyncio.wait_for(operacion, self.tiempo_maximo)
+
+    async def _ciclo_de_vida(self, dispositivo, retardo, semaforo):
+        await asyncio.sleep(retardo)
+        async with semaforo:
+            escritor = None
+            try:
+                inicio = time.perf_counter()
+                lector, escritor = await self._con_limite(asyncio.open_connection(self.host, self.puerto))
+                escritor.write(f"HOLA {dispositivo.id}\n".encode())
+                await self._con_limite(escritor.drain())
+                if await self._con_limite(lector.readline()) != b"OK\n":
+                    raise ConnectionError("El gateway rechazó la conexión")
+                self.metricas.latencias_conexion.append((time.perf_counter() - inicio) * 1000)
+                dispositivo.conectar()
+                dispositivo.encender()
+
+                for numero in range(self.lecturas):
+                    # Espera exponencial: lecturas independientes a un ritmo medio fijo
+                    await asyncio.sleep(self.rng.expovariate(1 / self.intervalo) if self.intervalo else 0)
+                    inicio = time.perf_counter()
+                    escritor.write(f"LECTURA {numero} {self.rng.uniform(15, 30):.2f}\n".encode())
+                    await self._con_limite(escritor.drain())
+                    # b"" (conexión cerrada) o cualquier otra respuesta no es una confirmación
+                    if await self._con_limite(lector.readline()) != f"ACK {numero}\n".encode():
+                        raise ConnectionError(f"El gateway no confirmó la lectura {numero}")
+                    self.metricas.latencias_mensaje.append((time.perf_counter() - inicio) * 1000)
+                    dispositivo.registrar_lectura()
+
+                escritor.write(b"ADIOS\n")
+                await self._con_limite(escritor.drain())
+            except asyncio.TimeoutError:
+                self.metricas.errores += 1
+                self.metricas.tiempos_agotados += 1
+            except (ConnectionError, OSError):
+                self.metricas.errores += 1
+            finally:
+                dispositivo.apagar()
+                dispositivo.desconectar()
+                if escritor is not None:
+                    escritor.close()
+
+    async def ejecutar(self):
+        """Simula todos los dispositivos y devuelve las métricas"""
+        semaforo = asyncio.Semaphore(self.max_conexiones)
+        dispositivos = [DispositivoIoT(f"DISP-{i:06d}", "Sensor de temperatura", capacidad_registro=16,
+                                       mostrar_mensajes=False)
+                        for i in range(self.cantidad)]
+
+        self.metricas.inicio = time.perf_counter()
+        await asyncio.gather(*(
+            self._ciclo_de_vida(dispositivo, self.rng.uniform(0, self.rampa), semaforo)
+            for dispositivo in dispositivos
+        ))
+        self.metricas.fin = time.perf_counter()
+        return self.metricas
+
+
+async def simular(dispositivos, lecturas, intervalo, rampa, max_conexiones, host=None, puerto=None,
+                  tiempo_maximo=10.0):
+    """Ejecuta una flota contra el gateway indicado o, si no hay host, contra un GatewayLocal"""
+    gateway = None
+    if host is None:
+        gateway = GatewayLocal()
+        host, puerto = "127.0.0.1", await gateway.iniciar()
+    try:
+        flota = Flota(host, puerto, dispositivos, lecturas, intervalo, rampa, max_conexiones,
+                      tiempo_maximo=tiempo_maximo)
+        return await flota.ejecutar()
+    finally:
+        if gateway is not None:
+            await gateway.cerrar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de flotas de dispositivos IoT")
+    parser.add_argument("--dispositivos", type=int, default=10_000)
+    parser.add_argument("--lecturas", type=int, default=10, help="Lecturas por dispositivo")
+    parser.add_argument("--intervalo", type=float, default=0.5, help="Segundos medios entre lecturas")
+    parser.add_argument("--rampa", type=float, default=5.0, help="Segundos para arrancar todos los dispositivos")
+    parser.add_argument("--max-conexiones", type=int, default=5_000,
+                        help="Conexiones simultáneas como máximo (cada una usa un descriptor de archivo)")
+    parser.add_argument("--host", help="Gateway real (por defecto se usa uno local)")
+    parser.add_argument("--puerto", type=int, default=9000)
+    parser.add_argument("--tiempo-maximo", type=float, default=10.0,
+                        help="Segundos de espera por operación de red antes de abandonar")
+    args = parser.parse_args()
+
+    print(f"Simulando {args.dispositivos} dispositivos, {args.lecturas} lecturas cada uno...")
+    metricas = asyncio.run(simular(args.dispositivos, args.lecturas, args.intervalo, args.rampa,
+                                   args.max_conexiones, args.host, args.puerto if args.host else None,
+                                   args.tiempo_maximo))
+    print(metricas)
+
+
+if __name__ == "__main__":
+    main()
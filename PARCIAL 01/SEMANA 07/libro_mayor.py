@@ -0,0 +1,188 @@
+"""
+Libro mayor seguro para hilos construido sobre CuentaBancaria.
+
+CuentaBancaria modifica el saldo sin ninguna protección, así que dos hilos que
+operan a la vez sobre la misma cuenta pueden perder actualizaciones. LibroMayor
+guarda un candado por cuenta:
+- depósitos y retiros toman solo el candado de su cuenta;
+- una transferencia toma los candados de las dos cuentas siempre en el mismo
+  orden (primero el número menor), así que dos transferencias cruzadas nunca
+  quedan esperándose mutuamente (interbloqueo).
+
+Cada operación, aceptada o rechazada, se anota en un diario de solo agregado.
+
+Uso (benchmark de transferencias por segundo según la cantidad de hilos):
+    python libro_mayor.py --transferencias 200000 --hilos 1 2 4 8 16
+"""
+
+import itertools
+import threading
+import time
+
+from ConstructoresyDestructor import CuentaBancaria
+
+# Tipos de operación del diario
+DEPOSITO = "deposito"
+RETIRO = "retiro"
+TRANSFERENCIA = "transferencia"
+
+
+class Diario:
+    """
+    Diario de operaciones de solo agregado.
+
+    Cada anotación es una tupla (secuencia, instante, tipo, origen, destino,
+    cantidad, aceptada). Si se indica un archivo, también se escribe ahí una
+    línea CSV por anotación.
+    """
+
+    def __init__(self, ruta=None):
+        self._anotaciones = []
+        self._secuencia = itertools.count(1)
+        self._candado = threading.Lock()
+        self._archivo = open(ruta, 'a', encoding='utf-8') if ruta else None
+
+    def anotar(self, tipo, origen, destino, cantidad, aceptada):
+        """Agrega una anotación y devuelve su número de secuencia"""
+        with self._candado:
+            anotacion = (next(self._secuencia), time.time(), tipo, origen, destino, cantidad, aceptada)
+            self._anotaciones.append(anotacion)
+            if self._archivo is not None:
+                self._archivo.write(",".join(map(str, anotacion)) + "\n")
+        return anotacion[0]
+
+    def __len__(self):
+        return len(self._anotaciones)
+
+    def __iter__(self):
+        """Recorre una copia de las anotaciones hechas hasta ahora"""
+        with self._candado:
+            return iter(list(self._anotaciones))
+
+    def de_cuenta(self, numero):
+        """Anotaciones en las que participa una cuenta"""
+        return [anotacion for anotacion in self if numero in (anotacion[3], anotacion[4])]
+
+    def cerrar(self):
+        with self._candado:
+            if self._archivo is not None:
+                self._archivo.close()
+                self._archivo = None
+
+
+class LibroMayor:
+    """Cuentas con un candado cada una y un diario común de operaciones"""
+
+    def __init__(self, diario=None, mostrar_mensajes=False):
+        """
+        :param diario: Diario donde se anotan las operaciones (se crea uno si no se indica)
+        :param mostrar_mensajes: Si las cuentas imprimen cada operación
+        """
+        self.diario = diario if diario is not None else Diario()
+        self.mostrar_mensajes = mostrar_mensajes
+        self._cuentas = {}
+        self._candados = {}
+
+    def abrir_cuenta(self, titular, saldo_inicial=0):
+        """Crea una cuenta en el libro y devuelve su número"""
+        cuenta = CuentaBancaria(titular, saldo_inicial, mostrar_mensajes=self.mostrar_mensajes)
+        self._candados[cuenta.numero] = threading.Lock()
+        self._cuentas[cuenta.numero] = cuenta
+        return cuenta.numero
+
+    def cuenta(self, numero):
+        return self._cuentas[numero]
+
+    def saldo(self, numero):
+        with self._candados[numero]:
+            return self._cuentas[numero].saldo
+
+    def saldo_total(self):
+        """Suma de los saldos, tomando todos los candados para ver un estado consistente"""
+        numeros = sorted(self._cuentas)
+        for numero in numeros:
+            self._candados[numero].acquire()
+        try:
+            return sum(self._cuentas[numero].saldo for numero in numeros)
+        finally:
+            for numero in reversed(numeros):
+                self._candados[numero].release()
+
+    def depositar(self, numero, cantidad):
+        with self._candados[numero]:
+            aceptada = self._cuentas[numero].depositar(cantidad)
+            self.diario.anotar(DEPOSITO, None, numero, cantidad, aceptada)
+        return aceptada
+
+    def retirar(self, numero, cantidad):
+        with self._candados[numero]:
+            aceptada = self._cuentas[numero].retirar(cantidad)
+            self.diario.anotar(RETIRO, numero, None, cantidad, aceptada)
+        return aceptada
+
+    def transferir(self, origen, destino, cantidad):
+        """
+        Mueve dinero entre dos cuentas de forma atómica.
+
+        :return: True si se aplicó; False si faltan fondos o alguna cuenta está cerrada
+        """
+        if origen == destino:
+            raise ValueError("La cuenta de origen y la de destino deben ser distintas")
+
+        primero, segundo = sorted((origen, destino))
+        with self._candados[primero], self._candados[segundo]:
+            cuenta_origen, cuenta_destino = self._cuentas[origen], self._cuentas[destino]
+            aceptada = cuenta_destino.activa and cuenta_origen.retirar(cantidad)
+            if aceptada:
+                cuenta_destino.depositar(cantidad)
+            self.diario.anotar(TRANSFERENCIA, origen, destino, cantidad, aceptada)
+        return aceptada
+
+
+def benchmark(transferencias, hilos, cuentas=1_000, saldo_inicial=1_000):
+    """Reparte transferencias aleatorias entre varios hilos y devuelve las transferencias por segundo"""
+    import random
+
+    libro = LibroMayor()
+    numeros = [libro.abrir_cuenta(f"Titular {i}", saldo_inicial) for i in range(cuentas)]
+    total_inicial = libro.saldo_total()
+    por_hilo = transferencias // hilos
+
+    def trabajar(semilla):
+        rng = random.Random(semilla)
+        for _ in range(por_hilo):
+            origen, destino = rng.sample(numeros, 2)
+            libro.transferir(origen, destino, rng.randint(1, 100))
+
+    trabajadores = [threading.Thread(target=trabajar, args=(i,)) for i in range(hilos)]
+    inicio = time.perf_counter()
+    for hilo in trabajadores:
+        hilo.start()
+    for hilo in trabajadores:
+        hilo.join()
+    duracion = time.perf_counter() - inicio
+
+    # El dinero no se crea ni se destruye y cada transferencia quedó anotada
+    assert libro.saldo_total() == total_inicial
+    assert len(libro.diario) == por_hilo * hilos
+    for numero in numeros:
+        libro.cuenta(numero).cerrar()
+    return por_hilo * hilos / duracion
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark de transferencias del libro mayor")
+    parser.add_argument("--transferencias", type=int, default=200_000)
+    parser.add_argument("--hilos", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--cuentas", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(f"{args.transferencias} transferencias entre {args.cuentas} cuentas")
+    for hilos in args.hilos:
+        print(f"  {hilos:>3} hilos: {benchmark(args.transferencias, hilos, args.cuentas):>10,.0f} transferencias/s")
+
+
+if __name__ == "__main__":
+    main()
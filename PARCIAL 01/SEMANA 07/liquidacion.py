@@ -0,0 +1,255 @@
+"""
+Liquidación por lotes de movimientos sobre cuentas bancarias.
+
+CuentaBancaria aplica un depósito o un retiro por llamada y guarda el saldo como
+float. Para el cierre del día, LiquidadorLotes recibe un flujo de millones de
+registros (cuenta, cantidad):
+- cada cantidad se lee con Decimal y se convierte a centavos enteros, así que
+  la aritmética es exacta;
+- los saldos se llevan en una columna de enteros (un arreglo array) y cada
+  cuenta recibe su saldo final una sola vez, al terminar el lote;
+- un retiro que dejaría la cuenta en negativo se rechaza sin detener el lote, y
+  todos los rechazos se devuelven juntos con su motivo.
+
+Al final se puede tomar una instantánea de saldos en columnas (números de cuenta
+y centavos, ordenados por número), guardarla en disco y compararla con la del
+día anterior.
+"""
+
+import csv
+from array import array
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+
+# Motivos de rechazo
+SIN_FONDOS = "sin fondos"
+CUENTA_DESCONOCIDA = "cuenta desconocida"
+CUENTA_CERRADA = "cuenta cerrada"
+CANTIDAD_INVALIDA = "cantidad inválida"
+
+# Encabezado del archivo de instantáneas
+_MARCA_INSTANTANEA = b"SALDOS1\n"
+
+
+def a_centavos(cantidad):
+    """
+    Convierte una cantidad (texto, entero o Decimal) a centavos enteros, sin
+    redondeos. Los float se leen por su representación en texto.
+
+    :raises ValueError: si no es un número o tiene más de dos decimales
+    """
+    try:
+        valor = Decimal(str(cantidad) if isinstance(cantidad, float) else cantidad) * 100
+    except (InvalidOperation, TypeError):
+        raise ValueError(f"Cantidad inválida: {cantidad!r}")
+    if not valor.is_finite() or valor != valor.to_integral_value():
+        raise ValueError(f"Cantidad inválida: {cantidad!r}")
+    return int(valor)
+
+
+def saldo_en_centavos(saldo):
+    """
+    Centavos del saldo de una cuenta. Los saldos que CuentaBancaria acumuló como
+    float pueden arrastrar error binario (0.1 + 0.2), así que se redondean al centavo.
+    """
+    valor = Decimal(str(saldo) if isinstance(saldo, float) else saldo) * 100
+    return int(valor.to_integral_value(ROUND_HALF_EVEN))
+
+
+def a_decimal(centavos):
+    return Decimal(centavos).scaleb(-2)
+
+
+def saldo_del_mismo_tipo(anterior, centavos):
+    """
+    Saldo en centavos convertido al tipo del saldo anterior, para que la cuenta
+    siga aceptando las operaciones de siempre (un saldo float + un depósito float).
+    Un saldo entero pasa a float solo si el resultado tiene centavos.
+    """
+    if isinstance(anterior, Decimal):
+        return a_decimal(centavos)
+    if isinstance(anterior, int) and centavos % 100 == 0:
+        return centavos // 100
+    return centavos / 100  # División correctamente redondeada: el float más cercano
+
+
+class ResultadoLiquidacion:
+    """Totales de un lote y lista de movimientos rechazados"""
+
+    def __init__(self):
+        self.aplicados = 0
+        self.depositado = 0  # En centavos
+        self.retirado = 0
+        self.rechazados = []  # Tuplas (posición en el lote, cuenta, cantidad, motivo)
+
+    def __str__(self):
+        return (f"Aplicados: {self.aplicados}, rechazados: {len(self.rechazados)}, "
+                f"depositado: ${a_decimal(self.depositado):,.2f}, retirado: ${a_decimal(self.retirado):,.2f}")
+
+
+class LiquidadorLotes:
+    """Aplica lotes de movimientos a un conjunto de CuentaBancaria"""
+
+    def __init__(self, cuentas):
+        """
+        :param cuentas: Iterable de CuentaBancaria (las cuentas del lote)
+        """
+        self._cuentas = sorted(cuentas, key=lambda cuenta: cuenta.numero)
+        self._indices = {cuenta.numero: i for i, cuenta in enumerate(self._cuentas)}
+
+    def aplicar(self, movimientos):
+        """
+        Aplica un flujo de movimientos (número de cuenta, cantidad); las cantidades
+        positivas son depósitos y las negativas, retiros.
+
+        Los movimientos de cada cuenta se aplican en el orden del flujo. Un retiro
+        sin fondos, una cuenta inexistente o cerrada y una cantidad mal formada
+        se rechazan sin afectar al resto del lote. Al terminar, cada cuenta
+        recibe su saldo en el mismo tipo que tenía (float, int o Decimal).
+
+        :return: ResultadoLiquidacion
+        """
+        saldos = array('q', (saldo_en_centavos(cuenta.saldo) for cuenta in self._cuentas))
+        activas = [cuenta.activa for cuenta in self._cuentas]
+        indices = self._indices
+        resultado = ResultadoLiquidacion()
+        rechazados = resultado.rechazados
+
+        for posicion, (numero, cantidad) in enumerate(movimientos):
+            indice = indices.get(numero)
+            if indice is None:
+                rechazados.append((posicion, numero, cantidad, CUENTA_DESCONOCIDA))
+                continue
+            if not activas[indice]:
+                rechazados.append((posicion, numero, cantidad, CUENTA_CERRADA))
+                continue
+            try:
+                centavos = a_centavos(cantidad)
+            except ValueError:
+                rechazados.append((posicion, numero, cantidad, CANTIDAD_INVALIDA))
+                continue
+
+            if centavos >= 0:
+                resultado.depositado += centavos
+            elif saldos[indice] + centavos < 0:
+                rechazados.append((posicion, numero, cantidad, SIN_FONDOS))
+                continue
+            else:
+                resultado.retirado -= centavos
+            saldos[indice] += centavos
+            resultado.aplicados += 1
+
+        # Cada cuenta recibe su saldo final una sola vez
+        for cuenta, centavos in zip(self._cuentas, saldos):
+            cuenta.saldo = saldo_del_mismo_tipo(cuenta.saldo, centavos)
+        return resultado
+
+    def instantanea(self):
+        """Saldos actuales de las cuentas en columnas"""
+        return InstantaneaSaldos(array('q', (cuenta.numero for cuenta in self._cuentas)),
+                                 array('q', (saldo_en_centavos(cuenta.saldo) for cuenta in self._cuentas)))
+
+
+class InstantaneaSaldos:
+    """Saldos en dos columnas ordenadas por número de cuenta: números y centavos"""
+
+    def __init__(self, numeros, centavos):
+        if len(numeros) != len(centavos):
+            raise ValueError("Las columnas deben tener la misma longitud")
+        self.numeros = numeros
+        self.centavos = centavos
+
+    def __len__(self):
+        return len(self.numeros)
+
+    def total(self):
+        return a_decimal(sum(self.centavos))
+
+    def guardar(self, ruta):
+        """Guarda las dos columnas en binario (8 bytes por número y por saldo)"""
+        with open(ruta, 'wb') as archivo:
+            archivo.write(_MARCA_INSTANTANEA)
+            archivo.write(len(self).to_bytes(8, 'little'))
+            self.numeros.tofile(archivo)
+            self.centavos.tofile(archivo)
+
+    @classmethod
+    def cargar(cls, ruta):
+        with open(ruta, 'rb') as archivo:
+            if archivo.read(len(_MARCA_INSTANTANEA)) != _MARCA_INSTANTANEA:
+                raise ValueError(f"{ruta} no es un archivo de instantánea de saldos")
+            cantidad = int.from_bytes(archivo.read(8), 'little')
+            numeros, centavos = array('q'), array('q')
+            numeros.fromfile(archivo, cantidad)
+            centavos.fromfile(archivo, cantidad)
+        return cls(numeros, centavos)
+
+    def diferencias(self, anterior):
+        """
+        Compara con una instantánea anterior recorriendo ambas columnas en orden.
+
+        :return: generador de tuplas (número, saldo anterior, saldo actual) de las
+                 cuentas cuyo saldo cambió; None indica que la cuenta no existía
+        """
+        i = j = 0
+        n_anterior, n_actual = len(anterior), len(self)
+        while i < n_anterior or j < n_actual:
+            numero_anterior = anterior.numeros[i] if i < n_anterior else None
+            numero_actual = self.numeros[j] if j < n_actual else None
+            if numero_actual is None or (numero_anterior is not None and numero_anterior < numero_actual):
+                yield numero_anterior, a_decimal(anterior.centavos[i]), None
+                i += 1
+            elif numero_anterior is None or numero_actual < numero_anterior:
+                yield numero_actual, None, a_decimal(self.centavos[j])
+                j += 1
+            else:
+                if anterior.centavos[i] != self.centavos[j]:
+                    yield numero_actual, a_decimal(anterior.centavos[i]), a_decimal(self.centavos[j])
+                i += 1
+                j += 1
+
+
+def leer_movimientos_csv(ruta, columna_cuenta="cuenta", columna_cantidad="cantidad"):
+    """Genera los movimientos (número de cuenta, cantidad en texto) de un CSV con encabezado"""
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        for fila in csv.DictReader(archivo):
+            yield int(fila[columna_cuenta]), fila[columna_cantidad]
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    from ConstructoresyDestructor import CuentaBancaria
+
+    rng = random.Random(0)
+    cuentas = [CuentaBancaria(f"Titular {i}", rng.randint(0, 5_000), mostrar_mensajes=False)
+               for i in range(10_000)]
+    numeros = [cuenta.numero for cuenta in cuentas]
+    liquidador = LiquidadorLotes(cuentas)
+
+    def movimientos_del_dia(cantidad):
+        for _ in range(cantidad):
+            centavos = rng.randint(-50_000, 50_000)
+            yield rng.choice(numeros), f"{centavos / 100:.2f}"
+
+    with tempfile.TemporaryDirectory() as temporal:
+        ruta_ayer = os.path.join(temporal, "saldos_ayer.bin")
+        liquidador.instantanea().guardar(ruta_ayer)
+
+        inicio = time.perf_counter()
+        resultado = liquidador.aplicar(movimientos_del_dia(1_000_000))
+        duracion = time.perf_counter() - inicio
+
+        hoy = liquidador.instantanea()
+        ayer = InstantaneaSaldos.cargar(ruta_ayer)
+
+    print("=== LIQUIDACIÓN DEL DÍA ===")
+    print(resultado)
+    print(f"1000000 movimientos en {duracion:.2f} s ({1_000_000 / duracion:,.0f} movimientos/s)")
+    print(f"Saldo total: ayer ${ayer.total():,.2f}, hoy ${hoy.total():,.2f}")
+    cambios = list(hoy.diferencias(ayer))
+    print(f"Cuentas con cambios: {len(cambios)}")
+    for numero, antes, despues in cambios[:5]:
+        print(f"  Cuenta {numero}: ${antes:,.2f} -> ${despues:,.2f}")
@@ -0,0 +1,155 @@
+"""
+Registro de eventos circular y de tamaño fijo para dispositivos IoT.
+
+Cada evento ocupa un código de 1 byte y una marca de tiempo de 8 bytes en dos
+arreglos reservados desde el inicio, así que la memoria de cada dispositivo no
+crece aunque emita eventos sin parar. Cuando el registro se llena, los eventos
+más antiguos se envían por lotes a un archivo binario (si se indicó uno) o se
+descartan, y el historial se consulta bajo demanda.
+"""
+
+import os
+import struct
+import time
+from array import array
+
+# Códigos de evento
+EVENTO_CONECTADO = 1
+EVENTO_ENCENDIDO = 2
+EVENTO_APAGADO = 3
+EVENTO_DESCONECTADO = 4
+EVENTO_LECTURA = 5
+
+DESCRIPCIONES = {
+    EVENTO_CONECTADO: "Dispositivo conectado",
+    EVENTO_ENCENDIDO: "Dispositivo encendido",
+    EVENTO_APAGADO: "Dispositivo apagado",
+    EVENTO_DESCONECTADO: "Dispositivo desconectado",
+    EVENTO_LECTURA: "Lectura enviada",
+}
+
+# Formato de cada evento en el archivo de desborde: marca de tiempo y código
+_FORMATO_DISCO = struct.Struct('<dB')
+_REGISTROS_POR_LECTURA = 4096
+
+
+def describir(codigo):
+    return DESCRIPCIONES.get(codigo, f"Evento {codigo}")
+
+
+class RegistroCircular:
+    """
+    Guarda los últimos eventos en un búfer circular preasignado.
+    """
+
+    def __init__(self, capacidad=64, archivo_desborde=None, tamaño_lote=256):
+        """
+        :param capacidad: cantidad de eventos que se mantienen en memoria
+        :param archivo_desborde: archivo binario donde se guardan los eventos que
+                                 salen del búfer (None para descartarlos)
+        :param tamaño_lote: eventos que se acumulan antes de escribir en el archivo
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser mayor que cero")
+        self.capacidad = capacidad
+        self.archivo_desborde = archivo_desborde
+        self.tamaño_lote = tamaño_lote
+
+        self._codigos = array('B', bytes(capacidad))
+        self._tiempos = array('d', bytes(8 * capacidad))
+        self._inicio = 0  # Posición del evento más antiguo
+        self._cantidad = 0
+
+        # Eventos que salieron del búfer y aún no se escribieron
+        self._pendientes = bytearray()
+        self.desbordados = 0  # Eventos escritos o descartados fuera de memoria
+
+    def __len__(self):
+        """Eventos que están en memoria"""
+        return self._cantidad
+
+    @property
+    def total(self):
+        """Eventos registrados desde la creación"""
+        return self.desbordados + self._cantidad
+
+    def registrar(self, codigo, instante=None):
+        """Agrega un evento; si el búfer está lleno, el más antiguo sale de memoria"""
+        instante = time.time() if instante is None else instante
+        if self._cantidad < self.capacidad:
+            posicion = (self._inicio + self._cantidad) % self.capacidad
+            self._cantidad += 1
+        else:
+            posicion = self._inicio
+            self._desbordar(self._tiempos[posicion], self._codigos[posicion])
+            self._inicio = (self._inicio + 1) % self.capacidad
+        self._codigos[posicion] = codigo
+        self._tiempos[posicion] = instante
+
+    def _desbordar(self, instante, codigo):
+        self.desbordados += 1
+        if self.archivo_desborde is None:
+            return
+        self._pendientes += _FORMATO_DISCO.pack(instante, codigo)
+        if len(self._pendientes) >= self.tamaño_lote * _FORMATO_DISCO.size:
+            self.vaciar()
+
+    def vaciar(self):
+        """Escribe en el archivo de desborde los eventos pendientes"""
+        if self._pendientes and self.archivo_desborde is not None:
+            with open(self.archivo_desborde, 'ab') as archivo:
+                archivo.write(self._pendientes)
+            self._pendientes.clear()
+
+    def _eventos_en_disco(self):
+        """Eventos del archivo de desborde, leídos por bloques de registros enteros (memoria acotada)"""
+        if self.archivo_desborde is not None and os.path.exists(self.archivo_desborde):
+            tamaño = _FORMATO_DISCO.size
+            with open(self.archivo_desborde, 'rb') as archivo:
+                while True:
+                    bloque = archivo.read(_REGISTROS_POR_LECTURA * tamaño)
+                    sobrante = len(bloque) % tamaño  # Registro incompleto al final (escritura interrumpida)
+                    if sobrante:
+                        bloque = bloque[:-sobrante]
+                    if not bloque:
+                        break
+                    yield from _FORMATO_DISCO.iter_unpack(bloque)
+        # Copia: el lote pendiente puede crecer mientras se recorre este generador
+        yield from _FORMATO_DISCO.iter_unpack(bytes(self._pendientes))
+
+    def _eventos_en_memoria(self):
+        for k in range(self._cantidad):
+            posicion = (self._inicio + k) % self.capacidad
+            yield self._tiempos[posicion], self._codigos[posicion]
+
+    def eventos(self, desde=None, hasta=None, codigos=None, incluir_desborde=False):
+        """
+        Genera los eventos (marca de tiempo, código) del más antiguo al más reciente.
+
+        :param desde: marca de tiempo mínima (incluida)
+        :param hasta: marca de tiempo máxima (incluida)
+        :param codigos: conjunto de códigos a incluir (None para todos)
+        :param incluir_desborde: si también se leen los eventos guardados en disco
+        """
+        fuentes = [self._eventos_en_disco()] if incluir_desborde else []
+        fuentes.append(self._eventos_en_memoria())
+        for fuente in fuentes:
+            for instante, codigo in fuente:
+                if desde is not None and instante < desde:
+                    continue
+                if hasta is not None and instante > hasta:
+                    continue
+                if codigos is not None and codigo not in codigos:
+                    continue
+                yield instante, codigo
+
+    def ultimos(self, cantidad):
+        """Lista de los últimos eventos en memoria, del más antiguo al más reciente"""
+        cantidad = min(cantidad, self._cantidad)
+        return list(self._eventos_en_memoria())[self._cantidad - cantidad:]
+
+    def descripciones(self, **filtros):
+        """Genera los eventos como texto, con los mismos filtros que eventos()"""
+        for instante, codigo in self.eventos(**filtros):
+            marca = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(instante))
+            yield f"{marca} {describir(codigo)}"
@@ -1,16 +1,32 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+# Los módulos compartidos viven en "PARCIAL 02/comun"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comun import IndiceBusqueda, ModeloTareas, ServicioPersistencia  # noqa: E402
+
+ARCHIVO_TAREAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tareas.json")
+
+# Milisegundos sin teclear antes de aplicar el filtro de búsqueda
+FILTER_DELAY_MS = 150
+
 
 class TaskManagerApp:
-    def __init__(self, root):
+    def __init__(self, root, tasks_file=ARCHIVO_TAREAS):
         self.root = root
         self.root.title("Gestor de Tareas - Aplicación GUI")
         self.root.geometry("600x400")
         self.root.resizable(True, True)
 
-        # Lista para almacenar las tareas
-        self.tasks = []
+        # Modelo de tareas sin interfaz: la vista se actualiza al recibir sus eventos
+        self.model = ModeloTareas()
+        self.model.suscribir(self.on_model_changed)
+
+        # Índice para filtrar las tareas mientras se escribe en el buscador
+        self.search_index = IndiceBusqueda()
+        self.filter_job = None
 
         # Configurar el estilo
         self.setup_styles()
@@ -18,6 +34,11 @@ class TaskManagerApp:
         # Crear la interfaz
         self.create_widgets()
 
+        # Persistencia en segundo plano: el disco nunca bloquea la interfaz
+        self.persistence = ServicioPersistencia(self.root, tasks_file)
+        self.persistence.cargar(self.on_tasks_loaded)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def setup_styles(self):
         """Configura los estilos para los widgets"""
         style = ttk.Style()
@@ -64,12 +85,20 @@ class TaskManagerApp:
         self.clear_button = ttk.Button(button_frame, text="Limpiar", command=self.clear_fields)
         self.clear_button.grid(row=0, column=1, padx=5)
 
-        self.delete_button = ttk.Button(button_frame, text="Eliminar Seleccionada", command=self.delete_task)
+        self.delete_button = ttk.Button(button_frame, text="Eliminar Seleccionadas", command=self.delete_task)
         self.delete_button.grid(row=0, column=2, padx=(5, 0))
 
         # Tabla para mostrar tareas
         ttk.Label(main_frame, text="Tareas:").grid(row=3, column=0, sticky=tk.W, pady=(0, 5))
 
+        # Buscador: filtra las tareas visibles mientras se escribe
+        search_frame = ttk.Frame(main_frame)
+        search_frame.grid(row=3, column=1, sticky=tk.E, pady=(0, 5))
+        ttk.Label(search_frame, text="Buscar:").pack(side=tk.LEFT, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self.schedule_filter())
+        ttk.Entry(search_frame, textvariable=self.search_var, width=25).pack(side=tk.LEFT)
+
         # Crear Treeview con scrollbar
         tree_frame = ttk.Frame(main_frame)
         tree_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -78,7 +107,7 @@ class TaskManagerApp:
 
         # Configurar las columnas del Treeview
         columns = ("id", "task")
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings", selectmode="browse")
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings", selectmode="extended")
         self.tree.heading("id", text="ID")
         self.tree.heading("task", text="Tarea")
         self.tree.column("id", width=50, anchor=tk.CENTER)
@@ -109,12 +138,8 @@ class TaskManagerApp:
             self.task_entry.focus()
             return
 
-        # Agregar la tarea a la lista
-        task_id = len(self.tasks) + 1
-        self.tasks.append((task_id, task_text))
-
-        # Actualizar el Treeview
-        self.tree.insert("", tk.END, values=(task_id, task_text))
+        # Agregar la tarea al modelo (el Treeview se actualiza en on_model_changed)
+        self.model.agregar(task_text)
 
         # Limpiar el campo de entrada y actualizar estado
         self.task_entry.delete(0, tk.END)
@@ -122,26 +147,21 @@ class TaskManagerApp:
         self.task_entry.focus()
 
     def delete_task(self):
-        """Elimina la tarea seleccionada"""
-        selected_item = self.tree.selection()
+        """Elimina todas las tareas seleccionadas en una sola pasada"""
+        selected_items = self.tree.selection()
 
-        if not selected_item:
+        if not selected_items:
             messagebox.showwarning("Advertencia", "Por favor, seleccione una tarea para eliminar.")
             return
 
-        # Obtener los valores de la tarea seleccionada
-        item_values = self.tree.item(selected_item, "values")
-        task_id = item_values[0]
-        task_text = item_values[1]
-
-        # Eliminar de la lista
-        self.tasks = [task for task in self.tasks if task[0] != int(task_id)]
-
-        # Eliminar del Treeview
-        self.tree.delete(selected_item)
+        # Cada fila tiene como id el de su tarea, así que cada borrado es O(1)
+        removed = self.model.eliminar(*(int(item) for item in selected_items))
 
         # Actualizar estado
-        self.status_var.set(f"Tarea eliminada: {task_text}")
+        if len(removed) == 1:
+            self.status_var.set(f"Tarea eliminada: {removed[0]['text']}")
+        else:
+            self.status_var.set(f"{len(removed)} tareas eliminadas")
 
     def clear_fields(self):
         """Limpia todos los campos y la selección"""
@@ -154,6 +174,59 @@ class TaskManagerApp:
         self.status_var.set("Campos limpiados")
         self.task_entry.focus()
 
+    def on_model_changed(self, event, *data):
+        """Refleja en la vista (y en disco) los cambios del modelo"""
+        if event == "agregada":
+            task = data[0]
+            self.search_index.agregar(task["id"], task["text"])
+            # El id de la tarea es también el id de la fila del Treeview
+            if self.search_index.es_visible(task["id"]):
+                self.tree.insert("", tk.END, iid=str(task["id"]), values=(task["id"], task["text"]))
+        elif event == "eliminadas":
+            for task in data[0]:
+                self.search_index.eliminar(task["id"])
+            rows = [str(task["id"]) for task in data[0] if self.tree.exists(str(task["id"]))]
+            self.tree.delete(*rows)
+        elif event == "recargada":
+            self.search_index.reconstruir((task["id"], task["text"]) for task in self.model)
+            self.refresh_tree()
+            return
+
+        self.persistence.programar_guardado(self.model.instantanea)
+
+    def on_tasks_loaded(self, data):
+        """Recibe (en el hilo de Tk) las tareas leídas del archivo"""
+        if not data:
+            return
+        self.model.cargar(data)
+        self.status_var.set(f"{len(data)} tareas cargadas")
+
+    def refresh_tree(self):
+        """Reconstruye el Treeview con las tareas que coinciden con la búsqueda"""
+        self.tree.delete(*self.tree.get_children())
+        for task_id in self.search_index.filtrar(self.search_var.get()):
+            self.tree.insert("", tk.END, iid=str(task_id), values=(task_id, self.model.obtener(task_id)["text"]))
+
+    def schedule_filter(self):
+        """Retrasa el filtrado hasta que el usuario deja de escribir"""
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(FILTER_DELAY_MS, self.apply_filter)
+
+    def apply_filter(self):
+        """Aplica el texto del buscador a la lista de tareas"""
+        self.filter_job = None
+        self.refresh_tree()
+        if self.search_var.get().strip():
+            self.status_var.set(f"{len(self.tree.get_children())} de {len(self.model)} tareas")
+        else:
+            self.status_var.set("Listo")
+
+    def on_close(self):
+        """Guarda los cambios pendientes antes de cerrar la ventana"""
+        self.persistence.cerrar()
+        self.root.destroy()
+
 
 def main():
     """Función principal que inicia la aplicación"""
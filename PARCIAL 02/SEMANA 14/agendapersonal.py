@@ -1,7 +1,19 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 import datetime
 
+# Los módulos compartidos viven en "PARCIAL 02/comun"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comun import ModeloAgenda  # noqa: E402
+
+# Frecuencias de repetición disponibles para un evento
+RECURRENCIAS = ('Ninguna', 'Diaria', 'Semanal', 'Mensual')
+
+# Días que se muestran por defecto en la vista de eventos
+DIAS_VISIBLES = 30
+
 
 class AgendaPersonal:
     def __init__(self, root):
@@ -10,8 +22,12 @@ class AgendaPersonal:
         self.root.geometry("800x600")
         self.root.resizable(True, True)
 
-        # Lista para almacenar eventos
-        self.eventos = []
+        # Modelo de eventos sin interfaz (las series recurrentes se guardan una sola vez)
+        self.modelo = ModeloAgenda()
+        self.modelo.suscribir(lambda evento, *datos: self.actualizar_treeview())
+
+        # Relación entre los elementos del TreeView y el evento que los originó
+        self.eventos_por_item = {}
 
         # Configurar estilo
         self.configurar_estilos()
@@ -69,9 +85,27 @@ class AgendaPersonal:
         self.descripcion_entry = ttk.Entry(input_frame, width=40)
         self.descripcion_entry.grid(row=1, column=1, columnspan=3, sticky=(tk.W, tk.E), padx=(0, 10), pady=5)
 
+        # Campos para la regla de repetición
+        ttk.Label(input_frame, text="Repetir:").grid(row=2, column=0, sticky=tk.W, padx=(0, 5), pady=5)
+        repeticion_frame = ttk.Frame(input_frame)
+        repeticion_frame.grid(row=2, column=1, columnspan=3, sticky=tk.W, pady=5)
+
+        self.recurrencia_var = tk.StringVar(value=RECURRENCIAS[0])
+        self.recurrencia_combo = ttk.Combobox(repeticion_frame, textvariable=self.recurrencia_var,
+                                              values=RECURRENCIAS, state='readonly', width=10)
+        self.recurrencia_combo.pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(repeticion_frame, text="Hasta (YYYY-MM-DD):").pack(side=tk.LEFT, padx=(0, 5))
+        self.fin_var = tk.StringVar()
+        ttk.Entry(repeticion_frame, textvariable=self.fin_var, width=12).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(repeticion_frame, text="Veces:").pack(side=tk.LEFT, padx=(0, 5))
+        self.repeticiones_var = tk.StringVar()
+        ttk.Entry(repeticion_frame, textvariable=self.repeticiones_var, width=6).pack(side=tk.LEFT)
+
         # Frame para los botones de acción
         botones_frame = ttk.Frame(input_frame)
-        botones_frame.grid(row=2, column=0, columnspan=4, pady=10)
+        botones_frame.grid(row=3, column=0, columnspan=4, pady=10)
 
         # Botón para agregar evento
         self.agregar_btn = ttk.Button(botones_frame, text="Agregar Evento", command=self.agregar_evento)
@@ -86,7 +120,22 @@ class AgendaPersonal:
         lista_frame = ttk.LabelFrame(main_frame, text="Eventos Programados", padding="10")
         lista_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
         lista_frame.columnconfigure(0, weight=1)
-        lista_frame.rowconfigure(0, weight=1)
+        lista_frame.rowconfigure(1, weight=1)
+
+        # Rango de fechas visible: solo se generan las ocurrencias de este rango
+        rango_frame = ttk.Frame(lista_frame)
+        rango_frame.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+
+        ttk.Label(rango_frame, text="Mostrar desde:").pack(side=tk.LEFT, padx=(0, 5))
+        self.desde_var = tk.StringVar(value=datetime.date.today().strftime("%Y-%m-%d"))
+        ttk.Entry(rango_frame, textvariable=self.desde_var, width=12).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(rango_frame, text="Días:").pack(side=tk.LEFT, padx=(0, 5))
+        self.dias_var = tk.StringVar(value=str(DIAS_VISIBLES))
+        ttk.Entry(rango_frame, textvariable=self.dias_var, width=5).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Button(rango_frame, text="Actualizar Vista",
+                   command=self.actualizar_treeview).pack(side=tk.LEFT)
 
         # TreeView para mostrar los eventos
         columnas = ('fecha', 'hora', 'descripcion')
@@ -107,8 +156,8 @@ class AgendaPersonal:
         self.treeview.configure(yscrollcommand=scrollbar.set)
 
         # Colocar TreeView y Scrollbar en la interfaz
-        self.treeview.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.treeview.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
 
         # Frame para el botón de salir
         salir_frame = ttk.Frame(main_frame)
@@ -140,20 +189,48 @@ class AgendaPersonal:
             messagebox.showerror("Error", "Formato de hora inválido. Use HH:MM")
             return
 
-        # Agregar el evento a la lista
-        evento = {
-            'fecha': fecha,
-            'hora': hora,
-            'descripcion': descripcion
-        }
-        self.eventos.append(evento)
+        recurrencia = self.leer_recurrencia(fecha)
+        if recurrencia is False:
+            return
 
-        # Actualizar el TreeView
-        self.actualizar_treeview()
+        # Agregar el evento al modelo (el TreeView se actualiza al recibir la notificación)
+        self.modelo.agregar(fecha, hora, descripcion, recurrencia)
 
         # Limpiar el campo de descripción
         self.descripcion_entry.delete(0, tk.END)
 
+    def leer_recurrencia(self, fecha):
+        """
+        Construye la regla de repetición a partir de los campos del formulario.
+        Devuelve None si el evento no se repite y False si los datos son inválidos.
+        """
+        frecuencia = self.recurrencia_var.get()
+        if frecuencia == RECURRENCIAS[0]:
+            return None
+
+        fin = self.fin_var.get().strip()
+        repeticiones = self.repeticiones_var.get().strip()
+
+        if fin:
+            if not self.validar_fecha(fin):
+                messagebox.showerror("Error", "Formato de fecha final inválido. Use YYYY-MM-DD")
+                return False
+            if fin < fecha:
+                messagebox.showerror("Error", "La fecha final no puede ser anterior a la fecha del evento")
+                return False
+
+        if repeticiones:
+            if not repeticiones.isdigit() or int(repeticiones) < 1:
+                messagebox.showerror("Error", "El número de repeticiones debe ser un entero positivo")
+                return False
+            repeticiones = int(repeticiones)
+
+        return {
+            'frecuencia': frecuencia,
+            'hasta': fin or None,
+            'repeticiones': repeticiones or None
+        }
+
     def eliminar_evento(self):
         """Elimina el evento seleccionado de la lista"""
         seleccion = self.treeview.selection()
@@ -161,32 +238,46 @@ class AgendaPersonal:
             messagebox.showwarning("Advertencia", "Por favor, seleccione un evento para eliminar")
             return
 
+        evento = self.eventos_por_item.get(seleccion[0])
+        if evento is None:
+            return
+
+        mensaje = "¿Está seguro de que desea eliminar el evento seleccionado?"
+        if evento.get('recurrencia'):
+            mensaje = "El evento se repite. ¿Desea eliminar toda la serie?"
+
         # Mostrar diálogo de confirmación
-        if messagebox.askyesno("Confirmar", "¿Está seguro de que desea eliminar el evento seleccionado?"):
-            # Obtener el índice del elemento seleccionado
-            index = int(seleccion[0].lstrip('I')) - 1
+        if messagebox.askyesno("Confirmar", mensaje):
+            # Eliminar el evento (o la serie completa) del modelo
+            self.modelo.eliminar(evento)
 
-            # Eliminar el evento de la lista
-            if 0 <= index < len(self.eventos):
-                del self.eventos[index]
+    def rango_visible(self):
+        """Devuelve el rango de fechas (desde, hasta) que se muestra en el TreeView"""
+        try:
+            desde = datetime.datetime.strptime(self.desde_var.get(), "%Y-%m-%d").date()
+        except ValueError:
+            desde = datetime.date.today()
+            self.desde_var.set(desde.strftime("%Y-%m-%d"))
 
-            # Actualizar el TreeView
-            self.actualizar_treeview()
+        dias = self.dias_var.get().strip()
+        dias = int(dias) if dias.isdigit() and int(dias) > 0 else DIAS_VISIBLES
+        return desde, desde + datetime.timedelta(days=dias - 1)
 
     def actualizar_treeview(self):
-        """Actualiza el TreeView con los eventos actuales"""
+        """Actualiza el TreeView con las ocurrencias del rango visible"""
         # Limpiar el TreeView
         for item in self.treeview.get_children():
             self.treeview.delete(item)
+        self.eventos_por_item.clear()
 
-        # Ordenar eventos por fecha y hora
-        eventos_ordenados = sorted(self.eventos, key=lambda x: (x['fecha'], x['hora']))
+        desde, hasta = self.rango_visible()
 
-        # Agregar eventos al TreeView
-        for evento in eventos_ordenados:
-            self.treeview.insert('', tk.END, values=(
-                evento['fecha'], evento['hora'], evento['descripcion']
+        # Agregar las ocurrencias al TreeView ordenadas por fecha y hora
+        for fecha, hora, evento in self.modelo.ocurrencias(desde, hasta):
+            item = self.treeview.insert('', tk.END, values=(
+                fecha.strftime("%Y-%m-%d"), hora, evento['descripcion']
             ))
+            self.eventos_por_item[item] = evento
 
     def validar_fecha(self, fecha_str):
         """Valida que el formato de fecha sea correcto (YYYY-MM-DD)"""
@@ -1,17 +1,34 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+# Los módulos compartidos viven en "PARCIAL 02/comun"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comun import IndiceBusqueda, ModeloTareas, ServicioPersistencia  # noqa: E402
+
+ARCHIVO_TAREAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tareas.json")
+
+# Milisegundos sin teclear antes de aplicar el filtro de búsqueda
+FILTER_DELAY_MS = 150
+
 
 class TodoApp:
-    def __init__(self, root):
+    def __init__(self, root, tasks_file=ARCHIVO_TAREAS):
         # Configuración de la ventana principal
         self.root = root
         self.root.title("Lista de Tareas")
         self.root.geometry("500x400")
         self.root.resizable(True, True)
 
-        # Lista para almacenar las tareas (cada tarea es un diccionario con texto y estado)
-        self.tasks = []
+        # Modelo de tareas sin interfaz (cada tarea es un diccionario con id, texto y estado)
+        self.model = ModeloTareas()
+        self.model.suscribir(self.on_model_changed)
+
+        # Índice de búsqueda e ids de las tareas visibles en la lista (en orden de fila)
+        self.search_index = IndiceBusqueda()
+        self.visible_ids = []
+        self.filter_job = None
 
         # Inicializar atributos de instancia
         self.task_entry = None
@@ -20,6 +37,7 @@ class TodoApp:
         self.complete_button = None
         self.delete_button = None
         self.clear_completed_button = None
+        self.search_var = None
 
         # Crear y configurar los elementos de la interfaz
         self.create_widgets()
@@ -27,6 +45,11 @@ class TodoApp:
         # Vincular la tecla Enter al campo de entrada
         self.task_entry.bind('<Return>', lambda event: self.add_task())
 
+        # Persistencia en segundo plano: el disco nunca bloquea la interfaz
+        self.persistence = ServicioPersistencia(self.root, tasks_file)
+        self.persistence.cargar(self.on_tasks_loaded)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def create_widgets(self):
         """Crea y organiza todos los elementos de la interfaz gráfica"""
 
@@ -88,6 +111,13 @@ class TodoApp:
                                                  command=self.clear_completed)
         self.clear_completed_button.grid(row=0, column=2, padx=(5, 0), sticky="ew")
 
+        # Buscador: filtra las tareas visibles mientras se escribe
+        ttk.Label(main_frame, text="Buscar:").grid(row=3, column=0, sticky="w", pady=(10, 0))
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self.schedule_filter())
+        search_entry = ttk.Entry(main_frame, textvariable=self.search_var)
+        search_entry.grid(row=3, column=1, columnspan=2, sticky="ew", pady=(10, 0))
+
     def add_task(self):
         """Añade una nueva tarea a la lista"""
         task_text = self.task_entry.get().strip()
@@ -97,17 +127,9 @@ class TodoApp:
             messagebox.showwarning("Advertencia", "Por favor, ingresa una tarea.")
             return
 
-        # Crear nueva tarea (inicialmente no completada)
-        new_task = {
-            "text": task_text,
-            "completed": False
-        }
-
-        # Añadir a la lista de tareas
-        self.tasks.append(new_task)
-
-        # Actualizar la visualización de la lista
-        self.update_task_list()
+        # Añadir la tarea al modelo (inicialmente no completada); la lista
+        # se actualiza al recibir el evento en on_model_changed
+        self.model.agregar(task_text)
 
         # Limpiar el campo de entrada y enfocarlo para nueva entrada
         self.task_entry.delete(0, tk.END)
@@ -115,37 +137,31 @@ class TodoApp:
 
     def mark_completed(self):
         """Marca la tarea seleccionada como completada"""
-        selected_index = self.get_selected_index()
+        selected_id = self.get_selected_id()
 
         # Validar que haya una tarea seleccionada
-        if selected_index is None:
+        if selected_id is None:
             messagebox.showwarning("Advertencia", "Por favor, selecciona una tarea.")
             return
 
         # Cambiar el estado de la tarea
-        self.tasks[selected_index]["completed"] = not self.tasks[selected_index]["completed"]
-
-        # Actualizar la visualización
-        self.update_task_list()
+        self.model.alternar(selected_id)
 
     def toggle_task_completion(self, event):
         """Alterna el estado de completado de una tarea con doble clic"""
         # Obtener el índice de la tarea bajo el cursor
-        index = self.task_listbox.nearest(event.y)
+        row = self.task_listbox.nearest(event.y)
 
-        if 0 <= index < len(self.tasks):
+        if 0 <= row < len(self.visible_ids):
             # Cambiar el estado de la tarea
-            self.tasks[index]["completed"] = not self.tasks[index]["completed"]
-
-            # Actualizar la visualización
-            self.update_task_list()
+            self.model.alternar(self.visible_ids[row])
 
     def delete_task(self):
         """Elimina la tarea seleccionada"""
-        selected_index = self.get_selected_index()
+        selected_id = self.get_selected_id()
 
         # Validar que haya una tarea seleccionada
-        if selected_index is None:
+        if selected_id is None:
             messagebox.showwarning("Advertencia", "Por favor, selecciona una tarea para eliminar.")
             return
 
@@ -153,32 +169,63 @@ class TodoApp:
         confirm = messagebox.askyesno("Confirmar", "¿Estás seguro de que quieres eliminar esta tarea?")
 
         if confirm:
-            # Eliminar la tarea de la lista
-            del self.tasks[selected_index]
-
-            # Actualizar la visualización
-            self.update_task_list()
+            # Eliminar la tarea del modelo
+            self.model.eliminar(selected_id)
 
     def clear_completed(self):
         """Elimina todas las tareas marcadas como completadas"""
-        # Filtrar solo las tareas no completadas
-        self.tasks = [task for task in self.tasks if not task["completed"]]
-
-        # Actualizar la visualización
-        self.update_task_list()
+        self.model.limpiar_completadas()
 
-    def get_selected_index(self):
-        """Obtiene el índice de la tarea seleccionada en la lista"""
+    def get_selected_id(self):
+        """Obtiene el id de la tarea seleccionada en la lista"""
         selection = self.task_listbox.curselection()
-        return selection[0] if selection else None
+        return self.visible_ids[selection[0]] if selection else None
+
+    def on_tasks_loaded(self, data):
+        """Recibe (en el hilo de Tk) las tareas leídas del archivo"""
+        if data:
+            self.model.cargar(data)
+
+    def on_close(self):
+        """Guarda los cambios pendientes antes de cerrar la ventana"""
+        self.persistence.cerrar()
+        self.root.destroy()
+
+    def on_model_changed(self, event, *data):
+        """Actualiza el índice, la lista y el guardado cuando cambia el modelo"""
+        if event == "agregada":
+            self.search_index.agregar(data[0]["id"], data[0]["text"])
+        elif event == "eliminadas":
+            for task in data[0]:
+                self.search_index.eliminar(task["id"])
+        elif event == "recargada":
+            self.search_index.reconstruir((task["id"], task["text"]) for task in self.model)
+
+        if event != "recargada":
+            self.persistence.programar_guardado(self.model.instantanea)
+        self.render_task_list()
+
+    def schedule_filter(self):
+        """Retrasa el filtrado hasta que el usuario deja de escribir"""
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(FILTER_DELAY_MS, self.apply_filter)
+
+    def apply_filter(self):
+        """Aplica el texto del buscador sin reconstruir el índice"""
+        self.filter_job = None
+        self.render_task_list()
+
+    def render_task_list(self):
+        """Muestra en la lista las tareas que coinciden con la búsqueda"""
+        self.visible_ids = self.search_index.filtrar(self.search_var.get())
 
-    def update_task_list(self):
-        """Actualiza la visualización de la lista de tareas"""
         # Limpiar la lista actual
         self.task_listbox.delete(0, tk.END)
 
         # Añadir cada tarea con formato según su estado
-        for i, task in enumerate(self.tasks):
+        for i, task_id in enumerate(self.visible_ids):
+            task = self.model.obtener(task_id)
             task_text = task["text"]
 
             # Aplicar formato diferente para tareas completadas
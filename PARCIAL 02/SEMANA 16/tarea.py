@@ -1,17 +1,33 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Dict, Any
 
+# Los módulos compartidos viven en "PARCIAL 02/comun"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from comun import IndiceBusqueda, ModeloTareas, ServicioPersistencia  # noqa: E402
+
+ARCHIVO_TAREAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tareas.json")
+
+# Milisegundos sin teclear antes de aplicar el filtro de búsqueda
+FILTER_DELAY_MS = 150
+
 
 class TaskManagerApp:
-    def __init__(self, root):
+    def __init__(self, root, tasks_file: str = ARCHIVO_TAREAS):
         self.root = root
         self.root.title("Gestor de Tareas")
         self.root.geometry("600x400")
         self.root.configure(bg='#f0f0f0')
 
-        # Lista para almacenar las tareas
-        self.tasks: List[Dict[str, Any]] = []
+        # Modelo de tareas sin interfaz: la vista se actualiza al recibir sus eventos
+        self.model = ModeloTareas()
+        self.model.suscribir(self.on_model_changed)
+
+        # Índice para filtrar las tareas mientras se escribe en el buscador
+        self.search_index = IndiceBusqueda()
+        self.filter_job = None
 
         # Definir atributos de la interfaz
         self.task_entry: ttk.Entry
@@ -19,6 +35,7 @@ class TaskManagerApp:
         self.complete_button: ttk.Button
         self.delete_button: ttk.Button
         self.task_tree: ttk.Treeview
+        self.search_var: tk.StringVar
 
         # Configurar el estilo
         self.setup_styles()
@@ -29,6 +46,11 @@ class TaskManagerApp:
         # Configurar atajos de teclado
         self.setup_keyboard_shortcuts()
 
+        # Persistencia en segundo plano: el disco nunca bloquea la interfaz
+        self.persistence = ServicioPersistencia(self.root, tasks_file)
+        self.persistence.cargar(self.on_tasks_loaded)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     @staticmethod
     def setup_styles():
         """Configurar estilos para la aplicación"""
@@ -87,7 +109,7 @@ class TaskManagerApp:
         list_frame = ttk.LabelFrame(main_frame, text="Lista de Tareas", padding="5")
         list_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         list_frame.columnconfigure(0, weight=1)
-        list_frame.rowconfigure(0, weight=1)
+        list_frame.rowconfigure(1, weight=1)
 
         # Crear Treeview para mostrar las tareas
         self.create_task_list(list_frame)
@@ -100,9 +122,23 @@ class TaskManagerApp:
 
     def create_task_list(self, parent):
         """Crear la lista de tareas usando Treeview"""
+        # Buscador: filtra las tareas visibles mientras se escribe
+        search_frame = ttk.Frame(parent)
+        search_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        search_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(search_frame, text="Buscar:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add('write', lambda *args: self.schedule_filter())
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
+
+        # Sin la etiqueta de la ventana, escribir "c" o "d" no dispara los atajos
+        search_entry.bindtags((str(search_entry), 'TEntry', 'all'))
+
         # Crear Treeview con una columna
         self.task_tree = ttk.Treeview(parent, columns=('status', 'task'), show='tree headings', height=12)
-        self.task_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.task_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         # Configurar columnas
         self.task_tree.heading('#0', text='#')
@@ -116,7 +152,7 @@ class TaskManagerApp:
 
         # Scrollbar para la lista
         scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.task_tree.yview)
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
         self.task_tree.configure(yscrollcommand=scrollbar.set)
 
         # Bind para selección simple
@@ -137,7 +173,7 @@ class TaskManagerApp:
         self.root.bind('<D>', lambda event: self.delete_task())
 
         # Escape para salir
-        self.root.bind('<Escape>', lambda event: self.root.quit())
+        self.root.bind('<Escape>', lambda event: self.on_close())
 
         # Bind especial para el campo de entrada (evitar conflicto con Enter)
         self.task_entry.bind('<Return>', lambda event: self.add_task())
@@ -159,17 +195,8 @@ class TaskManagerApp:
         task_text = self.task_entry.get().strip()
 
         if task_text:
-            # Añadir a la lista interna
-            task_id = len(self.tasks) + 1
-            task_data = {
-                'id': task_id,
-                'text': task_text,
-                'completed': False
-            }
-            self.tasks.append(task_data)
-
-            # Añadir a la vista
-            self.refresh_task_list()
+            # Añadir al modelo (la vista se actualiza en on_model_changed)
+            self.model.agregar(task_text)
 
             # Limpiar campo de entrada
             self.task_entry.delete(0, tk.END)
@@ -187,11 +214,9 @@ class TaskManagerApp:
         selection = self.task_tree.selection()
         if selection:
             item = selection[0]
-            task_id = int(self.task_tree.item(item, 'text')) - 1
+            task_id = int(self.task_tree.item(item, 'text'))
 
-            if 0 <= task_id < len(self.tasks):
-                self.tasks[task_id]['completed'] = True
-                self.refresh_task_list()
+            if self.model.alternar(task_id, completada=True) is not None:
                 self.show_status_message("Tarea marcada como completada")
 
         self.task_entry.focus()
@@ -201,34 +226,66 @@ class TaskManagerApp:
         selection = self.task_tree.selection()
         if selection:
             item = selection[0]
-            task_id = int(self.task_tree.item(item, 'text')) - 1
+            task_id = int(self.task_tree.item(item, 'text'))
+            task = self.model.obtener(task_id)
 
-            if 0 <= task_id < len(self.tasks):
-                task_text = self.tasks[task_id]['text']
+            if task is not None:
+                task_text = task['text']
 
                 # Confirmar eliminación
                 if messagebox.askyesno("Confirmar eliminación",
                                        f"¿Estás seguro de que quieres eliminar la tarea: '{task_text}'?"):
-                    # Eliminar de la lista
-                    del self.tasks[task_id]
-
-                    # Reindexar las tareas
-                    for i, task in enumerate(self.tasks):
-                        task['id'] = i + 1
-
-                    self.refresh_task_list()
+                    # Eliminar del modelo (los ids de las demás tareas no cambian)
+                    self.model.eliminar(task_id)
                     self.show_status_message("Tarea eliminada")
 
         self.task_entry.focus()
 
-    def refresh_task_list(self):
-        """Actualizar la lista visual de tareas"""
+    def on_tasks_loaded(self, data: List[Dict[str, Any]]):
+        """Recibir (en el hilo de Tk) las tareas leídas del archivo"""
+        if data:
+            self.model.cargar(data)
+
+    def on_close(self):
+        """Guardar los cambios pendientes antes de cerrar la ventana"""
+        self.persistence.cerrar()
+        self.root.destroy()
+
+    def on_model_changed(self, event: str, *data: Any):
+        """Actualizar el índice, la vista y el guardado cuando cambia el modelo"""
+        if event == 'agregada':
+            self.search_index.agregar(data[0]['id'], data[0]['text'])
+        elif event == 'eliminadas':
+            for task in data[0]:
+                self.search_index.eliminar(task['id'])
+        elif event == 'recargada':
+            self.search_index.reconstruir((task['id'], task['text']) for task in self.model)
+
+        if event != 'recargada':
+            self.persistence.programar_guardado(self.model.instantanea)
+        self.render_task_list()
+
+    def schedule_filter(self):
+        """Retrasar el filtrado hasta que el usuario deja de escribir"""
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(FILTER_DELAY_MS, self.apply_filter)
+
+    def apply_filter(self):
+        """Aplicar el texto del buscador sin reconstruir el índice"""
+        self.filter_job = None
+        self.render_task_list()
+        self.on_task_select()
+
+    def render_task_list(self):
+        """Mostrar las tareas que coinciden con la búsqueda"""
         # Limpiar lista actual
         for item in self.task_tree.get_children():
             self.task_tree.delete(item)
 
-        # Añadir todas las tareas
-        for task in self.tasks:
+        # Añadir las tareas visibles
+        for task_id in self.search_index.filtrar(self.search_var.get()):
+            task = self.model.obtener(task_id)
             status = "✓ Completada" if task['completed'] else "⏳ Pendiente"
             tags = ('completed',) if task['completed'] else ('pending',)
 
@@ -0,0 +1,230 @@
+"""
+Benchmark de las aplicaciones de tareas y agenda del PARCIAL 02.
+
+Tiene dos modos:
+- modelo: ejecuta entre miles y millones de operaciones sintéticas sobre los modelos
+  de comun.modelo, sin interfaz gráfica.
+- gui: abre cada aplicación (SEMANA 13, 14, 15 y 16) y mide la latencia de
+  actualización de los widgets por operación. Necesita una pantalla; en un
+  servidor se puede usar Xvfb.
+
+Uso:
+    python benchmark_apps.py modelo --ops 10000 100000 1000000
+    xvfb-run -a python benchmark_apps.py gui --ops 1000
+"""
+
+import argparse
+import datetime
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from comun import IndiceBusqueda, ModeloAgenda, ModeloTareas, generar_ocurrencias  # noqa: E402
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+PALABRAS = ("comprar", "pan", "leche", "llamar", "médico", "pagar", "luz", "agua", "enviar",
+            "informe", "revisar", "código", "estudiar", "examen", "limpiar", "casa", "reunión")
+
+
+def texto_aleatorio(rng):
+    return " ".join(rng.choice(PALABRAS) for _ in range(rng.randint(2, 5)))
+
+
+def medir(nombre, n, funcion):
+    """Ejecuta funcion() una vez y muestra el tiempo total y las operaciones por segundo"""
+    inicio = time.perf_counter()
+    funcion()
+    total = time.perf_counter() - inicio
+    print(f"  {nombre:<28} {n:>9} ops  {total:8.3f} s  {n / total if total else 0:>12,.0f} ops/s")
+
+
+# ---------- Modo modelo (sin interfaz) ----------
+
+def benchmark_modelo_tareas(n, rng):
+    modelo = ModeloTareas()
+    indice = IndiceBusqueda()
+    notificaciones = [0]
+
+    def observador(evento, *datos):
+        notificaciones[0] += 1
+        if evento == 'agregada':
+            indice.agregar(datos[0]['id'], datos[0]['text'])
+        elif evento == 'eliminadas':
+            for tarea in datos[0]:
+                indice.eliminar(tarea['id'])
+
+    modelo.suscribir(observador)
+    textos = [texto_aleatorio(rng) for _ in range(n)]
+
+    medir("agregar", n, lambda: [modelo.agregar(t) for t in textos])
+    ids = [tarea['id'] for tarea in modelo]
+    aleatorios = [rng.choice(ids) for _ in range(n)]
+    medir("alternar", n, lambda: [modelo.alternar(i) for i in aleatorios])
+
+    consulta = "comprar pan"
+    medir("filtrar (tecla a tecla)", len(consulta),
+          lambda: [indice.filtrar(consulta[:k]) for k in range(1, len(consulta) + 1)])
+
+    medir("instantanea", 1, modelo.instantanea)
+    rng.shuffle(ids)
+    medir("eliminar", n, lambda: [modelo.eliminar(i) for i in ids])
+    print(f"  notificaciones recibidas: {notificaciones[0]}")
+
+
+def benchmark_modelo_agenda(n, rng):
+    modelo = ModeloAgenda()
+    frecuencias = (None, 'Diaria', 'Semanal', 'Mensual')
+    hoy = datetime.date.today()
+
+    def agregar():
+        for _ in range(n):
+            fecha = hoy - datetime.timedelta(days=rng.randint(0, 3650))
+            frecuencia = rng.choice(frecuencias)
+            regla = {'frecuencia': frecuencia, 'hasta': None, 'repeticiones': None} if frecuencia else None
+            modelo.agregar(fecha.strftime("%Y-%m-%d"), f"{rng.randint(0, 23):02d}:00",
+                           texto_aleatorio(rng), regla)
+
+    medir("agregar eventos", n, agregar)
+    hasta = hoy + datetime.timedelta(days=29)
+    visibles = []
+
+    def listar_ocurrencias():
+        visibles[:] = [(fecha, hora, evento['descripcion']) for fecha, hora, evento in modelo.ocurrencias(hoy, hasta)]
+
+    medir("ocurrencias (30 días)", 1, listar_ocurrencias)
+    print(f"  ocurrencias visibles: {len(visibles)}")
+
+    # Verificación: cada ocurrencia debe llevar la fecha, hora y descripción de su propio evento
+    esperadas = sorted((fecha, evento['hora'], evento['descripcion'])
+                       for evento in modelo.eventos
+                       for fecha in generar_ocurrencias(evento, hoy, hasta))
+    if sorted(visibles) != esperadas:
+        raise AssertionError("Las ocurrencias no coinciden con las de cada evento")
+    if any(anterior[:2] > actual[:2] for anterior, actual in zip(visibles, visibles[1:])):
+        raise AssertionError("Las ocurrencias no están ordenadas por fecha y hora")
+
+
+def ejecutar_modelo(operaciones):
+    rng = random.Random(42)
+    for n in operaciones:
+        print(f"\n== ModeloTareas, {n} tareas ==")
+        benchmark_modelo_tareas(n, rng)
+        print(f"\n== ModeloAgenda, {n} eventos ==")
+        benchmark_modelo_agenda(n, rng)
+
+
+# ---------- Modo gui (necesita pantalla) ----------
+
+def cargar_modulo(nombre, ruta_relativa):
+    ruta = os.path.join(DIRECTORIO, ruta_relativa)
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def escribir(entrada, texto):
+    entrada.delete(0, 'end')
+    entrada.insert(0, texto)
+
+
+def seleccionar_primero_treeview(arbol):
+    hijos = arbol.get_children()
+    if hijos:
+        arbol.selection_set(hijos[0])
+
+
+def seleccionar_primero_listbox(lista):
+    lista.selection_clear(0, 'end')
+    lista.selection_set(0)
+
+
+# (nombre, archivo, clase, usa archivo de tareas, agregar, eliminar)
+APLICACIONES = (
+    ("SEMANA 13", os.path.join("SEMANA 13", "aplicacion.py"), "TaskManagerApp", True,
+     lambda app, t: (escribir(app.task_entry, t), app.add_task()),
+     lambda app: (seleccionar_primero_treeview(app.tree), app.delete_task())),
+    ("SEMANA 14", os.path.join("SEMANA 14", "agendapersonal.py"), "AgendaPersonal", False,
+     lambda app, t: (escribir(app.descripcion_entry, t), app.agregar_evento()),
+     lambda app: (seleccionar_primero_treeview(app.treeview), app.eliminar_evento())),
+    ("SEMANA 15", os.path.join("SEMANA 15", "ListaTareas.py"), "TodoApp", True,
+     lambda app, t: (escribir(app.task_entry, t), app.add_task()),
+     lambda app: (seleccionar_primero_listbox(app.task_listbox), app.delete_task())),
+    ("SEMANA 16", os.path.join("SEMANA 16", "tarea.py"), "TaskManagerApp", True,
+     lambda app, t: (escribir(app.task_entry, t), app.add_task()),
+     lambda app: (seleccionar_primero_treeview(app.task_tree), app.delete_task())),
+)
+
+
+def latencias(root, n, operacion):
+    """Mide cada operación hasta que Tk termina de redibujar los widgets"""
+    muestras = []
+    for i in range(n):
+        inicio = time.perf_counter()
+        operacion(i)
+        root.update()
+        muestras.append((time.perf_counter() - inicio) * 1000)
+    return muestras
+
+
+def resumir(nombre, muestras):
+    percentiles = statistics.quantiles(muestras, n=100)
+    print(f"  {nombre:<10} p50 {percentiles[49]:7.2f} ms  p95 {percentiles[94]:7.2f} ms  "
+          f"p99 {percentiles[98]:7.2f} ms  máx {max(muestras):7.2f} ms")
+
+
+def ejecutar_gui(operaciones):
+    import tkinter as tk
+    from tkinter import messagebox
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        print("No hay pantalla disponible. Ejecute con: xvfb-run -a python benchmark_apps.py gui")
+        sys.exit(1)
+
+    # Los diálogos bloquearían el benchmark: se confirman automáticamente
+    messagebox.askyesno = lambda *args, **kwargs: True
+    messagebox.showwarning = messagebox.showerror = lambda *args, **kwargs: None
+
+    rng = random.Random(42)
+    for n in operaciones:
+        for nombre, ruta, clase, usa_archivo, agregar, eliminar in APLICACIONES:
+            modulo = cargar_modulo(clase.lower(), ruta)
+            root = tk.Tk()
+            with tempfile.TemporaryDirectory() as temporal:
+                kwargs = {'tasks_file': os.path.join(temporal, "tareas.json")} if usa_archivo else {}
+                app = getattr(modulo, clase)(root, **kwargs)
+                root.update()
+
+                textos = [texto_aleatorio(rng) for _ in range(n)]
+                print(f"\n== {nombre} ({clase}), {n} operaciones ==")
+                resumir("agregar", latencias(root, n, lambda i: agregar(app, textos[i])))
+                resumir("eliminar", latencias(root, n, lambda i: eliminar(app)))
+
+                if usa_archivo:
+                    app.persistence.cerrar()
+            root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de las aplicaciones de tareas y agenda")
+    parser.add_argument("modo", choices=("modelo", "gui"))
+    parser.add_argument("--ops", type=int, nargs="+", default=None,
+                        help="Número de operaciones por corrida")
+    args = parser.parse_args()
+
+    if args.modo == "modelo":
+        ejecutar_modelo(args.ops or [10_000, 100_000, 1_000_000])
+    else:
+        ejecutar_gui(args.ops or [1_000])
+
+
+if __name__ == "__main__":
+    main()
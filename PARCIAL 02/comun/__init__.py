@@ -0,0 +1,17 @@
+"""
+Módulos compartidos por las aplicaciones del PARCIAL 02.
+"""
+
+from .filtro import IndiceBusqueda
+from .modelo import ModeloAgenda, ModeloTareas, Observable, generar_ocurrencias, sumar_meses
+from .persistencia import ServicioPersistencia
+
+__all__ = [
+    'IndiceBusqueda',
+    'ModeloAgenda',
+    'ModeloTareas',
+    'Observable',
+    'ServicioPersistencia',
+    'generar_ocurrencias',
+    'sumar_meses',
+]
@@ -0,0 +1,137 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+# Largo máximo de los fragmentos (n-gramas) indexados de cada palabra
+LARGO_GRAMA = 3
+
+
+def _terminos(consulta: str) -> Tuple[str, ...]:
+    """Divide una consulta en términos en minúsculas"""
+    return tuple(consulta.lower().split())
+
+
+def _gramas(texto: str) -> Set[str]:
+    """Fragmentos de 1 a LARGO_GRAMA caracteres de cada palabra del texto"""
+    gramas = set()
+    for palabra in texto.split():
+        for largo in range(1, LARGO_GRAMA + 1):
+            for inicio in range(len(palabra) - largo + 1):
+                gramas.add(palabra[inicio:inicio + largo])
+    return gramas
+
+
+class IndiceBusqueda:
+    """
+    Índice de búsqueda para filtrar tareas mientras el usuario escribe.
+
+    Una tarea coincide si contiene todos los términos de la consulta (como
+    subcadenas, sin distinguir mayúsculas). Para no recorrer todas las tareas en
+    cada tecla, el índice guarda, para cada fragmento de 1 a 3 caracteres, el
+    conjunto de tareas que lo contienen:
+    - un término de hasta 3 caracteres se resuelve con un solo conjunto;
+    - uno más largo intersecta los conjuntos de sus fragmentos de 3 y solo
+      verifica el texto de las tareas que quedan.
+    """
+
+    def __init__(self):
+        self._textos: Dict[Hashable, str] = {}
+        self._orden: Dict[Hashable, int] = {}  # Posición de inserción, para devolver los resultados en orden
+        self._siguiente = 0
+        self._apariciones: Dict[str, Set[Hashable]] = {}
+        self._ultimos_terminos: Tuple[str, ...] = ()
+        # Resultado de la última consulta (dict para conservar el orden y borrar en O(1))
+        self._ultimo_resultado: Optional[Dict[Hashable, None]] = None
+
+    @staticmethod
+    def _coincide(texto: str, terminos: Tuple[str, ...]) -> bool:
+        return all(termino in texto for termino in terminos)
+
+    def _indexar(self, clave: Hashable, texto: str) -> None:
+        for grama in _gramas(texto):
+            claves = self._apariciones.get(grama)
+            if claves is None:
+                claves = self._apariciones[grama] = set()
+            claves.add(clave)
+
+    def _desindexar(self, clave: Hashable, texto: str) -> None:
+        for grama in _gramas(texto):
+            claves = self._apariciones[grama]
+            claves.discard(clave)
+            if not claves:
+                del self._apariciones[grama]
+
+    def agregar(self, clave: Hashable, texto: str) -> None:
+        """Agrega o actualiza una tarea en el índice"""
+        texto = texto.lower()
+        anterior = self._textos.get(clave)
+        if anterior is not None:
+            self._desindexar(clave, anterior)
+        else:
+            self._orden[clave] = self._siguiente
+            self._siguiente += 1
+        self._textos[clave] = texto
+        self._indexar(clave, texto)
+        if self._ultimo_resultado is not None:
+            if self._coincide(texto, self._ultimos_terminos):
+                self._ultimo_resultado[clave] = None
+            else:
+                self._ultimo_resultado.pop(clave, None)
+
+    def eliminar(self, clave: Hashable) -> None:
+        """Quita una tarea del índice"""
+        texto = self._textos.pop(clave, None)
+        if texto is not None:
+            self._desindexar(clave, texto)
+            del self._orden[clave]
+        if self._ultimo_resultado is not None:
+            self._ultimo_resultado.pop(clave, None)
+
+    def reconstruir(self, pares: Iterable[Tuple[Hashable, str]]) -> None:
+        """Reemplaza todo el índice por los pares (clave, texto) dados"""
+        self._textos = {clave: texto.lower() for clave, texto in pares}
+        self._orden = {clave: posicion for posicion, clave in enumerate(self._textos)}
+        self._siguiente = len(self._textos)
+        self._apariciones = {}
+        for clave, texto in self._textos.items():
+            self._indexar(clave, texto)
+        self._ultimo_resultado = None
+        if self._ultimos_terminos:
+            self._ultimo_resultado = dict.fromkeys(self._buscar(self._ultimos_terminos))
+
+    def es_visible(self, clave: Hashable) -> bool:
+        """Indica si la tarea forma parte del resultado de la última consulta"""
+        return self._ultimo_resultado is None or clave in self._ultimo_resultado
+
+    def _candidatos(self, termino: str) -> Set[Hashable]:
+        """Tareas que contienen todos los fragmentos del término (exacto si el término es corto)"""
+        if len(termino) <= LARGO_GRAMA:
+            return self._apariciones.get(termino, set())
+        conjuntos = sorted((self._apariciones.get(termino[i:i + LARGO_GRAMA], set())
+                            for i in range(len(termino) - LARGO_GRAMA + 1)), key=len)
+        return conjuntos[0].intersection(*conjuntos[1:])
+
+    def _buscar(self, terminos: Tuple[str, ...]) -> List[Hashable]:
+        conjuntos = sorted((self._candidatos(termino) for termino in terminos), key=len)
+        candidatos = conjuntos[0].intersection(*conjuntos[1:])
+
+        # Los fragmentos no garantizan el orden de las letras en términos largos: se verifica el texto
+        textos = self._textos
+        for termino in terminos:
+            if len(termino) > LARGO_GRAMA:
+                candidatos = {clave for clave in candidatos if termino in textos[clave]}
+
+        if 4 * len(candidatos) > len(self._textos):
+            return [clave for clave in self._textos if clave in candidatos]
+        return sorted(candidatos, key=self._orden.__getitem__)
+
+    def filtrar(self, consulta: str) -> List[Hashable]:
+        """Devuelve las claves de las tareas que coinciden, en orden de inserción"""
+        terminos = _terminos(consulta)
+        if not terminos:
+            self._ultimos_terminos = ()
+            self._ultimo_resultado = None
+            return list(self._textos)
+
+        resultado = self._buscar(terminos)
+        self._ultimos_terminos = terminos
+        self._ultimo_resultado = dict.fromkeys(resultado)
+        return resultado
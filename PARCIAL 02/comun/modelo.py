@@ -0,0 +1,230 @@
+import calendar
+import datetime
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Observable:
+    """
+    Base del patrón observador: los observadores son funciones que reciben
+    el nombre del evento y los datos asociados.
+    """
+
+    def __init__(self):
+        self._observadores: List[Callable[..., None]] = []
+
+    def suscribir(self, observador: Callable[..., None]) -> Callable[..., None]:
+        """Registra un observador y lo devuelve (permite usarlo como decorador)"""
+        self._observadores.append(observador)
+        return observador
+
+    def desuscribir(self, observador: Callable[..., None]) -> None:
+        """Deja de notificar al observador"""
+        self._observadores.remove(observador)
+
+    def _notificar(self, evento: str, *datos: Any) -> None:
+        for observador in list(self._observadores):
+            observador(evento, *datos)
+
+
+class ModeloTareas(Observable):
+    """
+    Lista de tareas sin ninguna dependencia de la interfaz gráfica.
+
+    Cada tarea es un diccionario con 'id', 'text' y 'completed'. Las tareas se guardan
+    en un OrderedDict indexado por id, así que buscar, modificar y borrar son O(1).
+
+    Eventos notificados:
+        'agregada' (tarea), 'actualizada' (tarea), 'eliminadas' (lista de tareas),
+        'recargada' ()
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._tareas: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        # Generador de ids monótono: un id nunca se reutiliza tras un borrado
+        self._ids = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._tareas)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._tareas.values())
+
+    def __contains__(self, id_tarea: int) -> bool:
+        return id_tarea in self._tareas
+
+    def obtener(self, id_tarea: int) -> Optional[Dict[str, Any]]:
+        return self._tareas.get(id_tarea)
+
+    def agregar(self, texto: str) -> Dict[str, Any]:
+        """Crea una tarea pendiente y la devuelve"""
+        texto = texto.strip()
+        if not texto:
+            raise ValueError("La tarea no puede estar vacía")
+        tarea = {'id': next(self._ids), 'text': texto, 'completed': False}
+        self._tareas[tarea['id']] = tarea
+        self._notificar('agregada', tarea)
+        return tarea
+
+    def alternar(self, id_tarea: int, completada: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Cambia (o fija, si se indica completada) el estado de una tarea"""
+        tarea = self._tareas.get(id_tarea)
+        if tarea is None:
+            return None
+        tarea['completed'] = (not tarea['completed']) if completada is None else completada
+        self._notificar('actualizada', tarea)
+        return tarea
+
+    def eliminar(self, *ids: int) -> List[Dict[str, Any]]:
+        """Elimina varias tareas en una sola pasada y devuelve las eliminadas"""
+        eliminadas = [tarea for tarea in (self._tareas.pop(i, None) for i in ids) if tarea is not None]
+        if eliminadas:
+            self._notificar('eliminadas', eliminadas)
+        return eliminadas
+
+    def limpiar_completadas(self) -> List[Dict[str, Any]]:
+        """Elimina todas las tareas completadas"""
+        return self.eliminar(*[i for i, tarea in self._tareas.items() if tarea['completed']])
+
+    def cargar(self, datos: Iterable[Any]) -> None:
+        """
+        Antepone tareas guardadas (diccionarios o pares [id, texto]). La numeración
+        continúa tras el mayor id cargado y las tareas que ya existían se renumeran.
+        """
+        cargadas: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        for dato in datos:
+            if isinstance(dato, dict):
+                tarea = {'id': dato.get('id'), 'text': dato['text'], 'completed': bool(dato.get('completed'))}
+            else:
+                tarea = {'id': dato[0], 'text': dato[1], 'completed': False}
+            if tarea['id'] is None or int(tarea['id']) in cargadas:
+                tarea['id'] = max(cargadas, default=0) + 1
+            tarea['id'] = int(tarea['id'])
+            cargadas[tarea['id']] = tarea
+
+        self._ids = itertools.count(max(cargadas, default=0) + 1)
+        for tarea in self._tareas.values():
+            tarea['id'] = next(self._ids)
+            cargadas[tarea['id']] = tarea
+        self._tareas = cargadas
+        self._notificar('recargada')
+
+    def instantanea(self) -> List[Dict[str, Any]]:
+        """Copia serializable de las tareas"""
+        return [dict(tarea) for tarea in self._tareas.values()]
+
+
+def sumar_meses(fecha: datetime.date, meses: int) -> datetime.date:
+    """Suma meses a una fecha ajustando el día al último del mes si no existe"""
+    total = fecha.month - 1 + meses
+    anio, mes = fecha.year + total // 12, total % 12 + 1
+    dia = min(fecha.day, calendar.monthrange(anio, mes)[1])
+    return datetime.date(anio, mes, dia)
+
+
+def generar_ocurrencias(evento: Dict[str, Any], desde: datetime.date,
+                        hasta: datetime.date) -> Iterator[datetime.date]:
+    """
+    Genera las fechas de un evento comprendidas entre desde y hasta (inclusive).
+
+    Las ocurrencias se calculan bajo demanda: se salta directamente a la primera
+    fecha visible, por lo que el costo depende del rango mostrado y no de la
+    duración total de la serie.
+    """
+    inicio = datetime.datetime.strptime(evento['fecha'], "%Y-%m-%d").date()
+    regla = evento.get('recurrencia')
+
+    if not regla:
+        if desde <= inicio <= hasta:
+            yield inicio
+        return
+
+    if regla.get('hasta'):
+        fin = datetime.datetime.strptime(regla['hasta'], "%Y-%m-%d").date()
+        hasta = min(hasta, fin)
+    repeticiones = regla.get('repeticiones')
+
+    frecuencia = regla['frecuencia']
+    if frecuencia == 'Mensual':
+        # Primer índice de ocurrencia cuyo mes cae dentro del rango
+        n = max(0, (desde.year - inicio.year) * 12 + desde.month - inicio.month)
+        while True:
+            if repeticiones is not None and n >= repeticiones:
+                return
+            fecha = sumar_meses(inicio, n)
+            if fecha > hasta:
+                return
+            if fecha >= desde:
+                yield fecha
+            n += 1
+    else:
+        paso = 1 if frecuencia == 'Diaria' else 7
+        # Saltar aritméticamente a la primera ocurrencia >= desde
+        n = max(0, -(-(desde - inicio).days // paso))
+        while True:
+            if repeticiones is not None and n >= repeticiones:
+                return
+            fecha = inicio + datetime.timedelta(days=n * paso)
+            if fecha > hasta:
+                return
+            yield fecha
+            n += 1
+
+
+class ModeloAgenda(Observable):
+    """
+    Eventos de la agenda sin dependencias de la interfaz gráfica.
+
+    Cada evento es un diccionario con 'fecha', 'hora', 'descripcion' y 'recurrencia'
+    (None o una regla con 'frecuencia', 'hasta' y 'repeticiones').
+
+    Eventos notificados: 'agregado' (evento), 'eliminado' (evento)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.eventos: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.eventos)
+
+    def agregar(self, fecha: str, hora: str, descripcion: str,
+                recurrencia: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Agrega un evento (o una serie recurrente) y lo devuelve"""
+        evento = {
+            'fecha': fecha,
+            'hora': hora,
+            'descripcion': descripcion,
+            'recurrencia': recurrencia
+        }
+        self.eventos.append(evento)
+        self._notificar('agregado', evento)
+        return evento
+
+    def eliminar(self, evento: Dict[str, Any]) -> bool:
+        """Elimina el evento (o la serie completa). Compara por identidad."""
+        for i, existente in enumerate(self.eventos):
+            if existente is evento:
+                del self.eventos[i]
+                self._notificar('eliminado', evento)
+                return True
+        return False
+
+    @staticmethod
+    def _serie(evento: Dict[str, Any], desde: datetime.date,
+               hasta: datetime.date) -> Iterator[Tuple[datetime.date, str, Dict[str, Any]]]:
+        # Una función propia por serie: cada generador queda ligado a su evento
+        # (un generador dentro de la comprensión leería el último 'evento' del bucle)
+        hora = evento['hora']
+        for fecha in generar_ocurrencias(evento, desde, hasta):
+            yield fecha, hora, evento
+
+    def ocurrencias(self, desde: datetime.date,
+                    hasta: datetime.date) -> Iterator[Tuple[datetime.date, str, Dict[str, Any]]]:
+        """Genera (fecha, hora, evento) ordenados para todos los eventos del rango"""
+        series = [self._serie(evento, desde, hasta) for evento in self.eventos]
+        # Cada serie ya está ordenada por fecha, así que basta con mezclarlas
+        return heapq.merge(*series, key=lambda x: (x[0], x[1]))
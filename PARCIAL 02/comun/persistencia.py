@@ -0,0 +1,153 @@
+import json
+import os
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+
+class ServicioPersistencia:
+    """
+    Servicio que guarda y carga los datos de una aplicación Tkinter sin bloquear la interfaz.
+
+    Los cambios se agrupan (debounce) con root.after: solo cuando pasan retardo_ms sin
+    nuevos cambios se toma una instantánea de los datos en el hilo principal. La escritura
+    en disco la realiza un hilo de trabajo, y los resultados vuelven al hilo de Tk
+    mediante root.after, de modo que la interfaz nunca espera al disco.
+    """
+
+    _FIN = object()  # Marca para detener el hilo de trabajo
+
+    def __init__(self, root, archivo: str, retardo_ms: int = 500, intervalo_sondeo_ms: int = 50,
+                 al_error: Optional[Callable[[Exception], None]] = None):
+        self._root = root
+        self._archivo = archivo
+        self._retardo_ms = retardo_ms
+        self._intervalo_sondeo_ms = intervalo_sondeo_ms
+        self._al_error = al_error or (lambda e: print(f"Error de persistencia: {e}"))
+
+        # Estado que solo se toca desde el hilo principal
+        self._id_guardado: Optional[str] = None
+        self._id_sondeo: Optional[str] = None
+        self._obtener_instantanea: Optional[Callable[[], Any]] = None
+        self._pendientes = 0
+        self._cerrado = False
+
+        # Comunicación con el hilo de trabajo
+        self._trabajos: "queue.Queue[Any]" = queue.Queue()
+        self._resultados: "queue.Queue[Any]" = queue.Queue()
+        self._hilo = threading.Thread(target=self._trabajar, name="persistencia", daemon=True)
+        self._hilo.start()
+
+    # ----- API usada desde el hilo de la interfaz -----
+
+    def cargar(self, al_cargar: Callable[[Any], None]) -> None:
+        """Lee el archivo en segundo plano y entrega los datos a al_cargar en el hilo de Tk"""
+        self._encolar(('cargar', None, al_cargar))
+
+    def programar_guardado(self, obtener_instantanea: Callable[[], Any]) -> None:
+        """
+        Indica que los datos cambiaron. El guardado se retrasa hasta que pasen
+        retardo_ms sin cambios, y entonces se llama a obtener_instantanea(), que debe
+        devolver una copia de los datos (por ejemplo, una lista de dict(tarea)) que la
+        aplicación no vuelva a modificar: la conversión a JSON se hace en el hilo de trabajo.
+        """
+        if self._cerrado:
+            return
+        self._obtener_instantanea = obtener_instantanea
+        if self._id_guardado is not None:
+            self._root.after_cancel(self._id_guardado)
+        self._id_guardado = self._root.after(self._retardo_ms, self._guardar_ahora)
+
+    def cerrar(self) -> None:
+        """Guarda los cambios pendientes y espera a que el hilo de trabajo termine"""
+        if self._cerrado:
+            return
+        if self._id_guardado is not None:
+            self._root.after_cancel(self._id_guardado)
+            self._guardar_ahora()
+        if self._id_sondeo is not None:
+            self._root.after_cancel(self._id_sondeo)
+            self._id_sondeo = None
+        self._cerrado = True
+        self._trabajos.put(self._FIN)
+        self._hilo.join()
+
+    def _guardar_ahora(self) -> None:
+        self._id_guardado = None
+        if self._obtener_instantanea is None:
+            return
+        # La copia se toma en el hilo principal para no compartir estado mutable;
+        # serializarla (lo más costoso con listas grandes) queda para el hilo de trabajo
+        self._encolar(('guardar', self._obtener_instantanea(), None))
+
+    def _encolar(self, trabajo) -> None:
+        self._pendientes += 1
+        self._trabajos.put(trabajo)
+        if self._id_sondeo is None:
+            self._id_sondeo = self._root.after(self._intervalo_sondeo_ms, self._revisar_resultados)
+
+    def _revisar_resultados(self) -> None:
+        """Entrega en el hilo de Tk los resultados producidos por el hilo de trabajo"""
+        self._id_sondeo = None
+        while True:
+            try:
+                callback, valor, error = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            self._pendientes -= 1
+            if error is not None:
+                self._al_error(error)
+            elif callback is not None:
+                callback(valor)
+
+        if self._pendientes > 0:
+            self._id_sondeo = self._root.after(self._intervalo_sondeo_ms, self._revisar_resultados)
+
+    # ----- Hilo de trabajo -----
+
+    def _trabajar(self) -> None:
+        siguiente = None
+        while True:
+            # Un trabajo tomado al agrupar guardados se ejecuta antes que los que siguen en la cola
+            trabajo, siguiente = siguiente or self._trabajos.get(), None
+            if trabajo is self._FIN:
+                return
+
+            # Si se acumularon varios guardados, solo hace falta escribir el último
+            descartados = 0
+            while trabajo[0] == 'guardar':
+                try:
+                    siguiente = self._trabajos.get_nowait()
+                except queue.Empty:
+                    break
+                if siguiente is self._FIN or siguiente[0] != 'guardar':
+                    break
+                trabajo, siguiente = siguiente, None
+                descartados += 1
+            for _ in range(descartados):
+                self._resultados.put((None, None, None))
+
+            tipo, datos, callback = trabajo
+            try:
+                if tipo == 'cargar':
+                    valor = self._leer()
+                else:
+                    self._escribir(datos)
+                    valor = None
+                self._resultados.put((callback, valor, None))
+            except (OSError, TypeError, ValueError) as e:
+                self._resultados.put((callback, None, e))
+
+    def _leer(self) -> Any:
+        if not os.path.exists(self._archivo):
+            return None
+        with open(self._archivo, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _escribir(self, datos: Any) -> None:
+        texto = json.dumps(datos, ensure_ascii=False, indent=2)
+        # Escritura atómica: nunca queda un archivo a medio guardar
+        temporal = self._archivo + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            f.write(texto)
+        os.replace(temporal, self._archivo)